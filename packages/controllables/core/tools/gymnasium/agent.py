@@ -6,11 +6,13 @@ Agent.
 import abc as _abc_
 import contextlib as _contextlib_
 import functools as _functools_
+import threading as _threading_
 import warnings as _warnings_
 from typing import (
     Any,
     Callable,
     Generic, 
+    Literal,
     Optional,
     TypeVar, 
     TypedDict,     
@@ -38,12 +40,148 @@ from ...variables import (
     ComputedVariable,
     MutableCompositeVariable,
     MutableVariable,
+    Nil,
 )
 from ...callbacks import Callback
 from ...refs import ProtoRefManager, Derefable, bounded_deref
 from .spaces import Space, SpaceVariable, MutableSpaceVariable
 
 
+class StalenessMetrics:
+    r"""
+    Staleness metrics.
+    Staleness is measured in number of steps (event occurrences)
+    an action has been held for before being superseded.
+
+    .. doctest::
+
+        >>> metrics = StalenessMetrics()
+        >>> metrics.record(0)
+        >>> metrics.record(2)
+        >>> metrics.count, metrics.last, metrics.max, metrics.mean
+        (2, 2, 2, 1.0)
+
+    """
+
+    def __init__(self):
+        self.count: int = 0
+        r"""Number of staleness samples recorded."""
+        self.total: int = 0
+        r"""Sum of all staleness samples recorded."""
+        self.last: int | None = None
+        r"""The last staleness sample recorded."""
+        self.max: int | None = None
+        r"""The maximum staleness sample recorded."""
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}('
+            f'count={self.count!r}, last={self.last!r}, '
+            f'max={self.max!r}, mean={self.mean!r})'
+        )
+
+    @property
+    def mean(self) -> float | None:
+        r"""The mean staleness."""
+
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def record(self, staleness: int) -> None:
+        r"""
+        Record a staleness sample.
+
+        :param staleness: The staleness, in number of steps.
+        """
+
+        self.count += 1
+        self.total += staleness
+        self.last = staleness
+        self.max = staleness if self.max is None else max(self.max, staleness)
+
+
+class StalenessGate(Component['BaseAgent']):
+    r"""
+    Staleness gate for asynchronous action application.
+
+    Listens to an event source on behalf of an agent.
+    Actions submitted via :meth:`submit` are applied on the 
+    thread of the event source at the next occurrence; 
+    in between, the agent holds its most recent action (zero-order hold).
+    The event source is only blocked when the held action 
+    has become staler than :attr:`staleness` occurrences.
+    """
+
+    def __init__(self, event: Callback, staleness: int):
+        r"""
+        Initialize the gate.
+
+        :param event: The event source.
+        :param staleness: The maximum staleness, in number of occurrences.
+        """
+
+        super().__init__()
+        self.event = event
+        self.staleness = staleness
+        self._cond = _threading_.Condition()
+        self._action = Nil
+        self._age = 0
+        self._detached = False
+        self._n_submitted = 0
+        self._n_applied = 0
+
+    def __attach__(self, parent):
+        super().__attach__(parent)
+        self.event.on(self)
+        return self
+
+    def __detach__(self, parent=None):
+        self.event.off(self)
+        with self._cond:
+            self._detached = True
+            self._cond.notify_all()
+        return super().__detach__(parent)
+    
+    def _apply(self):
+        action, self._action = self._action, Nil
+        try: self.parent.action.value = action
+        finally:
+            self._n_applied = self._n_submitted
+            self._cond.notify_all()
+        self.parent.staleness_metrics.record(self._age)
+        self._age = 0
+
+    def submit(self, action: ActType, wait: bool = True):
+        r"""
+        Submit an action to be applied at the next occurrence.
+        Supersedes any action submitted but not yet applied.
+
+        :param action: The action.
+        :param wait: Whether to block until the action is applied.
+        """
+
+        with self._cond:
+            self._action = action
+            self._n_submitted += 1
+            ticket = self._n_submitted
+            self._cond.notify_all()
+            if wait:
+                self._cond.wait_for(
+                    lambda: self._n_applied >= ticket or self._detached
+                )
+
+    def __call__(self, *args, **kwargs):
+        with self._cond:
+            if self._action is Nil and self._age >= self.staleness:
+                self._cond.wait_for(
+                    lambda: self._action is not Nil or self._detached
+                )
+            if self._action is not Nil:
+                self._apply()
+            self._age += 1
+
+
 class BaseAgent(
     # TODO necesito?
     ProtoRefManager[Any, BaseVariable],
@@ -101,6 +239,40 @@ class BaseAgent(
     truncation: BaseVariable[bool]
     r"""(IMPLEMENT) Truncation variable."""
 
+    staleness: int | None = None
+    r"""
+    (OPTIONAL) Maximum staleness for asynchronous commits.
+
+    .. seealso:: :meth:`commit`
+    """
+
+    @_functools_.cached_property
+    def staleness_metrics(self) -> StalenessMetrics:
+        r"""
+        Actual staleness of the actions committed asynchronously.
+
+        .. seealso:: :meth:`commit`
+        """
+
+        return StalenessMetrics()
+
+    @_functools_.cached_property
+    def _staleness_gates(self) -> dict[int, StalenessGate]:
+        return dict()
+
+    def release(self):
+        r"""
+        Release all event sources held by asynchronous commits.
+        The event sources then keep going with the most recent action.
+
+        .. seealso:: :meth:`commit`
+        """
+
+        for gate in self._staleness_gates.values():
+            gate.__detach__(self)
+        self._staleness_gates.clear()
+        return self
+
     @property
     def system(self) -> BaseSystem | None:
         if self.__parent__ is None:
@@ -177,6 +349,7 @@ class BaseAgent(
         self, 
         action: ActType, 
         event_ref: Callback | Derefable[Callback] | None = None,
+        staleness: int | None = None,
     ):
         r"""
         TODO doc
@@ -194,7 +367,37 @@ class BaseAgent(
             * A reference to a :class:`Callback` object,
                 valid inside the attached :class:`BaseSystem`.
             * ```None```, indicating no event to wait for.
+        :param staleness:
+            Optional. The maximum staleness (in number of event occurrences) 
+            for asynchronous commits; defaults to :attr:`staleness`.
+            If ``None``, the event source is blocked until finalized.
+            Otherwise, the event source is not blocked: 
+            the action is applied at the next occurrence of the event 
+            (which this waits for) and held until superseded; 
+            the event source only blocks once the held action 
+            is staler than this bound.
+            The actual staleness is recorded in :attr:`staleness_metrics`.
+            Call :meth:`release` once done committing asynchronously. 
         """
+
+        if staleness is None:
+            staleness = self.staleness
+
+        if staleness is not None and event_ref is not None:
+            event = bounded_deref(
+                self.system.events, event_ref, 
+                bound=Callback,
+            )
+            gate = self._staleness_gates.get(id(event))
+            if gate is None or gate.staleness != staleness:
+                if gate is not None:
+                    gate.__detach__(self)
+                gate = self._staleness_gates[id(event)] = (
+                    StalenessGate(event, staleness=staleness).attach(self)
+                )
+            gate.submit(action, wait=True)
+            yield
+            return
         
         finalize = None
         try: 
@@ -235,20 +438,119 @@ class BaseAgentManager(
     def active_refs(self):
         r"""
         List of references to all participating agents.
+        Participation is evaluated once per step, i.e. anew by :meth:`collect` 
+        (which environments call once per step), 
+        and reused by any access until then.
+        Call :meth:`invalidate` to evaluate participation anew otherwise.
         """
+
+        res = self.__dict__.get('_active_refs_cache')
+        if res is None:
+            res = self._active_refs_cache = tuple(
+                agent_ref
+                for agent_ref in self.refs
+                if self[agent_ref].participation.value
+            )
+        return res
+
+    def invalidate(self, composites: bool = True):
+        r"""
+        Invalidate the participation (and composites) cached,
+        e.g. after agents are added or replaced.
+
+        :param composites: 
+            Whether to also invalidate the composites of per-agent variables.
+            Composites are otherwise reused for as long as 
+            the participating agents remain the same.
+        """
+
+        self.__dict__.pop('_active_refs_cache', None)
+        if composites:
+            self._composites.clear()
+
+    AgentField = Literal[
+        'participation', 
+        'action', 
+        'observation', 
+        'reward', 
+        'info', 
+        'termination', 
+        'truncation',
+    ]
+    r"""Names of the per-agent variables, as attributes of :class:`BaseAgent`."""
+
+    @_functools_.cached_property
+    def _composites(self) -> dict[str, tuple[tuple, MutableCompositeVariable]]:
+        return dict()
+
+    def __attach__(self, parent):
+        res = super().__attach__(parent)
+        self.invalidate()
+        return res
+
+    def _composite(
+        self, 
+        field: AgentField, 
+        active_refs: tuple[_RefT, ...] | None = None,
+    ) -> MutableCompositeVariable:
+        r"""
+        Get the composite of a per-agent variable over the participating agents.
+        The composite is reused for as long as the participating agents 
+        remain the same.
+
+        :param field: The name of the per-agent variable.
+        :param active_refs: 
+            The references to the participating agents, if already known.
+            Defaults to :attr:`active_refs`.
+        :return: The composite variable.
+        """
+
+        if active_refs is None:
+            active_refs = self.active_refs
+        # NOTE keyed by the agents themselves (compared by identity)
+        # such that agents replaced under the same references are not reused
+        key = tuple((agent_ref, self[agent_ref]) for agent_ref in active_refs)
         
-        return tuple(
-            agent_ref
-            for agent_ref in self.refs
-            if self[agent_ref].participation.value
-        )
+        cached = self._composites.get(field)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        composite = MutableCompositeVariable({
+            agent_ref: getattr(agent, field)
+            for agent_ref, agent in key
+        })
+        self._composites[field] = (key, composite)
+        return composite
+
+    def collect(
+        self, 
+        fields: Iterable[AgentField],
+    ) -> dict[AgentField, dict[_RefT, Any]]:
+        r"""
+        Resolve the values of multiple per-agent variables in one pass.
+        Participation is evaluated only once for all fields.
+
+        :param fields: The names of the per-agent variables.
+        :return: 
+            The values of each variable, keyed by field name 
+            and then by agent reference.
+        """
+
+        # NOTE participation may have changed since the last step
+        self.invalidate(composites=False)
+        active_refs = self.active_refs
+        return {
+            field: {
+                agent_ref: variable.value 
+                for agent_ref, variable in 
+                self._composite(field, active_refs).__variables__.items()
+            }
+            for field in fields
+        }
 
     @property
     def participations(self):        
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].participation
-            for agent_ref in self.active_refs
-        })
+        return self._composite('participation')
     
     @property
     def action_spaces(self):
@@ -266,45 +568,27 @@ class BaseAgentManager(
     
     @property
     def actions(self) -> BaseMutableVariable[dict[_RefT, ActType]]:
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].action
-            for agent_ref in self.active_refs
-        })
+        return self._composite('action')
     
     @property
     def observations(self) -> BaseMutableVariable[dict[_RefT, ObsType]]:
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].observation
-            for agent_ref in self.active_refs
-        })
+        return self._composite('observation')
 
     @property
     def rewards(self) -> BaseMutableVariable[dict[_RefT, float]]:
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].reward
-            for agent_ref in self.active_refs
-        })
+        return self._composite('reward')
 
     @property
     def infos(self) -> BaseMutableVariable[dict[_RefT, dict]]:
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].info
-            for agent_ref in self.active_refs
-        })
+        return self._composite('info')
     
     @property
     def terminations(self) -> BaseMutableVariable[dict[_RefT, bool]]:
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].termination
-            for agent_ref in self.active_refs
-        })
+        return self._composite('termination')
     
     @property
     def truncations(self) -> BaseMutableVariable[dict[_RefT, bool]]:
-        return MutableCompositeVariable({
-            agent_ref: self[agent_ref].truncation
-            for agent_ref in self.active_refs
-        })
+        return self._composite('truncation')
     
 
 class Agent(BaseAgent):
@@ -325,6 +609,7 @@ class Agent(BaseAgent):
         info: Optional['Agent._MaybeComputedVariable[dict]']
         termination: Optional['Agent._MaybeComputedVariable[bool]']
         truncation: Optional['Agent._MaybeComputedVariable[bool]']
+        staleness: Optional[int]
 
     def __init__(self, config: Config = dict(), **config_kwds: Unpack[Config]):
         self.__config__ = self.Config(config, **config_kwds)
@@ -338,6 +623,10 @@ class Agent(BaseAgent):
     @property
     def action_space(self):
         return self.__config__['action_space']
+
+    @property
+    def staleness(self):
+        return self.__config__.get('staleness')
     
     @property
     def observation_space(self):
@@ -434,11 +723,20 @@ class AgentManager(
         return self._data.keys()
 
     def add(self, ref: _RefT, agent: _AgentT):        
+        replaced = self._data.get(ref)
+        if replaced is not None and replaced is not agent:
+            replaced.detach(self)
         self._data[ref] = agent.attach(self)
+        self.invalidate()
         return self
 
+    def __setitem__(self, ref: _RefT, agent: _AgentT):
+        self.add(ref, agent)
+
 
 __all__ = [
+    'StalenessMetrics',
+    'StalenessGate',
     'BaseAgent',
     'BaseAgentManager',
     'Agent',
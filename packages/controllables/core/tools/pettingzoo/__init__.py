@@ -4,12 +4,20 @@ TODO
 
 
 from .env import (
+    BaseAECEnv,
+    AECEnv,
     BaseParallelEnv,
     ParallelEnv,
 )
+from .vector import (
+    VectorParallelEnv,
+)
 
 
 __all__ = [
+    'BaseAECEnv',
+    'AECEnv',
     'BaseParallelEnv',
     'ParallelEnv',
+    'VectorParallelEnv',
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ TODO
 """
 
 
+import collections as _collections_
 import functools as _functools_
 import warnings as _warnings_
 from typing import (
@@ -36,27 +37,248 @@ class _TypedAECEnv(
     pass
 
 
-# TODO
 class BaseAECEnv(_TypedAECEnv, BaseAgentManager):
-    pass
+    r"""
+    PettingZoo-compliant agent-environment-cycle (AEC) environment 
+    for interfacing with :class:`BaseSystem`s.
 
+    One cycle through all participating agents corresponds to 
+    one step (state transition) of the system:
 
-# TODO !!!!!
-class AECEnv(
-    Generic[AgentID, ObsType, ActionType],
-    _pettingzoo_.AECEnv[AgentID, ObsType, ActionType],
-):
+    * Actions submitted via :meth:`step` are buffered and 
+        written to the system in one pass once the cycle completes.
+    * Observations, rewards, terminations, truncations and infos 
+        are read from the system once per cycle and served to 
+        each agent from that snapshot.
+    """
+
+    metadata: dict[str, Any]
+    r"""(IMPLEMENT) TODO"""
+
+    possible_agents: list[AgentID]
+    r"""(IMPLEMENT) TODO"""
+
+    class EventSources(TypedDict):
+        step: Optional[Callback]
+        r"""
+        An event occurrence that corresponds to 
+        a step (state transition) in this environment,
+        i.e. the completion of an agent cycle.
+
+        .. seealso: :attr:`BaseParallelEnv.EventSources.step`
+        """
+
+    event_sources: EventSources
+    r"""(IMPLEMENT) TODO Event sources."""
+
+    @_functools_.cached_property
+    def _cycle(self) -> dict[str, Any]:
+        r"""
+        State of the current agent cycle.
+        """
+
+        return dict(
+            agents=[],
+            pending=_collections_.deque(),
+            removed=set(),
+            observations=dict(),
+            rewards=dict(),
+            cumulative_rewards=dict(),
+            terminations=dict(),
+            truncations=dict(),
+            infos=dict(),
+            actions=dict(),
+        )
+
+    @property
+    def agents(self) -> list[AgentID]:
+        return self._cycle['agents']
+
+    @property
+    def rewards(self) -> dict[AgentID, float]:
+        return self._cycle['rewards']
+
+    @property
+    def _cumulative_rewards(self) -> dict[AgentID, float]:
+        return self._cycle['cumulative_rewards']
+
+    @property
+    def terminations(self) -> dict[AgentID, bool]:
+        return self._cycle['terminations']
+
+    @property
+    def truncations(self) -> dict[AgentID, bool]:
+        return self._cycle['truncations']
+
+    @property
+    def infos(self) -> dict[AgentID, dict[str, Any]]:
+        return self._cycle['infos']
+
+    def observation_space(self, agent):
+        return self[agent].observation_space
+    
+    def action_space(self, agent):
+        return self[agent].action_space
+
+    def _is_done(self, agent) -> bool:
+        return self.terminations[agent] or self.truncations[agent]
+
+    def _observe_cycle(self):
+        r"""
+        Take a snapshot of the system for the next agent cycle.
+        Agents that stopped participating are dropped from the cycle;
+        agents that started participating are added, 
+        unless they have been removed as terminated or truncated
+        since the last reset.
+        """
+
+        cycle = self._cycle
+        res = self.collect((
+            'observation', 
+            'reward', 
+            'termination', 
+            'truncation', 
+            'info',
+        ))
+        if cycle['removed']:
+            res = {
+                field: {
+                    agent: value 
+                    for agent, value in values.items() 
+                    if agent not in cycle['removed']
+                }
+                for field, values in res.items()
+            }
+
+        cycle['agents'][:] = res['observation'].keys()
+        cycle['observations'] = res['observation']
+        for key, field in [
+            ('rewards', 'reward'), 
+            ('terminations', 'termination'), 
+            ('truncations', 'truncation'),
+            ('infos', 'info'),
+        ]:
+            cycle[key].clear()
+            cycle[key].update(res[field])
+        cumulative_rewards = cycle['cumulative_rewards']
+        for agent in list(cumulative_rewards.keys()):
+            if agent not in res['reward']:
+                del cumulative_rewards[agent]
+        for agent in cycle['agents']:
+            cumulative_rewards.setdefault(agent, 0.)
+        cycle['pending'] = _collections_.deque(
+            agent for agent in cycle['agents']
+            if not self._is_done(agent)
+        )
+
+    def _flush_actions(self):
+        r"""
+        Write the buffered actions to the system in one pass
+        and wait for the system to step.
+        """
+
+        actions, self._cycle['actions'] = self._cycle['actions'], dict()
+        self._composite('action', tuple(actions.keys())).value = actions
+
+        finalize = None
+        if (event := self.event_sources.get('step', None)) is not None:
+            finalize = event.wait(deferred=True).ack
+
+        try: self._observe_cycle()
+        finally:
+            if finalize is not None: 
+                finalize()
+
+    def _select(self):
+        r"""
+        Select the next agent: terminated or truncated agents first,
+        then the remaining agents of the cycle in order.
+        """
+
+        for agent in self.agents:
+            if self._is_done(agent):
+                self.agent_selection = agent
+                return
+        pending = self._cycle['pending']
+        self.agent_selection = pending[0] if pending else None
+
+    def _remove(self, agent):
+        for key in (
+            'rewards', 'cumulative_rewards', 
+            'terminations', 'truncations', 'infos',
+        ):
+            del self._cycle[key][agent]
+        self.agents.remove(agent)
+        self._cycle['removed'].add(agent)
+
+    def reset(self, seed=None, options=None):
+        self._cycle['actions'].clear()
+        self._cycle['cumulative_rewards'].clear()
+        self._cycle['removed'].clear()
+        self._observe_cycle()
+        for agent in self.agents:
+            self.rewards[agent] = 0.
+        self._select()
+
+    def observe(self, agent):
+        return self._cycle['observations'].get(agent)
+
+    def step(self, action):
+        r"""
+        Submit the action of the selected agent.
+
+        :param action: The action, or ``None`` for a terminated or truncated agent.
+        :raises RuntimeError: 
+            If no agent is selected, e.g. after all agents are done
+            or before :meth:`reset`.
+        """
+
+        agent = getattr(self, 'agent_selection', None)
+        if agent is None:
+            raise RuntimeError(
+                f'{self!r}: No agent selected; '
+                f'all agents may be done or the environment not reset'
+            )
+        pending = self._cycle['pending']
+
+        if self._is_done(agent):
+            if action is not None:
+                raise ValueError(
+                    'When an agent is dead, the only valid action is None'
+                )
+            self._remove(agent)
+            self._clear_rewards()
+        else:
+            pending.popleft()
+            self._cumulative_rewards[agent] = 0.
+            self._cycle['actions'][agent] = action
+            self._clear_rewards()
+
+        if not pending and self._cycle['actions']:
+            self._flush_actions()
+            self._accumulate_rewards()
+
+        self._select()
+
+
+class AECEnv(BaseAECEnv, AgentManager):
     r"""
     TODO
     """
 
-    def __init__(self):
-        super().__init__()
+    class Config(AgentManager.Config):
+        event_sources: Optional[dict[Literal['step'], Callback]]
 
-    # TODO
-    @_functools_.cached_property
-    def _agent_selector(self):
-        return _pettingzoo_utils_.agent_selector(self.agents)
+    def __init__(self, config: Config = Config(), **kwds: Unpack[Config]):
+        config = self.Config({**config, **kwds})
+        AgentManager.__init__(self, config=config)
+        self.event_sources = self.EventSources(
+            config.pop('event_sources', None) or dict()
+        )
+
+    @property
+    def possible_agents(self):
+        return list(super().refs)
 
 
 class _TypedParallelEnv(
@@ -150,12 +372,19 @@ class BaseParallelEnv(_TypedParallelEnv, BaseAgentManager):
             finalize = event.wait(deferred=True).ack
 
         try:
+            res = self.collect((
+                'observation', 
+                'reward', 
+                'termination', # TODO when?
+                'truncation', 
+                'info',
+            ))
             res = self.StepResult(
-                observations=self.observations.value,
-                rewards=self.rewards.value,
-                terminations=self.terminations.value, # TODO when?
-                truncations=self.truncations.value,
-                infos=self.infos.value,
+                observations=res['observation'],
+                rewards=res['reward'],
+                terminations=res['termination'],
+                truncations=res['truncation'],
+                infos=res['info'],
             )
         except Exception as e:
             raise e
@@ -165,9 +394,10 @@ class BaseParallelEnv(_TypedParallelEnv, BaseAgentManager):
         return res
 
     def reset(self, *, seed=None, options=None):
+        res = self.collect(('observation', 'info'))
         return self.ResetResult(
-            observations=self.observations.value,
-            infos=self.infos.value,
+            observations=res['observation'],
+            infos=res['info'],
         )
     
     
@@ -193,6 +423,8 @@ class ParallelEnv(BaseParallelEnv, AgentManager):
 
 
 __all__ = [
+    'BaseAECEnv',
+    'AECEnv',
     'BaseParallelEnv',
     'ParallelEnv',
 ]
\ No newline at end of file
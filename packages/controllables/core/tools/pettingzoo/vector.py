@@ -0,0 +1,345 @@
+r"""
+Vectorized environments.
+
+Scope: Multi-agent environments spanning multiple systems,
+one process per system.
+"""
+
+
+import copy as _copy_
+import multiprocessing as _multiprocessing_
+import multiprocessing.connection as _multiprocessing_connection_
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Mapping,
+    TypeVar,
+)
+
+from ...errors import OptionalModuleNotFoundError
+try:
+    from pettingzoo.utils.env import AgentID
+except ModuleNotFoundError as e:
+    raise OptionalModuleNotFoundError.suggest(['pettingzoo']) from e
+
+from .env import _TypedParallelEnv, BaseParallelEnv
+
+
+SystemID = TypeVar('SystemID', bound=Hashable)
+
+
+def _unbound(space):
+    r"""
+    Copy a space without its bound references (recursively),
+    such that it can be sent to other processes.
+    """
+
+    space = _copy_.copy(space)
+    space.__dict__.pop('__ref__', None)
+    spaces = getattr(space, 'spaces', None)
+    if isinstance(spaces, Mapping):
+        space.spaces = type(spaces)(
+            (k, _unbound(s)) for k, s in spaces.items()
+        )
+    elif isinstance(spaces, tuple):
+        space.spaces = tuple(_unbound(s) for s in spaces)
+    return space
+
+
+def _worker(
+    conn: _multiprocessing_connection_.Connection,
+    env_fn: Callable[[], BaseParallelEnv],
+):
+    r"""
+    Worker process loop serving one environment.
+    Each command is answered with a tuple of ``(ok, payload)``.
+    """
+
+    env = None
+    try:
+        env = env_fn()
+        conn.send((True, {
+            agent: (
+                _unbound(env.observation_space(agent)),
+                _unbound(env.action_space(agent)),
+            )
+            for agent in env.possible_agents
+        }))
+    except Exception as e:
+        conn.send((False, e))
+        conn.close()
+        return
+
+    while True:
+        try:
+            command, data = conn.recv()
+        except EOFError:
+            break
+        try:
+            match command:
+                case 'reset':
+                    finalize = None
+                    if not env.parent.started:
+                        env.parent.start()
+                        # NOTE wait for the first step as in `BaseParallelEnv.step`,
+                        # such that the variables are available to `reset`
+                        event = env.event_sources.get('step', None)
+                        if event is not None:
+                            finalize = event.wait(deferred=True).ack
+                    try: res = tuple(env.reset(**data))
+                    finally:
+                        if finalize is not None:
+                            finalize()
+                case 'step':
+                    res = tuple(env.step(data))
+                case 'close':
+                    if env.parent.started:
+                        env.parent.stop()
+                    conn.send((True, None))
+                    break
+                case _:
+                    raise ValueError(f'Unknown command: {command}')
+        except Exception as e:
+            conn.send((False, e))
+            continue
+        conn.send((True, res))
+    conn.close()
+
+
+class VectorParallelEnv(_TypedParallelEnv):
+    r"""
+    Vectorized parallel environment
+    for interfacing with a fleet of :class:`BaseSystem`s.
+
+    Each system, along with its :class:`BaseParallelEnv`,
+    lives in a separate process.
+    Agents are namespaced by system, i.e.
+    the agent ``agent`` of system ``system``
+    is exposed as ``(system, agent)``.
+    Calls to :meth:`step` and :meth:`reset` are sent
+    to all systems before any result is awaited,
+    so the systems step concurrently.
+
+    .. code-block:: python
+
+        def make_env(building):
+            def env_fn():
+                system = System(building=building, ...)
+                return ParallelEnv(...).attach(system)
+            return env_fn
+
+        env = VectorParallelEnv({
+            'library': make_env('library.idf'),
+            'gym': make_env('gym.idf'),
+        })
+        observations, infos = env.reset()
+        # observations = {('library', 'zone-1'): ..., ('gym', 'zone-1'): ...}
+
+    .. note::
+        The environment factories are called in the worker processes
+        and hence must be picklable under the multiprocessing start method.
+        Systems are started upon (before) the first :meth:`reset`
+        and stopped upon :meth:`close`.
+    """
+
+    metadata: dict[str, Any] = dict()
+
+    def __init__(
+        self,
+        env_fns: Mapping[SystemID, Callable[[], BaseParallelEnv]],
+        context: str | None = None,
+    ):
+        r"""
+        Initialize the vectorized environment.
+
+        :param env_fns:
+            Mapping of system IDs to environment factories.
+            Each factory shall return a :class:`BaseParallelEnv`
+            attached to a (not yet started) :class:`BaseSystem`.
+        :param context:
+            The multiprocessing start method, e.g. ``'spawn'``.
+            If ``None``, the platform default is used.
+        """
+
+        ctx = _multiprocessing_.get_context(context)
+        self._conns: dict[SystemID, _multiprocessing_connection_.Connection] = dict()
+        self._processes: dict[SystemID, _multiprocessing_.Process] = dict()
+        for system_id, env_fn in env_fns.items():
+            conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                args=(child_conn, env_fn),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns[system_id] = conn
+            self._processes[system_id] = process
+
+        self._spaces: dict[tuple[SystemID, AgentID], tuple] = {
+            (system_id, agent): spaces
+            for system_id, res in self._gather(self._conns.keys()).items()
+            for agent, spaces in res.items()
+        }
+        self.possible_agents = list(self._spaces.keys())
+        self.agents = list(self.possible_agents)
+
+    def _worker_error(self, system_id: SystemID) -> RuntimeError:
+        process = self._processes[system_id]
+        process.join(timeout=1.)
+        return RuntimeError(
+            f'Worker process of system {system_id!r} exited unexpectedly '
+            f'(exit code {process.exitcode!r})'
+        )
+
+    def _gather(self, system_ids) -> dict[SystemID, Any]:
+        r"""
+        Receive one reply from each of the systems.
+
+        :raises RuntimeError: If the worker process of a system exited.
+        :raises Exception: The first error raised by any of the workers,
+            after all replies have been received.
+        """
+
+        res, errors = dict(), []
+        for system_id in system_ids:
+            try: ok, payload = self._conns[system_id].recv()
+            except (EOFError, OSError) as e:
+                ok, payload = False, self._worker_error(system_id)
+                payload.__cause__ = e
+            if ok: res[system_id] = payload
+            else: errors.append(payload)
+        if errors:
+            raise errors[0]
+        return res
+
+    def _scatter(self, command: str, data: Mapping[SystemID, Any]):
+        r"""
+        Send one command to each of the systems and receive their replies.
+
+        :raises RuntimeError: If the worker process of a system exited.
+        :raises Exception: The first error raised by any of the workers,
+            after all replies have been received.
+        """
+
+        sent = []
+        for system_id, d in data.items():
+            try: self._conns[system_id].send((command, d))
+            except OSError as e:
+                # NOTE receive the replies owed by the workers sent to so far,
+                # such that their pipes stay in sync
+                try: self._gather(sent)
+                except Exception:
+                    pass
+                raise self._worker_error(system_id) from e
+            sent.append(system_id)
+        return self._gather(sent)
+
+    @staticmethod
+    def _merge(res: Mapping[SystemID, tuple]) -> tuple[dict, ...]:
+        r"""
+        Merge per-system tuples of agent-keyed dicts
+        into tuples of namespaced dicts.
+        """
+
+        merged = None
+        for system_id, fields in res.items():
+            if merged is None:
+                merged = tuple(dict() for _ in fields)
+            for m, field in zip(merged, fields):
+                m.update(
+                    ((system_id, agent), value)
+                    for agent, value in field.items()
+                )
+        return merged or tuple()
+
+    def observation_space(self, agent):
+        return self._spaces[agent][0]
+
+    def action_space(self, agent):
+        return self._spaces[agent][1]
+
+    def reset(self, seed=None, options=None):
+        res = self._scatter('reset', {
+            system_id: dict(
+                seed=None if seed is None else seed + i,
+                options=options,
+            )
+            for i, system_id in enumerate(self._conns.keys())
+        })
+        observations, infos = self._merge(res) or (dict(), dict())
+        self.agents = list(observations.keys())
+        return self.ResetResult(observations=observations, infos=infos)
+
+    def step(self, actions):
+        # NOTE systems whose agents are all done are not stepped,
+        # as their step events may never fire again
+        live = {system_id for system_id, _ in self.agents}
+        actions_by_system = {
+            system_id: dict() for system_id in self._conns
+            if system_id in live
+        }
+        for (system_id, agent), action in actions.items():
+            if system_id in actions_by_system:
+                actions_by_system[system_id][agent] = action
+        res = self.StepResult(*(
+            self._merge(self._scatter('step', actions_by_system))
+            or (dict(), ) * 5
+        ))
+        self.agents = [
+            agent for agent in self.agents
+            if not (
+                res.terminations.get(agent, False)
+                or res.truncations.get(agent, False)
+            )
+        ]
+        return res
+
+    def close(self, timeout: float | None = 10.):
+        r"""
+        Close the environment, stopping the systems
+        and joining the worker processes.
+
+        :param timeout:
+            The time (in seconds) to wait for each worker process
+            to stop its system and exit, after which it is terminated.
+            If ``None``, wait indefinitely.
+        :raises Exception: The first error raised by any of the workers
+            upon stopping their systems.
+        """
+
+        system_ids = [
+            system_id for system_id, process in self._processes.items()
+            if process.is_alive()
+        ]
+        errors = []
+        try:
+            for system_id in system_ids:
+                try: self._conns[system_id].send(('close', None))
+                except OSError:
+                    pass
+            for system_id in system_ids:
+                conn = self._conns[system_id]
+                try:
+                    if not conn.poll(timeout):
+                        continue
+                    ok, payload = conn.recv()
+                except (EOFError, OSError):
+                    continue
+                if not ok: errors.append(payload)
+        finally:
+            for conn in self._conns.values():
+                conn.close()
+            for process in self._processes.values():
+                process.join(timeout=timeout)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+        if errors:
+            raise errors[0]
+
+
+__all__ = [
+    'VectorParallelEnv',
+]
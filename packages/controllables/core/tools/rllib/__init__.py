@@ -7,9 +7,13 @@ from .env import (
     Env,
     MultiAgentEnv,
 )
+from .inference import (
+    BatchedInference,
+)
 
 
 __all__ = [
     'Env',
     'MultiAgentEnv',
+    'BatchedInference',
 ]
\ No newline at end of file
@@ -4,9 +4,10 @@ Environment.
 
 
 import abc as _abc_
+import concurrent.futures as _concurrent_futures_
 import functools as _functools_
 import warnings as _warnings_
-from typing import Literal, NamedTuple, Optional, TypedDict, Unpack
+from typing import Any, Literal, NamedTuple, Optional, TypedDict, Unpack
 
 try: 
     from ray.rllib.env import ExternalEnv, ExternalMultiAgentEnv
@@ -14,7 +15,8 @@ except ModuleNotFoundError as e:
     from ...errors import OptionalModuleNotFoundError
     raise OptionalModuleNotFoundError.suggest(['ray[rllib]']) from e
 
-from ..gymnasium.agent import Agent, AgentManager
+from ..gymnasium.agent import Agent, AgentManager, StalenessMetrics
+from .inference import BatchedInference
 from ...callbacks import Callback, CallbackManager
 from ...components import Component
 from ...errors import TemporaryUnavailableError
@@ -57,6 +59,52 @@ class _EnvHelperMixin(
 
         ...
 
+    @_abc_.abstractmethod
+    def _observe_step(self, off_policy: bool = False) -> Any:
+        r"""
+        (IMPLEMENT) Take a snapshot of everything a step needs from the system.
+        This is called on the thread of the system.
+
+        :param off_policy: Whether to perform this operation off-policy.
+        :return: The snapshot.
+        :throws TemporaryUnavailableError: 
+            If the operation is temporarily unavailable.
+        """
+
+        ...
+
+    @_abc_.abstractmethod
+    def _compute_step(
+        self, 
+        episode_id: str, 
+        snapshot: Any, 
+        off_policy: bool = False,
+    ) -> Any:
+        r"""
+        (IMPLEMENT) Log the snapshot taken by :meth:`_observe_step`
+        and, unless off-policy, obtain the next action.
+        This does not access the system and hence may be called 
+        from any thread.
+
+        :param episode_id: The episode ID.
+        :param snapshot: The snapshot.
+        :param off_policy: Whether to perform this operation off-policy.
+        :return: The next action, or ``None`` if there is none to perform.
+        """
+
+        ...
+
+    @_abc_.abstractmethod
+    def _apply_step(self, action: Any) -> None:
+        r"""
+        (IMPLEMENT) Perform an action obtained by :meth:`_compute_step`.
+        This is called on the thread of the system.
+
+        :param action: The action, or ``None``.
+        """
+
+        ...
+
     class EpisodeScheduler(Component['_EnvHelperMixin']):
         class ErrorSpec(NamedTuple):
             stage: Literal['begin', 'step', 'end']
@@ -76,6 +124,18 @@ class _EnvHelperMixin(
             end: Optional[Callback | Derefable[Callback]]
             off_policy: Optional[bool]
             errors: Optional[Literal['raise', 'warn'] | Callback]
+            staleness: Optional[int]
+            r"""
+            Maximum staleness (in number of steps) for asynchronous stepping.
+            If ``None`` (default), each step blocks the system until 
+            the next action has been obtained and performed.
+            Otherwise, actions are obtained in a separate thread 
+            while the system keeps going with the most recent action 
+            (zero-order hold); the system only blocks once the pending
+            action is staler than this bound.
+            The actual staleness is recorded in 
+            :attr:`EpisodeScheduler.staleness_metrics`.
+            """
 
         def __init__(
             self, 
@@ -116,6 +176,34 @@ class _EnvHelperMixin(
         def system(self):
             return self.parent.parent
 
+        @_functools_.cached_property
+        def staleness_metrics(self) -> StalenessMetrics:
+            r"""
+            Actual staleness of the actions performed asynchronously.
+
+            .. seealso:: :attr:`Config.staleness`
+            """
+
+            return StalenessMetrics()
+
+        @_functools_.cached_property
+        def _executor(self):
+            return _concurrent_futures_.ThreadPoolExecutor(max_workers=1)
+
+        def close(self):
+            r"""
+            Shut down the thread obtaining actions asynchronously, if any,
+            after the pending action (if any) has been obtained.
+            """
+
+            executor = self.__dict__.pop('_executor', None)
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        def __detach__(self, parent=None):
+            self.close()
+            return super().__detach__(parent)
+
         def setup(self):
             def _callback_of(o):
                 return bounded_deref(self.system.events, o, bound=Callback)
@@ -137,15 +225,54 @@ class _EnvHelperMixin(
                         self.ErrorSpec('begin', self.episode_id, e)
                     )
 
+            # asynchronous stepping: (step issued at, future of the action)
+            pending: tuple[int, _concurrent_futures_.Future] | None = None
+            n_steps = 0
+
+            def _settle(wait: bool):
+                nonlocal pending
+                if pending is None:
+                    return
+                issued_at, future = pending
+                if not wait and not future.done():
+                    return
+                pending = None
+                action = future.result()
+                self.parent._apply_step(action)
+                self.staleness_metrics.record(n_steps - issued_at)
+
+            def _step_async(episode_id, off_policy):
+                nonlocal pending, n_steps
+                staleness = self.config['staleness']
+                _settle(wait=pending is not None and (
+                    n_steps - pending[0] >= staleness
+                ))
+                if pending is None:
+                    pending = (n_steps, self._executor.submit(
+                        self.parent._compute_step,
+                        episode_id, 
+                        self.parent._observe_step(off_policy=off_policy),
+                        off_policy=off_policy,
+                    ))
+                    _settle(wait=staleness <= 0)
+                n_steps += 1
+
             if self.config.get('step') is not None:
                 @_callback_of(self.config['step']).on
                 def _(*args, **kwargs):
                     if curr_episode_id is None:
                         return
-                    try: self.parent.step_episode(
-                        curr_episode_id,
-                        off_policy=self.config.get('off_policy', False),
-                    )
+                    try: 
+                        if self.config.get('staleness') is None:
+                            self.parent.step_episode(
+                                curr_episode_id,
+                                off_policy=self.config.get('off_policy', False),
+                            )
+                        else: 
+                            _step_async(
+                                curr_episode_id, 
+                                off_policy=self.config.get('off_policy', False),
+                            )
                     except TemporaryUnavailableError:
                         pass
                     except Exception as e: self.events['error'](
@@ -155,9 +282,13 @@ class _EnvHelperMixin(
             if self.config.get('end') is not None:
                 @_callback_of(self.config['end']).on
                 def _(*args, **kwargs):
-                    nonlocal curr_episode_id
+                    nonlocal curr_episode_id, pending
                     if curr_episode_id is None:
                         return
+                    if pending is not None:
+                        # the action would be performed after the episode ends
+                        _concurrent_futures_.wait([pending[1]])
+                        pending = None
                     try: self.parent.end_episode(curr_episode_id)
                     except Exception as e: self.events['error'](
                         self.ErrorSpec('end', curr_episode_id, e)
@@ -233,7 +364,13 @@ class Env(
     _abc_.ABC,
 ):
     class Config(Agent.Config):
-        pass
+        inference: Optional[BatchedInference]
+        r"""
+        Batched inference shared with other environments.
+        If provided, on-policy actions are computed through it 
+        and logged via :meth:`log_action`, 
+        instead of being requested via :meth:`get_action`.
+        """
 
     @_functools_.cached_property
     def agent(self):
@@ -287,10 +424,13 @@ class Env(
         )
     
     def start_episode(self, episode_id=None, training_enabled=True):
-        return super().start_episode(
+        res = super().start_episode(
             episode_id=episode_id, 
             training_enabled=training_enabled,
         )
+        if self.config.get('inference') is not None:
+            self.config['inference'].register()
+        return res
     
     def _get_latest_observation(self, episode_id):
         try: return self.agent.observation.value 
@@ -306,17 +446,60 @@ class Env(
     def end_episode(self, episode_id, observation=None):
         if observation is None:
             observation = self._get_latest_observation(episode_id)
+        if self.config.get('inference') is not None:
+            self.config['inference'].unregister()
         return super().end_episode(
             episode_id, 
             observation=observation,
         )
     
-    def step_episode(self, episode_id, off_policy=False):
-        self.log_returns(episode_id)
+    def _observe_step(self, off_policy=False):
+        return dict(
+            observation=self.agent.observation.value,
+            reward=self.agent.reward.value,
+            info=self.agent.info.value,
+            action=self.agent.action.value if off_policy else None,
+        )
+
+    def _compute_step(self, episode_id, snapshot, off_policy=False):
+        self.log_returns(
+            episode_id, 
+            reward=snapshot['reward'], 
+            info=snapshot['info'],
+        )
         if off_policy:
-            self.log_action(episode_id)
-        else:
-            self.agent.action.value = self.get_action(episode_id)
+            self.log_action(
+                episode_id, 
+                observation=snapshot['observation'], 
+                action=snapshot['action'],
+            )
+            return None
+        if self.config.get('inference') is not None:
+            action = self.config['inference'].compute_action(
+                snapshot['observation']
+            )
+            self.log_action(
+                episode_id, 
+                observation=snapshot['observation'], 
+                action=action,
+            )
+            return action
+        return self.get_action(
+            episode_id, 
+            observation=snapshot['observation'],
+        )
+
+    def _apply_step(self, action):
+        if action is None:
+            return
+        self.agent.action.value = action
+    
+    def step_episode(self, episode_id, off_policy=False):
+        self._apply_step(self._compute_step(
+            episode_id, 
+            self._observe_step(off_policy=off_policy), 
+            off_policy=off_policy,
+        ))
 
 
 class MultiAgentEnv(
@@ -326,7 +509,13 @@ class MultiAgentEnv(
     _abc_.ABC,
 ):
     class Config(AgentManager.Config):
-        pass
+        inference: Optional[BatchedInference]
+        r"""
+        Batched inference shared with other environments.
+        Observations of all active agents are submitted as one request.
+
+        .. seealso:: :attr:`Env.Config.inference`
+        """
 
     @_functools_.cached_property
     def agents(self):
@@ -392,10 +581,13 @@ class MultiAgentEnv(
         )
 
     def start_episode(self, episode_id=None, training_enabled=True):
-        return super().start_episode(
+        res = super().start_episode(
             episode_id=episode_id, 
             training_enabled=training_enabled,
         )
+        if self.config.get('inference') is not None:
+            self.config['inference'].register()
+        return res
     
     def _get_latest_observation(self, episode_id):
         try: return self.agents.observations.value
@@ -411,17 +603,68 @@ class MultiAgentEnv(
     def end_episode(self, episode_id, observation_dict=None):
         if observation_dict is None:
             observation_dict = self._get_latest_observation(episode_id)
+        if self.config.get('inference') is not None:
+            self.config['inference'].unregister()
         return super().end_episode(
             episode_id, 
             observation_dict=observation_dict,
         )
 
-    def step_episode(self, episode_id: str, off_policy: bool = False):
-        self.log_returns(episode_id)
+    def _observe_step(self, off_policy=False):
+        res = self.agents.collect((
+            'observation', 'reward', 'info', 
+            *(('action', ) if off_policy else ()),
+        ))
+        return dict(
+            observation_dict=res['observation'],
+            reward_dict=res['reward'],
+            info_dict=res['info'],
+            action_dict=res.get('action'),
+        )
+
+    def _compute_step(self, episode_id, snapshot, off_policy=False):
+        self.log_returns(
+            episode_id, 
+            reward_dict=snapshot['reward_dict'], 
+            info_dict=snapshot['info_dict'],
+        )
         if off_policy:
-            self.log_action(episode_id)
-        else:
-            self.agents.actions.value = self.get_action(episode_id)
+            self.log_action(
+                episode_id, 
+                observation_dict=snapshot['observation_dict'], 
+                action_dict=snapshot['action_dict'],
+            )
+            return None
+        if self.config.get('inference') is not None:
+            observation_dict = snapshot['observation_dict']
+            action_dict = dict(zip(
+                observation_dict.keys(),
+                self.config['inference'].compute_actions(
+                    observation_dict.values()
+                ),
+            ))
+            self.log_action(
+                episode_id, 
+                observation_dict=observation_dict, 
+                action_dict=action_dict,
+            )
+            return action_dict
+        return self.get_action(
+            episode_id, 
+            observation_dict=snapshot['observation_dict'],
+        )
+
+    def _apply_step(self, action_dict):
+        if action_dict is None:
+            return
+        self.agents.actions.value = action_dict
+
+    def step_episode(self, episode_id: str, off_policy: bool = False):
+        self._apply_step(self._compute_step(
+            episode_id, 
+            self._observe_step(off_policy=off_policy), 
+            off_policy=off_policy,
+        ))
 
 
 __all__ = [
@@ -0,0 +1,224 @@
+r"""
+Inference.
+
+Scope: Batched action computation shared by multiple environments.
+"""
+
+
+import concurrent.futures as _concurrent_futures_
+import threading as _threading_
+from typing import Any, Callable, NamedTuple, Protocol, Sequence
+
+try:
+    from ray.rllib.utils.spaces.space_utils import (
+        batch as _batch_,
+        unbatch as _unbatch_,
+    )
+except ModuleNotFoundError as e:
+    from ...errors import OptionalModuleNotFoundError
+    raise OptionalModuleNotFoundError.suggest(['ray[rllib]']) from e
+
+
+class ProtoPolicy(Protocol):
+    r"""
+    Policy protocol class.
+    Any object exposing :meth:`compute_actions` in the style of
+    :meth:`ray.rllib.policy.Policy.compute_actions` conforms,
+    e.g. the local policy of a :class:`ray.rllib.env.PolicyClient`
+    created with ``inference_mode='local'``.
+    """
+
+    def compute_actions(self, obs_batch: Any, *args, **kwargs) -> tuple:
+        ...
+
+
+class BatchedInference:
+    r"""
+    Batched inference.
+
+    Aggregates action requests from multiple concurrently
+    running environments (typically one per :class:`BaseSystem`)
+    into a single batched call to the policy.
+    A batch is dispatched as soon as every registered participant
+    has submitted a request, when :attr:`max_batch_size` is reached,
+    or when a pending request has waited for longer than :attr:`timeout`.
+    The dispatch happens in the thread of the request that completes the batch;
+    no additional threads are created.
+
+    .. doctest::
+
+        >>> inference = BatchedInference(lambda obs: [o * 2 for o in obs])
+        >>> inference.compute_actions([1, 2])
+        [2, 4]
+
+    .. seealso::
+        * :class:`ray.rllib.env.PolicyClient`
+        * :class:`ray.rllib.env.PolicyServerInput`
+    """
+
+    class _Request(NamedTuple):
+        observations: Sequence[Any]
+        future: _concurrent_futures_.Future
+
+    def __init__(
+        self,
+        policy: ProtoPolicy | Callable[[Sequence[Any]], Sequence[Any]],
+        max_batch_size: int | None = None,
+        timeout: float | None = .1,
+    ):
+        r"""
+        Initialize the batched inference.
+
+        :param policy:
+            The policy to compute actions with.
+            This can be either:
+            * A :class:`ProtoPolicy`, e.g. :class:`ray.rllib.policy.Policy`;
+                observations are batched with
+                :func:`ray.rllib.utils.spaces.space_utils.batch` before
+                being passed to :meth:`ProtoPolicy.compute_actions`.
+            * A :class:`callable` mapping a sequence of observations
+                to a sequence of actions of the same length.
+        :param max_batch_size:
+            The maximum number of observations per batch.
+            If ``None``, batches are bounded by the number of participants only.
+        :param timeout:
+            The maximum time (seconds) a request waits for the batch
+            to fill up before it is dispatched partially.
+            If ``None``, waits indefinitely.
+        """
+
+        self.policy = policy
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._lock = _threading_.Lock()
+        self._pending: list[BatchedInference._Request] = []
+        self._participants = 0
+
+    def register(self):
+        r"""
+        Register a participant.
+        Batches are expected to contain one request per participant.
+
+        :return: This object.
+        """
+
+        with self._lock:
+            self._participants += 1
+        return self
+
+    def unregister(self):
+        r"""
+        Unregister a participant.
+        Pending requests that no longer need to wait are dispatched.
+
+        :return: This object.
+        """
+
+        with self._lock:
+            self._participants = max(self._participants - 1, 0)
+            batch = self._take_batch(force=False)
+        if batch:
+            self._dispatch(batch)
+        return self
+
+    def _take_batch(self, force: bool):
+        r"""
+        Take the pending requests if they are due.
+        The caller shall hold :attr:`_lock`.
+        """
+
+        if not self._pending:
+            return []
+
+        n_observations = sum(len(r.observations) for r in self._pending)
+        due = (
+            force
+            or len(self._pending) >= self._participants
+            or (
+                self.max_batch_size is not None
+                and n_observations >= self.max_batch_size
+            )
+        )
+        if not due:
+            return []
+
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _compute(self, observations: list) -> list:
+        if hasattr(self.policy, 'compute_actions'):
+            actions, *_ = self.policy.compute_actions(_batch_(observations))
+            return _unbatch_(actions)
+        return list(self.policy(observations))
+
+    def _dispatch(self, batch: list[_Request]):
+        observations = [o for r in batch for o in r.observations]
+        try:
+            actions = self._compute(observations)
+            if len(actions) != len(observations):
+                raise ValueError(
+                    f'{self.policy!r}: Expected {len(observations)} actions, '
+                    f'got {len(actions)}'
+                )
+        except Exception as e:
+            for r in batch:
+                r.future.set_exception(e)
+            return
+
+        offset = 0
+        for r in batch:
+            r.future.set_result(
+                actions[offset:offset + len(r.observations)]
+            )
+            offset += len(r.observations)
+
+    def compute_actions(self, observations: Sequence[Any]) -> list:
+        r"""
+        Compute actions for the observations as part of a batch.
+        This blocks until the batch containing this request is dispatched.
+
+        :param observations: The observations.
+        :return: The actions, in the order of ``observations``.
+        """
+
+        request = self._Request(
+            observations=list(observations),
+            future=_concurrent_futures_.Future(),
+        )
+
+        with self._lock:
+            self._pending.append(request)
+            batch = self._take_batch(force=False)
+        if batch:
+            self._dispatch(batch)
+
+        try:
+            return request.future.result(timeout=self.timeout)
+        except _concurrent_futures_.TimeoutError:
+            pass
+
+        with self._lock:
+            batch = (
+                self._take_batch(force=True)
+                if any(r is request for r in self._pending) else
+                []
+            )
+        if batch:
+            self._dispatch(batch)
+        return request.future.result()
+
+    def compute_action(self, observation: Any) -> Any:
+        r"""
+        Compute the action for a single observation as part of a batch.
+
+        .. seealso:: :meth:`compute_actions`
+        """
+
+        action, = self.compute_actions([observation])
+        return action
+
+
+__all__ = [
+    'ProtoPolicy',
+    'BatchedInference',
+]
@@ -266,6 +266,7 @@ class VariableUtilOpsMixin(ProtoVariable):
         if not isinstance(predicate, Callable):
             def predicate(val):
                 return val == predicate_or_match
+            predicate.__match__ = predicate_or_match
 
         conditional = Conditional(predicate=predicate)
         conditional.__attach__(self)
@@ -455,6 +456,7 @@ class ComputedVariable(
         *args: _ParamT.args, 
         **kwargs: _ParamT.kwargs,
     ):
+        @_functools_.wraps(operator)
         def operator_(*args, **kwargs):
             return operator(
                 *(valueof(o) for o in args), 
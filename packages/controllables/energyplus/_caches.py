@@ -0,0 +1,74 @@
+r"""
+Caches.
+
+Scope: On-disk caches of results derived from building models
+(e.g. catalogs and preflight results).
+"""
+
+
+import functools as _functools_
+import importlib.metadata as _importlib_metadata_
+import os as _os_
+import tempfile as _tempfile_
+
+
+@_functools_.cache
+def kernel_version() -> str | None:
+    r"""
+    Get the version of the installed kernel (`energyplus-core`).
+    Results derived from running the kernel shall be cached by this version.
+
+    :return: The version, or `None` if not installed.
+    """
+
+    try: return _importlib_metadata_.version('energyplus-core')
+    except _importlib_metadata_.PackageNotFoundError:
+        return None
+
+
+def default_dir(name: str) -> str:
+    r"""
+    Get the default directory of a cache,
+    under `$XDG_CACHE_HOME` (or `~/.cache`).
+
+    :param name: The name of the cache, e.g. `'catalogs'`.
+    :return: The path of the directory.
+    """
+
+    return _os_.path.join(
+        _os_.environ.get('XDG_CACHE_HOME')
+        or _os_.path.join(_os_.path.expanduser('~'), '.cache'),
+        'controllables', 'energyplus', name,
+    )
+
+
+def write(path: _os_.PathLike, data: str):
+    r"""
+    Write a cache file atomically,
+    i.e. concurrent readers (and writers) never see partial contents.
+    Missing parent directories are created.
+
+    :param path: The path of the file.
+    :param data: The contents.
+    :raises OSError: If the file cannot be written.
+    """
+
+    dir = _os_.path.dirname(path)
+    _os_.makedirs(dir, exist_ok=True)
+    fd, tmp_path = _tempfile_.mkstemp(dir=dir, suffix='.tmp')
+    try:
+        with _os_.fdopen(fd, mode='w') as fp:
+            fp.write(data)
+        _os_.replace(tmp_path, path)
+    except OSError:
+        try: _os_.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+__all__ = [
+    'kernel_version',
+    'default_dir',
+    'write',
+]
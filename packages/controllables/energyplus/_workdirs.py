@@ -0,0 +1,209 @@
+r"""
+Working directories.
+
+Scope: Pooled temporary directories for kernel inputs and outputs.
+"""
+
+
+import contextlib as _contextlib_
+import multiprocessing.util as _multiprocessing_util_
+import os as _os_
+import shutil as _shutil_
+import tempfile as _tempfile_
+import threading as _threading_
+
+
+TMPFS_DIR = '/dev/shm'
+r"""The preferred parent directory of working directories, if available."""
+
+
+def default_root() -> str | None:
+    r"""
+    Get the default parent directory of working directories.
+
+    :return:
+        :data:`TMPFS_DIR` if it exists and is writable,
+        otherwise `None` (i.e. the platform temporary directory).
+    """
+
+    if _os_.path.isdir(TMPFS_DIR) and _os_.access(TMPFS_DIR, _os_.W_OK):
+        return TMPFS_DIR
+    return None
+
+
+def _empty_dir(path: str):
+    r"""
+    Remove the contents of a directory, but not the directory itself.
+
+    :raises OSError: If any of the contents cannot be removed.
+    """
+
+    with _os_.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _shutil_.rmtree(entry.path)
+            else:
+                _os_.unlink(entry.path)
+
+
+class WorkingDirectoryPool:
+    r"""
+    Pool of temporary working directories.
+
+    Directories are created on demand, returned to the pool
+    once released and handed out again on subsequent acquisitions,
+    so that repeated runs do not create (and leak) a new directory each.
+    Contents of a directory are removed when it is released,
+    such that no stale files are passed on to the next user
+    (nor held in memory on tmpfs).
+    At most :attr:`max_free` released directories are kept for reuse;
+    others are removed.
+    All directories of the pool are removed on :meth:`clear`,
+    which is called at the exit of the (main or worker) process.
+
+    .. doctest::
+
+        >>> pool = WorkingDirectoryPool()
+        >>> with pool.use() as a:
+        ...     pass
+        >>> with pool.use() as b:
+        ...     with pool.use() as c:
+        ...         pass
+        >>> a == b, b == c
+        (True, False)
+        >>> pool.clear()
+        >>> _os_.path.exists(a), _os_.path.exists(c)
+        (False, False)
+
+    .. note::
+        Pools are per-process.
+        A forked child starts with an empty pool
+        instead of sharing the directories of its parent.
+    """
+
+    def __init__(
+        self,
+        prefix: str = '.energyplus_',
+        root: str | None = None,
+        max_free: int | None = 8,
+    ):
+        r"""
+        Initialize the pool.
+
+        :param prefix: The name prefix of the directories.
+        :param root:
+            The parent directory of the directories.
+            If `None`, defaults to :func:`default_root`.
+        :param max_free:
+            The maximum number of released directories kept for reuse.
+            If `None`, all released directories are kept.
+        """
+
+        self.prefix = prefix
+        self.root = root
+        self.max_free = max_free
+        self._lock = _threading_.Lock()
+        self._pid = None
+        self._free: list[str] = []
+        self._dirs: set[str] = set()
+
+    def _ensure_process(self):
+        r"""
+        Reset the pool if used in a new process.
+        The caller shall hold :attr:`_lock`.
+        """
+
+        if self._pid == _os_.getpid():
+            return
+        self._pid = _os_.getpid()
+        self._free, self._dirs = [], set()
+        _multiprocessing_util_.Finalize(self, self.clear, exitpriority=0)
+
+    def acquire(self) -> str:
+        r"""
+        Acquire a directory from the pool, creating one if none is free.
+
+        :return: The path of the directory.
+        """
+
+        with self._lock:
+            self._ensure_process()
+            while self._free:
+                path = self._free.pop()
+                if _os_.path.isdir(path):
+                    return path
+                self._dirs.discard(path)
+            path = _tempfile_.mkdtemp(
+                prefix=self.prefix,
+                dir=self.root if self.root is not None else default_root(),
+            )
+            self._dirs.add(path)
+            return path
+
+    def release(self, path: str):
+        r"""
+        Empty a directory and return it to the pool.
+        The directory is removed instead if the pool is full
+        or the directory cannot be emptied.
+
+        :param path: The path of the directory from :meth:`acquire`.
+        """
+
+        with self._lock:
+            self._ensure_process()
+            if path not in self._dirs or path in self._free:
+                return
+
+        # NOTE empty outside the lock, as reports may be large
+        try:
+            _empty_dir(path)
+            reusable = True
+        except OSError:
+            reusable = False
+
+        with self._lock:
+            if path in self._dirs:
+                if reusable and (
+                    self.max_free is None 
+                    or len(self._free) < self.max_free
+                ):
+                    self._free.append(path)
+                    return
+                self._dirs.discard(path)
+        _shutil_.rmtree(path, ignore_errors=True)
+
+    @_contextlib_.contextmanager
+    def use(self):
+        r"""
+        Acquire a directory for the duration of a context.
+
+        .. seealso:: :meth:`acquire`, :meth:`release`
+        """
+
+        path = self.acquire()
+        try: yield path
+        finally: self.release(path)
+
+    def clear(self):
+        r"""
+        Remove all the directories of the pool, including those in use.
+        """
+
+        with self._lock:
+            if self._pid != _os_.getpid():
+                return
+            dirs, self._free, self._dirs = self._dirs, [], set()
+        for path in dirs:
+            _shutil_.rmtree(path, ignore_errors=True)
+
+
+pool = WorkingDirectoryPool()
+r"""The default pool."""
+
+
+__all__ = [
+    'TMPFS_DIR',
+    'default_root',
+    'WorkingDirectoryPool',
+    'pool',
+]
@@ -0,0 +1,252 @@
+r"""
+Catalogs.
+
+Scope: Static catalogs of the variables available in building models,
+usable without running the kernel.
+"""
+
+
+import dataclasses as _dataclasses_
+import hashlib as _hashlib_
+import json as _json_
+import os as _os_
+from typing import Iterable, Iterator
+
+from . import _caches as _caches_
+from .models.building import BuildingModel
+from .variables import (
+    Actuator,
+    InternalVariable,
+    OutputMeter,
+    OutputVariable,
+    VariableManager,
+)
+
+
+class Catalog:
+    r"""
+    Catalog of the variables available in a building model,
+    i.e. the references of those variables.
+
+    Catalogs are generated by running the kernel once
+    (in lean design day mode, until the first warmup completes)
+    and listing the variables available via the kernel API,
+    which includes all of those in the actuator (EDD) and
+    variable (RDD/MDD) dictionaries, along with their keys.
+    Generated catalogs are cached on disk by the hash of the building model
+    (and the version of the kernel),
+    such that subsequent lookups do not require the kernel.
+
+    .. code-block:: python
+
+        catalog = Catalog.from_building(building)
+        refs = catalog.filter(Actuator.Ref, type='Zone Temperature Control')
+
+    .. doctest::
+
+        >>> catalog = Catalog([
+        ...     Actuator.Ref(
+        ...         type='Weather Data',
+        ...         control_type='Outdoor Dry Bulb',
+        ...         key='Environment',
+        ...     ),
+        ...     OutputMeter.Ref(type='Electricity:Facility'),
+        ... ])
+        >>> catalog.filter(Actuator.Ref, control_type='Outdoor Dry Bulb')
+        [Actuator.Ref(type='Weather Data', control_type='Outdoor Dry Bulb', key='Environment')]
+        >>> Catalog.loads(catalog.dumps()) == catalog
+        True
+    """
+
+    _REF_TYPES = {
+        'Actuator': Actuator.Ref,
+        'InternalVariable': InternalVariable.Ref,
+        'OutputMeter': OutputMeter.Ref,
+        'OutputVariable': OutputVariable.Ref,
+    }
+
+    _VERSION = 1
+
+    def __init__(self, refs: Iterable = tuple()):
+        r"""
+        Initialize the catalog.
+
+        :param refs: The references of the variables.
+        """
+
+        self._refs = list(dict.fromkeys(
+            ref for ref in refs
+            if isinstance(ref, tuple(self._REF_TYPES.values()))
+        ))
+
+    def __repr__(self):
+        return f'{type(self).__name__}(<{len(self)} refs>)'
+
+    def __iter__(self) -> Iterator:
+        return iter(self._refs)
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __contains__(self, ref):
+        return ref in self._refs
+
+    def __eq__(self, other):
+        if not isinstance(other, Catalog):
+            return NotImplemented
+        return self._refs == other._refs
+
+    def keys(self) -> VariableManager.KeysView:
+        r"""
+        Get the references as in :meth:`VariableManager.available_keys`.
+        """
+
+        return VariableManager.KeysView(iterable=self._refs)
+
+    def filter(self, ref_type: type | None = None, **fields) -> list:
+        r"""
+        Get the references of a type with the fields matching.
+
+        :param ref_type: The type of the references, e.g. :class:`Actuator.Ref`.
+        :param fields: The values of the fields to match (case-insensitive).
+        :return: The matching references, in order.
+        """
+
+        fields = {k: str(v).lower() for k, v in fields.items()}
+        return [
+            ref for ref in self._refs
+            if ref_type is None or isinstance(ref, ref_type)
+            if all(
+                str(getattr(ref, k, '')).lower() == v
+                for k, v in fields.items()
+            )
+        ]
+
+    def dumps(self) -> str:
+        r"""
+        Serialize this catalog in a compact form.
+        """
+
+        refs = {name: [] for name in self._REF_TYPES}
+        for ref in self._refs:
+            for name, ref_type in self._REF_TYPES.items():
+                if isinstance(ref, ref_type):
+                    refs[name].append(_dataclasses_.astuple(ref))
+                    break
+        return _json_.dumps(
+            dict(version=self._VERSION, refs=refs),
+            separators=(',', ':'),
+        )
+
+    @classmethod
+    def loads(cls, s: str | bytes) -> 'Catalog':
+        r"""
+        Deserialize a catalog from :meth:`dumps`.
+
+        :raises ValueError: If the serialized catalog is of another version.
+        """
+
+        data = _json_.loads(s)
+        if data.get('version') != cls._VERSION:
+            raise ValueError(f'Unsupported catalog version: {data.get("version")!r}')
+        return cls(
+            cls._REF_TYPES[name](*values)
+            for name, refs in data['refs'].items()
+            for values in refs
+        )
+
+    @staticmethod
+    def hash(building: BuildingModel) -> str:
+        r"""
+        Hash a building model, along with the version of the kernel, for caching.
+        Models serialized differently hash differently.
+        """
+
+        h = _hashlib_.sha256(f'{_caches_.kernel_version()}\0'.encode())
+        h.update(BuildingModel(building).dumps())
+        return h.hexdigest()
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        r"""
+        Get the default cache directory,
+        under `$XDG_CACHE_HOME` (or `~/.cache`).
+        """
+
+        return _caches_.default_dir('catalogs')
+
+    @classmethod
+    def generate(cls, building: BuildingModel | _os_.PathLike) -> 'Catalog':
+        r"""
+        Generate the catalog of a building model by running the kernel.
+
+        :param building: The building model or the path to the building model.
+        :return: The catalog.
+        :raises RuntimeError:
+            If the kernel completes no warmup,
+            e.g. for building models without `SizingPeriod:*` objects.
+        """
+
+        from .events import Event
+        from .systems import System
+
+        system = System(building=building, design_day=True, lean=True)
+        refs = []
+
+        @system.events[Event.Ref(
+            'after_new_environment_warmup_complete',
+            include_warmup=True,
+        )].on
+        def _collect(*args, **kwargs):
+            if refs:
+                return
+            refs.extend(system.variables.available_keys())
+            system.stop()
+
+        system.start().wait()
+        if not refs:
+            raise RuntimeError(
+                f'{system!r}: No warmup completed to list the variables of; '
+                f'Does the building model have any `SizingPeriod:*` objects?'
+            )
+        return cls(refs)
+
+    @classmethod
+    def from_building(
+        cls,
+        building: BuildingModel | _os_.PathLike,
+        cache_dir: _os_.PathLike | None = None,
+        refresh: bool = False,
+    ) -> 'Catalog':
+        r"""
+        Get the catalog of a building model,
+        generating it (and caching it) if not cached.
+
+        :param building: The building model or the path to the building model.
+        :param cache_dir:
+            The cache directory.
+            If `None`, defaults to :meth:`default_cache_dir`.
+        :param refresh: Whether to regenerate the catalog even if cached.
+        :return: The catalog.
+        """
+
+        if not isinstance(building, BuildingModel):
+            building = BuildingModel().loadf(building)
+        cache_dir = cache_dir if cache_dir is not None else cls.default_cache_dir()
+        path = _os_.path.join(cache_dir, f'{cls.hash(building)}.json')
+
+        if not refresh:
+            try:
+                with open(path, mode='r') as fp:
+                    return cls.loads(fp.read())
+            except (OSError, ValueError):
+                pass
+
+        catalog = cls.generate(building)
+        _caches_.write(path, catalog.dumps())
+        return catalog
+
+
+__all__ = [
+    'Catalog',
+]
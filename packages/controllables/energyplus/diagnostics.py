@@ -0,0 +1,137 @@
+r"""
+Diagnostics.
+
+Scope: Parsing of the warnings and errors reported by the kernel
+in its messages into structured records.
+"""
+
+
+import re as _re_
+from typing import Iterable, Literal, NamedTuple
+
+
+Severity = Literal['Warning', 'Severe', 'Fatal']
+r"""The severity of a diagnostic, in increasing order."""
+
+SEVERITIES: tuple[Severity, ...] = ('Warning', 'Severe', 'Fatal')
+r"""The severities, in increasing order."""
+
+
+class Diagnostic(NamedTuple):
+    r"""
+    A warning or error reported by the kernel.
+    """
+
+    severity: Severity
+    r"""The severity."""
+    message: str
+    r"""The message."""
+    details: tuple[str, ...] = ()
+    r"""The continuation lines (`~~~`) of the message."""
+
+
+_PATTERN = _re_.compile(
+    r'^\s*\*\*\s*(Warning|Severe|Fatal|~~~)\s*\*\*\s?(.*?)\s*$',
+)
+
+
+class DiagnosticParser:
+    r"""
+    Incremental parser of diagnostics from kernel messages.
+
+    Messages are in the format of the error file (`eplusout.err`),
+    e.g. `** Severe  ** ...` followed by `**   ~~~   ** ...`
+    continuation lines.
+    A diagnostic is only complete once the next diagnostic
+    (or a message of another kind) starts, or upon :meth:`close`.
+    Other messages are ignored.
+
+    .. doctest::
+
+        >>> parser = DiagnosticParser()
+        >>> parser.feed('   ** Severe  ** <root>[Zone] - Missing required property')
+        []
+        >>> parser.feed('   **   ~~~   ** Zone One')
+        []
+        >>> parser.feed('   **  Fatal  ** Errors occurred on processing input file.')
+        [Diagnostic(severity='Severe', message='<root>[Zone] - Missing required property', details=('Zone One',))]
+        >>> parser.close()
+        [Diagnostic(severity='Fatal', message='Errors occurred on processing input file.', details=())]
+    """
+
+    def __init__(self):
+        self._pending: tuple[str, str, list[str]] | None = None
+
+    def _flush(self) -> list[Diagnostic]:
+        if self._pending is None:
+            return []
+        severity, message, details = self._pending
+        self._pending = None
+        return [Diagnostic(severity, message, tuple(details))]
+
+    def feed(self, message: str) -> list[Diagnostic]:
+        r"""
+        Feed a message.
+
+        :param message: The message, possibly of multiple lines.
+        :return: The diagnostics completed by the message.
+        """
+
+        res = []
+        for line in message.splitlines():
+            match = _PATTERN.match(line)
+            if match is None:
+                res.extend(self._flush())
+                continue
+            kind, text = match.groups()
+            if kind == '~~~':
+                if self._pending is not None:
+                    self._pending[2].append(text)
+                continue
+            res.extend(self._flush())
+            self._pending = (kind, text, [])
+        return res
+
+    def close(self) -> list[Diagnostic]:
+        r"""
+        Complete the pending diagnostic, if any.
+
+        :return: The completed diagnostics.
+        """
+
+        return self._flush()
+
+
+def is_diagnostic(message: str) -> bool:
+    r"""
+    Check whether a message is (part of) a diagnostic.
+
+    .. seealso:: :class:`DiagnosticParser`
+    """
+
+    return any(_PATTERN.match(line) for line in message.splitlines())
+
+
+def parse(messages: Iterable[str]) -> list[Diagnostic]:
+    r"""
+    Parse diagnostics from kernel messages.
+
+    .. seealso:: :class:`DiagnosticParser`
+    """
+
+    parser = DiagnosticParser()
+    res = []
+    for message in messages:
+        res.extend(parser.feed(message))
+    res.extend(parser.close())
+    return res
+
+
+__all__ = [
+    'Severity',
+    'SEVERITIES',
+    'Diagnostic',
+    'DiagnosticParser',
+    'is_diagnostic',
+    'parse',
+]
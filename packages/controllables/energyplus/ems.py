@@ -0,0 +1,346 @@
+r"""
+Energy Management System (EMS).
+
+Scope: Compilation of variable expressions into EMS programs
+that run natively inside the kernel.
+
+.. seealso::
+    https://bigladdersoftware.com/epx/docs/24-1/ems-application-guide/
+"""
+
+
+import builtins as _builtins_
+import dataclasses as _dataclasses_
+import operator as _operator_
+import re as _re_
+from typing import Any, Callable, Literal, Self
+
+from controllables.core.variables import (
+    ProtoVariable,
+    ComputedVariable,
+    Conditional,
+    VariableView,
+)
+
+from .models.building import BuildingModel
+from .variables import (
+    Actuator,
+    InternalVariable,
+    OutputMeter,
+    OutputVariable,
+)
+
+
+class CompileError(ValueError):
+    r"""
+    Error raised when an expression cannot be compiled into EMS.
+    """
+
+    pass
+
+
+class Program:
+    r"""
+    EMS program compiled from variable expressions.
+
+    Expressions are built from :class:`OutputVariable`, :class:`OutputMeter`,
+    :class:`InternalVariable` and :class:`Actuator` variables (or references),
+    numeric constants and the operators supported by
+    :class:`controllables.core.variables.ComputedVariable`:
+    arithmetics (``+``, ``-``, ``*``, ``/``, ``**``, unary ``-``, :func:`abs`),
+    comparisons and logical ``&``/``|``.
+    :func:`min`, :func:`max` and :func:`round` are supported via
+    :func:`controllables.core.variables.compute`, 
+    e.g. ``compute(max, temperature, 18.)``.
+    Conditions may also be :class:`controllables.core.variables.Conditional`s
+    created by :meth:`controllables.core.variables.BaseVariable.when`
+    with a value to match.
+
+    .. doctest::
+
+        >>> temperature = OutputVariable.Ref(
+        ...     type='Zone Mean Air Temperature', key='ZONE ONE',
+        ... )
+        >>> setpoint = Actuator.Ref(
+        ...     type='Zone Temperature Control',
+        ...     control_type='Cooling Setpoint',
+        ...     key='ZONE ONE',
+        ... )
+        >>> program = Program('setback').set(
+        ...     setpoint, 26.,
+        ...     when=OutputVariable(temperature) > 30.,
+        ... )
+        >>> program.compile()['EnergyManagementSystem:Program'] # doctest: +NORMALIZE_WHITESPACE
+        {'setback': {'lines': [{'program_line': 'IF (setback_s0 > 30.0)'},
+                               {'program_line': 'SET setback_a0 = 26.0'},
+                               {'program_line': 'ELSE'},
+                               {'program_line': 'SET setback_a0 = Null'},
+                               {'program_line': 'ENDIF'}]}}
+
+    .. note::
+        The expressions are compiled once;
+        values of Python variables other than
+        the kernel variables listed above cannot be captured.
+    """
+
+    CallingPoint = Literal[
+        'BeginNewEnvironment',
+        'BeginZoneTimestepBeforeSetCurrentWeather',
+        'AfterNewEnvironmentWarmUpIsComplete',
+        'BeginZoneTimestepBeforeInitHeatBalance',
+        'BeginZoneTimestepAfterInitHeatBalance',
+        'BeginTimestepBeforePredictor',
+        'AfterPredictorBeforeHVACManagers',
+        'AfterPredictorAfterHVACManagers',
+        'InsideHVACSystemIterationLoop',
+        'EndOfZoneTimestepBeforeZoneReporting',
+        'EndOfZoneTimestepAfterZoneReporting',
+        'EndOfSystemTimestepBeforeHVACReporting',
+        'EndOfSystemTimestepAfterHVACReporting',
+        'EndOfZoneSizing',
+        'EndOfSystemSizing',
+        'AfterComponentInputReadIn',
+        'UserDefinedComponentModel',
+        'UnitarySystemSizing',
+    ]
+    r"""
+    EMS calling points.
+
+    .. seealso:: :class:`controllables.energyplus.events.EventManager`
+    """
+
+    @_dataclasses_.dataclass
+    class Statement:
+        r"""
+        An assignment statement.
+
+        :param target: The actuator to assign to.
+        :param expression: The expression to assign.
+        :param when: The condition of the assignment, if any.
+        :param otherwise:
+            The expression to assign if the condition does not hold.
+            If `None`, control of the actuator is released back to the kernel.
+        """
+
+        target: Actuator | Actuator.Ref
+        expression: Any
+        when: Any | None = None
+        otherwise: Any | None = None
+
+    _OPERATORS: dict[Callable, Callable[..., str]] = {
+        _operator_.add: lambda a, b: f'({a} + {b})',
+        _operator_.sub: lambda a, b: f'({a} - {b})',
+        _operator_.mul: lambda a, b: f'({a} * {b})',
+        _operator_.truediv: lambda a, b: f'({a} / {b})',
+        _operator_.pow: lambda a, b: f'({a} ^ {b})',
+        _operator_.neg: lambda a: f'(0 - {a})',
+        _operator_.pos: lambda a: f'{a}',
+        _operator_.abs: lambda a: f'@Abs {a}',
+        _operator_.lt: lambda a, b: f'({a} < {b})',
+        _operator_.le: lambda a, b: f'({a} <= {b})',
+        _operator_.gt: lambda a, b: f'({a} > {b})',
+        _operator_.ge: lambda a, b: f'({a} >= {b})',
+        _operator_.eq: lambda a, b: f'({a} == {b})',
+        _operator_.ne: lambda a, b: f'({a} <> {b})',
+        _operator_.and_: lambda a, b: f'({a} && {b})',
+        _operator_.or_: lambda a, b: f'({a} || {b})',
+        _builtins_.abs: lambda a: f'@Abs {a}',
+        _builtins_.min: lambda a, b: f'@Min {a} {b}',
+        _builtins_.max: lambda a, b: f'@Max {a} {b}',
+        _builtins_.round: lambda a: f'@Round {a}',
+    }
+
+    def __init__(
+        self,
+        name: str,
+        calling_point: CallingPoint = 'BeginZoneTimestepAfterInitHeatBalance',
+    ):
+        r"""
+        Initialize the program.
+
+        :param name: The name of the program.
+        :param calling_point: The EMS calling point to run the program at.
+        """
+
+        self.name = name
+        self.calling_point = calling_point
+        self.statements: list[Program.Statement] = []
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r})'
+
+    def set(
+        self,
+        target: Actuator | Actuator.Ref,
+        expression: Any,
+        when: Any | None = None,
+        otherwise: Any | None = None,
+    ) -> Self:
+        r"""
+        Add an assignment to this program.
+
+        .. seealso:: :class:`Program.Statement`
+
+        :return: This program.
+        """
+
+        self.statements.append(self.Statement(
+            target=target,
+            expression=expression,
+            when=when,
+            otherwise=otherwise,
+        ))
+        return self
+
+    def compile(self) -> dict[str, dict[str, dict]]:
+        r"""
+        Compile this program into EMS objects.
+
+        :return: The epJSON objects, keyed by object type and name.
+        :raises CompileError: If any of the expressions cannot be compiled.
+        """
+
+        return _Compiler(self).compile()
+
+    def inject(self, building: BuildingModel) -> BuildingModel:
+        r"""
+        Inject this program into a building model.
+        Existing EMS objects of the same names are replaced.
+
+        :param building: The building model to modify.
+        :return: The building model.
+        """
+
+        for object_type, objects in self.compile().items():
+            building.setdefault(object_type, dict()).update(objects)
+        return building
+
+
+class _Compiler:
+    def __init__(self, program: Program):
+        self._program = program
+        self._prefix = _re_.sub(r'\W', '_', program.name)
+        self._names: dict[tuple[str, Any], str] = dict()
+        self._objects: dict[str, dict[str, dict]] = dict()
+
+    def _declare(self, object_type: str, ref: Any, tag: str, body: dict):
+        key = (object_type, ref)
+        if key not in self._names:
+            index = sum(1 for t, _ in self._names if t == object_type)
+            name = f'{self._prefix}_{tag}{index}'
+            self._names[key] = name
+            self._objects.setdefault(object_type, dict())[name] = body
+        return self._names[key]
+
+    def _ref(self, obj: Any):
+        if isinstance(obj, ProtoVariable) and hasattr(obj, 'ref'):
+            return obj.ref
+        return obj
+
+    def target(self, obj: Any) -> str:
+        ref = self._ref(obj)
+        if not isinstance(ref, Actuator.Ref):
+            raise CompileError(f'{self._program!r}: Not an actuator: {obj!r}')
+        return self._declare(
+            'EnergyManagementSystem:Actuator', ref, 'a', dict(
+                actuated_component_unique_name=ref.key,
+                actuated_component_type=ref.type,
+                actuated_component_control_type=ref.control_type,
+            ),
+        )
+
+    def expression(self, obj: Any) -> str:
+        match self._ref(obj):
+            case bool() as value:
+                return str(int(value))
+            case int() | float() as value:
+                return repr(float(value))
+            case Actuator.Ref():
+                return self.target(obj)
+            case OutputVariable.Ref() as ref:
+                return self._declare(
+                    'EnergyManagementSystem:Sensor', ref, 's', dict(
+                        output_variable_or_output_meter_index_key_name=ref.key,
+                        output_variable_or_output_meter_name=ref.type,
+                    ),
+                )
+            case OutputMeter.Ref() as ref:
+                return self._declare(
+                    'EnergyManagementSystem:Sensor', ref, 's', dict(
+                        output_variable_or_output_meter_index_key_name='',
+                        output_variable_or_output_meter_name=ref.type,
+                    ),
+                )
+            case InternalVariable.Ref() as ref:
+                return self._declare(
+                    'EnergyManagementSystem:InternalVariable', ref, 'i', dict(
+                        internal_data_index_key_name=ref.key,
+                        internal_data_type=ref.type,
+                    ),
+                )
+            case VariableView() as view:
+                return self.expression(view.__variables__)
+            case ComputedVariable() as computed:
+                operator = getattr(computed.__func__, '__wrapped__', None)
+                if operator not in Program._OPERATORS or computed.__kwargs__:
+                    raise CompileError(
+                        f'{self._program!r}: Unsupported operation '
+                        f'{operator or computed.__func__!r} in {obj!r}'
+                    )
+                return Program._OPERATORS[operator](
+                    *(self.expression(o) for o in computed.__args__)
+                )
+            case Conditional() as conditional:
+                predicate = conditional.__predicate__
+                if not hasattr(predicate, '__match__'):
+                    raise CompileError(
+                        f'{self._program!r}: Unsupported predicate '
+                        f'{predicate!r} in {obj!r}; '
+                        f'Only conditionals matching a value are supported'
+                    )
+                return Program._OPERATORS[_operator_.eq](
+                    self.expression(conditional.parent),
+                    self.expression(predicate.__match__),
+                )
+        raise CompileError(f'{self._program!r}: Unsupported operand {obj!r}')
+
+    def compile(self):
+        lines = []
+        for statement in self._program.statements:
+            target = self.target(statement.target)
+            assignment = f'SET {target} = {self.expression(statement.expression)}'
+            if statement.when is None:
+                lines.append(assignment)
+                continue
+            lines.extend([
+                f'IF {self.expression(statement.when)}',
+                assignment,
+                'ELSE',
+                f'SET {target} = ' + (
+                    'Null' if statement.otherwise is None else
+                    self.expression(statement.otherwise)
+                ),
+                'ENDIF',
+            ])
+
+        name = self._program.name
+        return {
+            **self._objects,
+            'EnergyManagementSystem:Program': {
+                name: dict(
+                    lines=[dict(program_line=line) for line in lines],
+                ),
+            },
+            'EnergyManagementSystem:ProgramCallingManager': {
+                f'{name}_manager': dict(
+                    energyplus_model_calling_point=self._program.calling_point,
+                    programs=[dict(program_name=name)],
+                ),
+            },
+        }
+
+
+__all__ = [
+    'CompileError',
+    'Program',
+]
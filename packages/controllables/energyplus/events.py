@@ -5,8 +5,12 @@ Events.
 """
 
 
+import collections as _collections_
+import contextlib as _contextlib_
+import datetime as _datetime_
 import functools as _functools_
 import dataclasses as _dataclasses_
+import threading as _threading_
 from typing import Any, Callable, NamedTuple, TypeAlias
 
 from controllables.core.callbacks import (
@@ -88,15 +92,151 @@ class Event(
         super().__init__()
         self.ref = ref
 
+    @property
+    def _lock(self):
+        r"""The lock of the subscriptions, i.e. of the event manager if any."""
+
+        if self.__parent__ is None:
+            return _contextlib_.nullcontext()
+        return self.__parent__._lock
+
+    def on(self, func):
+        with self._lock:
+            if func in self._callables:
+                return func
+            super().on(func)
+            if self.__parent__ is not None:
+                self.__parent__._subscribe(self)
+        return func
+
+    def off(self, func):
+        with self._lock:
+            if func not in self._callables:
+                return func
+            super().off(func)
+            if self.__parent__ is not None:
+                self.__parent__._unsubscribe(self)
+        return func
+
     def __call__(self, context: Context):
         if self.ref is not None:
             if not self.ref.include_warmup:
-                if self.parent._core.api \
-                    .exchange.warmup_flag(self.parent._core.state):
+                if self.parent.warmup:
                     return None
 
         return super().__call__(context)
 
+    @_functools_.cached_property
+    def _decimations(self) -> dict[_datetime_.timedelta, 'DecimatedEvent']:
+        return dict()
+
+    def every(
+        self, 
+        interval: _datetime_.timedelta | None = None, 
+        **interval_kwds,
+    ) -> 'DecimatedEvent':
+        r"""
+        Decimate this event by simulation time.
+
+        .. code-block:: python
+
+            @system.events['timestep'].every(minutes=15).on
+            def control(context):
+                ...
+
+        :param interval: The interval of simulation time.
+        :param **interval_kwds: 
+            Keyword arguments to construct the interval from
+            if `interval` is not specified, e.g. `minutes=15`.
+            .. seealso:: :class:`datetime.timedelta`
+        :return: 
+            A view of this event dispatched at most once per `interval`.
+            Views of the same interval are shared.
+        """
+
+        if interval is None:
+            interval = _datetime_.timedelta(**interval_kwds)
+        if interval not in self._decimations:
+            self._decimations[interval] = DecimatedEvent(
+                event=self, interval=interval,
+            )
+        return self._decimations[interval]
+
+
+class DecimatedEvent(Callback[[Context], Any]):
+    r"""
+    A view of an :class:`Event` dispatched at most once 
+    per interval of simulation time.
+
+    The view subscribes to its event only while it has subscriptions.
+    On each occurrence of the event, the simulation time 
+    (hours since the beginning of the current environment) 
+    is read from the core with a single call and compared 
+    to the interval last dispatched;
+    the listeners of this view are called directly 
+    with the context of the event, i.e. no intermediate 
+    callbacks are involved.
+    Intervals are aligned to the beginning of each environment;
+    the first occurrence in each environment is always dispatched.
+
+    .. note:: Access instances via :meth:`Event.every`.
+    """
+
+    def __init__(self, event: Event, interval: _datetime_.timedelta):
+        r"""
+        Initialize the view.
+
+        :param event: The event to decimate.
+        :param interval: The interval of simulation time.
+        """
+
+        if interval <= _datetime_.timedelta(0):
+            raise ValueError(f'Interval must be positive: {interval!r}')
+
+        super().__init__()
+        self.event = event
+        self.interval = interval
+        self._interval_hours = interval / _datetime_.timedelta(hours=1)
+        self._slot: int | None = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.event.ref!r}, {self.interval!r})'
+
+    @property
+    def _environment_event(self) -> Event:
+        return self.event.parent[
+            Event.Ref('begin_new_environment', include_warmup=True)
+        ]
+
+    def on(self, func):
+        super().on(func)
+        self.event.on(self._dispatch)
+        self._environment_event.on(self._reset)
+        return func
+
+    def off(self, func):
+        super().off(func)
+        if len(self._callables) == 0:
+            self.event.off(self._dispatch)
+            self._environment_event.off(self._reset)
+        return func
+
+    def _reset(self, context: Context | None = None):
+        # NOTE simulation time restarts with each environment
+        self._slot = None
+
+    def _dispatch(self, context: Context):
+        core = self.event.parent._core
+        slot = int(
+            # NOTE tolerate floating-point errors of the timestep accumulation
+            (core.api.exchange.current_sim_time(core.state) + 1e-6) 
+            // self._interval_hours
+        )
+        if slot == self._slot:
+            return None
+        self._slot = slot
+        return self._callables.__call__(context)
+
 
 class EventManager(
     CallbackManager[Event.RefT, Event],
@@ -109,11 +249,77 @@ class EventManager(
     <https://bigladdersoftware.com/epx/docs/24-1/ems-application-guide/ems-calling-points.html>
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # NOTE subscriptions change from both the user thread 
+        # and the kernel thread (e.g. listeners of :meth:`Event.wait`)
+        self._lock = _threading_.RLock()
+        r"""
+        The lock of the events, their subscriptions 
+        and the registrations with the core.
+        """
+
     @property
     def _core(self):
         return self.parent._kernel
 
-    _CallbackSetters: TypeAlias = dict[str, Callable[[Event], None]]
+    _warmup: bool | None = None
+    r"""
+    The cached warmup state of the core; `None` if unknown.
+
+    .. seealso:: :attr:`warmup`
+    """
+
+    @property
+    def warmup(self) -> bool:
+        r"""
+        Whether the core is currently in the warmup period.
+
+        The state is queried from the core at most once 
+        per transition, which is tracked from the 
+        `begin_new_environment` and `after_new_environment_warmup_complete` 
+        calling points; otherwise the cached value is returned.
+        """
+
+        if self._warmup is None:
+            self._warmup_tracker
+            self._warmup = bool(
+                self._core.api.exchange.warmup_flag(self._core.state)
+            )
+        return self._warmup
+
+    _WARMUP_TRANSITIONS = frozenset({
+        'begin_new_environment', 
+        'after_new_environment_warmup_complete',
+    })
+    r"""Calling points of the core at which the warmup state may change."""
+
+    @_functools_.cached_property
+    def _warmup_tracker(self) -> frozenset[str]:
+        r"""
+        Invalidate the cached warmup state 
+        whenever the warmup state may change.
+
+        The calling points in :attr:`_WARMUP_TRANSITIONS` are subscribed to 
+        (once, for the lifetime of this manager) and registered with the core 
+        like those of any other event, i.e. they share a single registration 
+        with the events of the same calling points; their dispatchers 
+        invalidate the cached state before calling any of the events.
+        """
+
+        @self._core.hooks['run:pre'].on
+        def _invalidate(*args, **kwargs):
+            self._warmup = None
+        _invalidate()
+
+        for name in self._WARMUP_TRANSITIONS:
+            self._core_listeners.setdefault(name, [])
+            self._core_subscriptions[name] += 1
+            self._core_register(name)
+
+        return self._WARMUP_TRANSITIONS
+
+    _CallbackSetters: TypeAlias = dict[str, Callable[[list[Event]], None]]
     
     # TODO assoc defaultdict!!!!!!!
     @_functools_.cached_property
@@ -136,54 +342,70 @@ class EventManager(
             return cb_
 
         class _Dispatcher:
-            def __init__(self, event: Event):
-                self._event = event
+            r"""
+            Fan-out of a single core callback 
+            to all events of the same calling point.
+            """
+
+            def __init__(self, events: list[Event], invalidates_warmup: bool = False):
+                self._events = events
+                self._invalidates_warmup = invalidates_warmup
 
             def _message(self, m):
-                self._event.__call__(
-                    MessageContext(
-                        event=self._event,
-                        message=bytes.decode(m),
-                    ),
-                )
+                m = bytes.decode(m)
+                for event in self._events:
+                    event.__call__(
+                        MessageContext(
+                            event=event,
+                            message=m,
+                        ),
+                    )
 
             def _progress(self, p):
-                self._event.__call__(
-                    ProgressContext(
-                        event=self._event,
-                        progress=p / 100,
-                    ),
-                )
+                for event in self._events:
+                    event.__call__(
+                        ProgressContext(
+                            event=event,
+                            progress=p / 100,
+                        ),
+                    )
 
             def _state(self, _):
-                self._event.__call__(
-                    Context(
-                        event=self._event,
-                    ),
-                )
+                if self._invalidates_warmup:
+                    manager._warmup = None
+                for event in self._events:
+                    event.__call__(
+                        Context(
+                            event=event,
+                        ),
+                    )
 
+        manager = self
         runtime = self._core.api.runtime
         state = self._core.state
 
         return {
             # message
-            'message': lambda event: 
+            'message': lambda events: 
                 runtime.callback_message(
                     state, 
-                    _ensure_exc(_Dispatcher(event)._message),
+                    _ensure_exc(_Dispatcher(events)._message),
                 ),
             # progress
-            'progress': lambda event: 
+            'progress': lambda events: 
                 runtime.callback_progress(
                     state, 
-                    _ensure_exc(_Dispatcher(event)._progress),
+                    _ensure_exc(_Dispatcher(events)._progress),
                 ),
             # state
             **{
-                ref: lambda event, callback_setter=callback_setter: 
+                ref: lambda events, ref=ref, callback_setter=callback_setter: 
                     callback_setter(
                         state, 
-                        _ensure_exc(_Dispatcher(event)._state),
+                        _ensure_exc(_Dispatcher(
+                            events, 
+                            invalidates_warmup=ref in self._WARMUP_TRANSITIONS,
+                        )._state),
                     )
                 for ref, callback_setter in {
                     'after_component_get_input': runtime.callback_after_component_get_input,
@@ -208,6 +430,116 @@ class EventManager(
             },
         }
     
+    @_functools_.cached_property
+    def _core_listeners(self) -> dict[str, list[Event]]:
+        r"""
+        Events by calling point of the core.
+        Each calling point is registered with the core only once, 
+        regardless of the number of events.
+        """
+
+        return dict()
+
+    @_functools_.cached_property
+    def _core_subscriptions(self) -> _collections_.Counter[str]:
+        r"""
+        Number of subscriptions (:meth:`Event.on`) by calling point of the core.
+        Calling points without subscriptions are not registered with the core.
+        """
+
+        return _collections_.Counter()
+
+    @_functools_.cached_property
+    def _core_registrations(self) -> set[str]:
+        r"""
+        Calling points registered with the core since the last reset.
+        Resetting the core clears all registrations;
+        only calling points with subscriptions are registered again
+        at the beginning of the next run.
+        """
+
+        registrations = set()
+
+        @self._core.hooks['reset:post'].on
+        def _core_teardown(*args, **kwargs):
+            registrations.clear()
+
+        @self._core.hooks['run:pre'].on
+        def _core_setup(*args, **kwargs):
+            with self._lock:
+                for name in list(self._core_listeners.keys()):
+                    self._core_register(name)
+
+        return registrations
+
+    def _core_register(self, name: str):
+        r"""
+        Register a calling point with the core, if subscribed and not yet registered.
+
+        :param name: The name of the calling point.
+        """
+
+        if name in self._core_registrations:
+            return
+        if self._core_subscriptions[name] <= 0:
+            return
+        self._core_callback_setters[name](self._core_listeners[name])
+        self._core_registrations.add(name)
+
+    def _core_listen(self, event: Event):
+        r"""
+        Listen to the calling point of an event.
+
+        :param event: The event.
+        """
+
+        self._core_listeners \
+            .setdefault(event.ref.name, []) \
+            .append(event)
+
+    def _core_unlisten(self, event: Event):
+        r"""
+        Stop listening to the calling point of an event.
+
+        :param event: The event.
+        """
+
+        name = event.ref.name
+        self._core_listeners[name].remove(event)
+        self._core_subscriptions[name] -= len(event._callables)
+
+    def _subscribe(self, event: Event):
+        r"""
+        Count a subscription to an event.
+        The calling point of the event is registered 
+        with the core upon its first subscription.
+
+        :param event: The event.
+        """
+
+        name = event.ref.name
+        if name not in self._core_listeners:
+            return
+        self._core_subscriptions[name] += 1
+        self._core_register(name)
+
+    def _unsubscribe(self, event: Event):
+        r"""
+        Discount a subscription to an event.
+
+        .. note::
+            The core provides no means to unregister a single callback.
+            Calling points without subscriptions remain registered
+            until the core is reset, i.e. the end of the current run.
+
+        :param event: The event.
+        """
+
+        name = event.ref.name
+        if name not in self._core_listeners:
+            return
+        self._core_subscriptions[name] -= 1
+
     @_functools_.cached_property
     def _std_callback_setters(self):
         class _Dispatcher:
@@ -221,14 +553,37 @@ class EventManager(
                     ),
                 )
 
+        def _callback_setter(hook_ref):
+            def callback_setter(event: Event):
+                # NOTE systems in split mode dispatch these themselves
+                # (see :meth:`_std_dispatch`) rather than running the kernel
+                if self.parent._split:
+                    return lambda: None
+                hook = self._core.hooks[hook_ref]
+                dispatch = hook.on(_Dispatcher(event)._state)
+                return lambda: hook.off(dispatch)
+            return callback_setter
+
         return {
-            'begin': lambda event: self._core.hooks['run:pre'].on(
-                _Dispatcher(event)._state,
-            ),
-            'end': lambda event: self._core.hooks['run:post'].on(
-                _Dispatcher(event)._state,
-            ),
+            'begin': _callback_setter('run:pre'),
+            'end': _callback_setter('run:post'),
         }
+
+    @_functools_.cached_property
+    def _std_callback_unsetters(self) -> dict[Event, Callable[[], None]]:
+        return dict()
+
+    def _std_dispatch(self, name: str):
+        r"""
+        Dispatch the standard events of a name (e.g. `'begin'`) 
+        directly, i.e. without the hooks of the core.
+
+        :param name: The name of the events.
+        """
+
+        for event in list(self._std_callback_unsetters):
+            if event.ref.name == name:
+                event.__call__(Context(event=event))
     
     # TODO rich format
     # TODO this is available names???
@@ -253,16 +608,18 @@ class EventManager(
                 return self['begin_zone_timestep_after_init_heat_balance']
             
         event = Event(ref=Event.Ref.copyof(ref))
+        if event.ref.name in self._std_callback_setters:
+            # NOTE standard events occur outside of any environment,
+            # i.e. never within the warmup period
+            event.ref = event.ref._replace(include_warmup=True)
+        if not event.ref.include_warmup:
+            self._warmup_tracker
 
         if event.ref.name in self._std_callback_setters:
-            self._std_callback_setters[event.ref.name](event)
+            self._std_callback_unsetters[event] = \
+                self._std_callback_setters[event.ref.name](event)
         elif event.ref.name in self._core_callback_setters:
-            # TODO !!!!!!
-            @self._core.hooks['run:pre'].on
-            def _core_setup(*args, **kwargs):
-                # TODO 
-                self._core_callback_setters[event.ref.name](event)
-            _core_setup()
+            self._core_listen(event)
         else:
             raise KeyError(f'Unknown event: {event.ref.name}')
         
@@ -271,14 +628,33 @@ class EventManager(
     
     def __getitem__(self, ref):
         if ref not in self._callbacks:
-            return self.__missing__(ref)
+            with self._lock:
+                # NOTE the event may have been created by another thread
+                if ref not in self._callbacks:
+                    return self.__missing__(ref)
         return self._callbacks[ref]
 
     def __delitem__(self, ref):
-        raise NotImplementedError
-        # TODO rm setup
-        # TODO rm `setup` when no listeners
-        return super().__delitem__(ref)
+        r"""
+        Remove an event along with its subscriptions.
+        Its calling point is no longer registered with the core 
+        from the next run on, unless subscribed by other events.
+
+        :param ref: The reference to the event.
+        :raises KeyError: If the event does not exist.
+        """
+
+        match ref:
+            case 'step' | 'timestep':
+                ref = 'begin_zone_timestep_after_init_heat_balance'
+
+        with self._lock:
+            event = self._callbacks.pop(ref)
+            if event in self._std_callback_unsetters:
+                self._std_callback_unsetters.pop(event)()
+            elif event.ref.name in self._core_listeners:
+                self._core_unlisten(event)
+            event.detach(self)
     
     # TODO standardize: warn abt self[ref](...) as alt, 
     # or use EventQueue inplace of CallbackPipeline !!!!!
@@ -301,5 +677,6 @@ class EventManager(
 
 __all__ = [
     'Event',
+    'DecimatedEvent',
     'EventManager',
 ]
@@ -4,10 +4,11 @@ Logging facilities.
 
 
 from .message import MessageLogger
-from .progress import ProgressLogger
+from .progress import ProgressLogger, ProgressDashboard
 
 
 __all__ = [
     'MessageLogger',
     'ProgressLogger',
+    'ProgressDashboard',
 ]
\ No newline at end of file
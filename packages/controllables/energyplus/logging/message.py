@@ -5,36 +5,213 @@ Scope: Logging and presenting messages.
 """
 
 
+import logging as _logging_
+import logging.handlers as _logging_handlers_
+import queue as _queue_
+import time as _time_
+from typing import Callable
+
 from controllables.core.components import Component
 
+from ..diagnostics import Diagnostic, DiagnosticParser, is_diagnostic
 from ..systems import System
 
 
+class _MessageListener(_logging_handlers_.QueueListener):
+    r"""
+    Listener processing raw messages (rather than log records)
+    from a queue in a background thread.
+    """
+
+    def __init__(self, queue: _queue_.SimpleQueue, process: Callable[[str], None]):
+        super().__init__(queue)
+        self._process = process
+
+    def prepare(self, record):
+        return record
+
+    def handle(self, record):
+        self._process(record)
+
+
 class MessageLogger(Component[System]):
     r"""
     A logger that logs messages to a `logging.Logger`.
 
+    Warnings and errors reported by the kernel are parsed
+    into :class:`Diagnostic`s and logged at the levels in :attr:`LEVELS`,
+    with the diagnostic in the `diagnostic` attribute of the log records
+    (`None` for other messages).
+
+    In asynchronous mode, the kernel thread only enqueues messages;
+    parsing and logging (including the handlers of the logger)
+    happen in a :class:`logging.handlers.QueueListener` thread.
+    Messages are flushed at the end of each run.
+
+    Repeated messages and message floods can be reduced
+    by deduplication (`dedupe`) and rate limiting (`max_rate`).
+    Neither applies to severe or fatal errors.
+
+    .. doctest::
+
+        >>> import logging, sys
+        >>> logger = logging.getLogger('doctest')
+        >>> logger.setLevel(logging.INFO)
+        >>> logger.addHandler(logging.StreamHandler(sys.stdout))
+        >>> message_logger = MessageLogger(logger, dedupe=True)
+        >>> for m in ['Warming up'] * 3 + ['   ** Severe  ** Node not found']:
+        ...     message_logger.log(m)
+        Warming up
+        >>> message_logger.flush()
+        Last message repeated 2 times
+        Node not found
+
     .. seealso:: https://docs.python.org/3/library/logging.html
     """
 
     import logging as _logging_
 
-    def __init__(self, logger_ref: _logging_.Logger | str | None = None):
+    LEVELS = {
+        'Warning': _logging_.WARNING,
+        'Severe': _logging_.ERROR,
+        'Fatal': _logging_.CRITICAL,
+    }
+    r"""Log levels by severity of diagnostics."""
+
+    def __init__(
+        self,
+        logger_ref: _logging_.Logger | str | None = None,
+        asynchronous: bool = False,
+        dedupe: bool = False,
+        max_rate: float | None = None,
+    ):
         r"""
         Initialize a new instance of :class:`MessageLogger`.
 
-        :param logger_ref: 
+        :param logger_ref:
             The logger or the name of the logger to log messages to.
-            If not provided or ``None``, a new logger with the name 
+            If not provided or ``None``, a new logger with the name
             of the attached engine will be created.
+        :param asynchronous:
+            Whether to log messages from a background thread
+            instead of the kernel thread.
+        :param dedupe:
+            Whether to collapse consecutive identical messages
+            into a count of the repetitions.
+        :param max_rate:
+            The maximum number of messages logged per second (on average);
+            messages beyond are dropped and counted.
+            If `None`, messages are not rate limited.
         """
 
         super().__init__()
         self._logger_ref = logger_ref
-        # TODO
-        #self._events = _components_.events.EventManager()
+        self._asynchronous = asynchronous
+        self._dedupe = dedupe
+        self._max_rate = max_rate
+
+        self._parser = DiagnosticParser()
+        self._last: str | None = None
+        self._repeats = 0
+        self._tokens = self._capacity
+        self._stamp = _time_.monotonic()
+        self._dropped = 0
+
+    @property
+    def logger(self) -> _logging_.Logger:
+        r"""The logger to log messages to."""
+
+        if isinstance(self._logger_ref, self._logging_.Logger):
+            return self._logger_ref
+        return self._logging_.getLogger(
+            name=str(
+                self._logger_ref
+                if self._logger_ref is not None else
+                self.parent
+            )
+        )
+
+    @property
+    def _capacity(self) -> float | None:
+        r"""
+        The capacity of the token bucket of the rate limit, if any.
+        """
 
-        #super().__attach__.on('call:post', ...)
+        if self._max_rate is None:
+            return None
+        # NOTE bursts of up to one second worth of messages,
+        # but at least one message (e.g. for rates below one per second)
+        return max(1., self._max_rate)
+
+    def _acquire_token(self) -> bool:
+        if self._max_rate is None:
+            return True
+        now = _time_.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._stamp) * self._max_rate,
+            self._capacity,
+        )
+        self._stamp = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _flush_counts(self):
+        if self._repeats > 0:
+            self.logger.info(
+                'Last message repeated %d times', self._repeats,
+                extra=dict(diagnostic=None),
+            )
+            self._repeats = 0
+        if self._dropped > 0:
+            self.logger.info(
+                '%d messages dropped (rate limited)', self._dropped,
+                extra=dict(diagnostic=None),
+            )
+            self._dropped = 0
+
+    def _emit(self, level: int, message: str, diagnostic: Diagnostic | None = None):
+        if level < self._logging_.ERROR:
+            if self._dedupe:
+                if message == self._last:
+                    self._repeats += 1
+                    return
+                self._last = message
+            if not self._acquire_token():
+                self._dropped += 1
+                return
+        self._flush_counts()
+        self.logger.log(level, message, extra=dict(diagnostic=diagnostic))
+
+    def _emit_diagnostics(self, diagnostics: list[Diagnostic]):
+        for diagnostic in diagnostics:
+            self._emit(
+                self.LEVELS[diagnostic.severity],
+                '\n'.join((diagnostic.message, *diagnostic.details)),
+                diagnostic,
+            )
+
+    def log(self, message: str):
+        r"""
+        Log a message from the kernel.
+
+        :param message: The message, e.g. from a `'message'` event.
+        """
+
+        self._emit_diagnostics(self._parser.feed(message))
+        if not is_diagnostic(message):
+            self._emit(self._logging_.INFO, message)
+
+    def flush(self):
+        r"""
+        Log the pending diagnostic and the counts of the messages
+        collapsed or dropped, if any.
+        """
+
+        self._emit_diagnostics(self._parser.close())
+        self._flush_counts()
+        self._last = None
 
     def __attach__(self, engine):
         super().__attach__(parent=engine)
@@ -42,25 +219,33 @@ class MessageLogger(Component[System]):
         # TODO
         #self._events.__attach__(engine=self._engine)
         self._events = self.parent.events
+        hooks = self.parent._kernel.hooks
 
         def setup():
             nonlocal self
-            logger = (
-                self._logger_ref 
-                if isinstance(self._logger_ref, self._logging_.Logger) else
-                self._logging_.getLogger(
-                    name=str(
-                        self._logger_ref 
-                        if self._logger_ref is not None else 
-                        engine
-                    )
-                )
-            )
+
+            log = self.log
+            if self._asynchronous:
+                queue = _queue_.SimpleQueue()
+                listener = _MessageListener(queue, self.log)
+                log = queue.put_nowait
+
+                @hooks['run:pre'].on
+                def _start(*args, **kwargs):
+                    listener.start()
+
+                @hooks['run:post'].on
+                def _stop(*args, **kwargs):
+                    listener.stop()
+
+            @hooks['run:post'].on
+            def _flush(*args, **kwargs):
+                self.flush()
+
             from ..events import Event
             self._events \
-                .on(Event.Ref('message', include_warmup=True), 
-                    lambda ctx, logger=logger: 
-                        logger.info(ctx.message))
+                .on(Event.Ref('message', include_warmup=True),
+                    lambda ctx, log=log: log(ctx.message))
 
         setup()
 
@@ -69,4 +254,4 @@ class MessageLogger(Component[System]):
 
 __all__ = [
     'MessageLogger',
-]
\ No newline at end of file
+]
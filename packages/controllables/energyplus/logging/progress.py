@@ -5,6 +5,15 @@ Scope: Logging and presenting progress messages and values.
 """
 
 
+import datetime as _datetime_
+import itertools as _itertools_
+import multiprocessing as _multiprocessing_
+import os as _os_
+import queue as _queue_
+import threading as _threading_
+import time as _time_
+from typing import NamedTuple
+
 from controllables.core.components import Component
 
 from ..systems import System
@@ -74,6 +83,350 @@ class ProgressLogger(Component[System]):
         return self
 
 
+class ProgressStats(NamedTuple):
+    r"""
+    Progress statistics of a system.
+    """
+
+    name: str
+    r"""The name of the system."""
+    progress: float
+    r"""The progress, between 0 and 1."""
+    timesteps: int
+    r"""The number of timesteps run (including warmup)."""
+    rate: float | None
+    r"""The number of timesteps per second (smoothed)."""
+    eta: _datetime_.timedelta | None
+    r"""The estimated remaining time."""
+    done: bool
+    r"""Whether the system has finished."""
+
+
+class ProgressReporter(Component[System]):
+    r"""
+    A component that reports the progress of a system 
+    to a :class:`ProgressDashboard`, possibly in another process.
+    
+    Reports are throttled at the source:
+    the kernel thread only counts timesteps, 
+    and sends a report at most every `interval` seconds.
+    Reporters are picklable (e.g. to be passed to worker processes)
+    if their dashboard is `shared`.
+
+    .. seealso:: :meth:`ProgressDashboard.reporter`
+    """
+
+    def __init__(self, queue, name: str, interval: float = .5):
+        r"""
+        Initialize a new instance of :class:`ProgressReporter`.
+
+        :param queue: The queue of the dashboard.
+        :param name: The name of the system.
+        :param interval: The minimum interval between reports, in seconds.
+        """
+
+        super().__init__()
+        self._queue = queue
+        self._name = name
+        self._interval = interval
+        self._timesteps = 0
+        self._progress = 0.
+        self._sent = float('-inf')
+
+    def __getstate__(self):
+        return dict(queue=self._queue, name=self._name, interval=self._interval)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _report(self, done: bool = False):
+        self._sent = _time_.monotonic()
+        self._queue.put((
+            self._name, self._progress, self._timesteps, 
+            _time_.time(), done,
+        ))
+
+    def __attach__(self, manager):
+        super().__attach__(parent=manager)
+
+        _events = self.parent.events
+
+        def setup():
+            nonlocal self, _events
+
+            from ..events import Event
+
+            @_events[Event.Ref('begin', include_warmup=True)].on
+            def _begin(*args, **kwargs):
+                self._timesteps, self._progress = 0, 0.
+                self._report()
+
+            @_events[Event.Ref(
+                'begin_zone_timestep_after_init_heat_balance', 
+                include_warmup=True,
+            )].on
+            def _timestep(*args, **kwargs):
+                self._timesteps += 1
+
+            @_events[Event.Ref('progress', include_warmup=True)].on
+            def _progress(ctx):
+                self._progress = ctx.progress
+                if _time_.monotonic() - self._sent >= self._interval:
+                    self._report()
+
+            @_events[Event.Ref('end', include_warmup=True)].on
+            def _end(*args, **kwargs):
+                self._progress = 1.
+                self._report(done=True)
+
+        setup()
+
+        return self
+
+
+class ProgressDashboard:
+    r"""
+    A dashboard that aggregates the progress of many systems,
+    possibly across processes, into `tqdm.tqdm` progress bars.
+
+    Reports from :class:`ProgressReporter`s are collected 
+    and rendered in a background thread at most every `interval` seconds:
+    one bar of the overall progress, followed by one bar per system 
+    (of those with the longest ETA, up to `max_rows`)
+    with its timesteps per second and ETA.
+    
+    .. code-block:: python
+
+        with ProgressDashboard(shared=True) as dashboard:
+            for system in systems:
+                system.add(dashboard.reporter())
+            ... # start and wait
+
+    .. seealso:: https://tqdm.github.io
+    """
+
+    try: 
+        import tqdm.auto as _tqdm_auto_
+    except ModuleNotFoundError as e:
+        from controllables.core.errors import OptionalModuleNotFoundError
+        raise OptionalModuleNotFoundError.suggest(['tqdm']) from e
+
+    _SMOOTHING = .3
+
+    def __init__(
+        self, 
+        shared: bool = False,
+        interval: float = .5,
+        max_rows: int = 8,
+    ):
+        r"""
+        Initialize a new instance of :class:`ProgressDashboard`.
+
+        :param shared: 
+            Whether to accept reports from other processes
+            (via a `multiprocessing.Manager` queue)
+            rather than from the threads of this process only.
+        :param interval: The minimum interval between renders, in seconds.
+        :param max_rows: The maximum number of per-system bars.
+        """
+
+        self._shared = shared
+        self._interval = interval
+        self._max_rows = max_rows
+        self._manager = None
+        self._queue = None
+        self._thread = None
+        self._names = _itertools_.count()
+        self._states: dict[str, dict] = dict()
+        self._lock = _threading_.Lock()
+        self._bars = []
+
+    @property
+    def queue(self):
+        if self._queue is None:
+            if self._shared:
+                self._manager = _multiprocessing_.Manager()
+                self._queue = self._manager.Queue()
+            else:
+                self._queue = _queue_.SimpleQueue()
+        return self._queue
+
+    def reporter(self, name: str | None = None) -> ProgressReporter:
+        r"""
+        Create a reporter for a system.
+
+        :param name: 
+            The name of the system.
+            If `None`, a unique name is generated.
+        :return: The reporter, to be added to the system.
+        """
+
+        if name is None:
+            name = f'{_os_.getpid()}:{next(self._names)}'
+        return ProgressReporter(
+            self.queue, name=name, interval=self._interval,
+        )
+
+    def _update(self, report: tuple):
+        name, progress, timesteps, timestamp, done = report
+        with self._lock:
+            state = self._states.get(name)
+            if state is None or (timesteps < state['timesteps']):
+                # NOTE new or restarted system
+                state = self._states[name] = dict(
+                    start=timestamp, start_progress=progress,
+                    rate=None,
+                )
+            else:
+                dt = timestamp - state['timestamp']
+                if dt > 0:
+                    rate = (timesteps - state['timesteps']) / dt
+                    state['rate'] = (
+                        rate if state['rate'] is None else
+                        self._SMOOTHING * rate 
+                        + (1 - self._SMOOTHING) * state['rate']
+                    )
+            state.update(
+                progress=progress, timesteps=timesteps, 
+                timestamp=timestamp, done=done,
+            )
+
+    def stats(self) -> list[ProgressStats]:
+        r"""
+        Get the progress statistics of all systems reported.
+
+        :return: The statistics, in order of the first reports.
+        """
+
+        res = []
+        with self._lock:
+            for name, state in self._states.items():
+                eta = None
+                if state['done']:
+                    eta = _datetime_.timedelta(0)
+                else:
+                    elapsed = state['timestamp'] - state['start']
+                    progressed = state['progress'] - state['start_progress']
+                    if elapsed > 0 and progressed > 0:
+                        eta = _datetime_.timedelta(
+                            seconds=elapsed * (1 - state['progress']) / progressed,
+                        )
+                res.append(ProgressStats(
+                    name=name,
+                    progress=state['progress'],
+                    timesteps=state['timesteps'],
+                    rate=state['rate'],
+                    eta=eta,
+                    done=state['done'],
+                ))
+        return res
+
+    def render(self):
+        r"""
+        Render the progress bars.
+        """
+
+        stats = self.stats()
+        if not self._bars:
+            self._bars.append(self._tqdm_auto_.tqdm(
+                total=100., desc='Overall', position=0,
+            ))
+        overall, *bars = self._bars
+
+        n_done = sum(s.done for s in stats)
+        overall.n = (
+            100. * sum(s.progress for s in stats) / len(stats)
+            if stats else 0.
+        )
+        overall.set_postfix_str(
+            f'{n_done}/{len(stats)} done, '
+            f'{sum(s.rate or 0. for s in stats if not s.done):.0f} ts/s',
+            refresh=False,
+        )
+        overall.refresh()
+
+        rows = sorted(
+            (s for s in stats if not s.done),
+            key=lambda s: s.eta if s.eta is not None else _datetime_.timedelta.max,
+            reverse=True,
+        )[:self._max_rows]
+        while len(bars) < len(rows):
+            bars.append(self._tqdm_auto_.tqdm(
+                total=100., position=len(bars) + 1, leave=False,
+            ))
+            self._bars.append(bars[-1])
+        for i, bar in enumerate(bars):
+            if i >= len(rows):
+                bar.reset()
+                bar.set_description_str('', refresh=False)
+                bar.set_postfix_str('')
+                continue
+            s = rows[i]
+            bar.n = 100. * s.progress
+            bar.set_description_str(s.name, refresh=False)
+            bar.set_postfix_str(
+                f'{s.rate or 0.:.0f} ts/s, ETA '
+                + (str(s.eta).split('.')[0] if s.eta is not None else '?'),
+            )
+
+    def _run(self):
+        queue = self.queue
+        rendered = float('-inf')
+        running = True
+        while running:
+            try:
+                report = queue.get(timeout=self._interval)
+                if report is None:
+                    running = False
+                else:
+                    self._update(report)
+            except _queue_.Empty:
+                pass
+            if not running or _time_.monotonic() - rendered >= self._interval:
+                self.render()
+                rendered = _time_.monotonic()
+
+    def start(self):
+        r"""
+        Start collecting and rendering reports in a background thread.
+        """
+
+        if self._thread is not None:
+            raise RuntimeError(f'{self!r} is already running')
+        self.queue
+        self._thread = _threading_.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        r"""
+        Stop collecting reports (after those already sent) 
+        and close the progress bars.
+        """
+
+        if self._thread is None:
+            raise RuntimeError(f'{self!r} is not running')
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        for bar in self._bars:
+            bar.close()
+        self._bars = []
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager, self._queue = None, None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
 __all__ = [
     'ProgressLogger',
+    'ProgressStats',
+    'ProgressReporter',
+    'ProgressDashboard',
 ]
\ No newline at end of file
@@ -4,10 +4,25 @@ Model classes.
 
 
 from .building import BuildingModel
-from .weather import WeatherModel
+from .index import BuildingIndex, ObjectKey
+from .weather import (
+    WeatherModel,
+    WeatherTransform,
+    WeatherOffset,
+    WeatherScale,
+    WeatherNoise,
+    WeatherYearShuffle,
+)
 
 
 __all__ = [
     'BuildingModel',
+    'BuildingIndex',
+    'ObjectKey',
     'WeatherModel',
+    'WeatherTransform',
+    'WeatherOffset',
+    'WeatherScale',
+    'WeatherNoise',
+    'WeatherYearShuffle',
 ]
@@ -1,15 +1,177 @@
 r"""
-TODO
+Building models.
+
+Scope: Loading and dumping of EnergyPlus building models (epJSON).
 """
 
 
 import collections as _collections_
+import collections.abc as _collections_abc_
+import functools as _functools_
+import io as _io_
 import json as _json_
 import os as _os_
-import tempfile as _tempfile_
-from typing import Self
+import re as _re_
+from typing import Any, Iterator, NamedTuple, Self
+
+import numpy as _numpy_
 
 from .. import _kernel as _kernel_
+from . import idf as _idf_
+
+
+try: import orjson as _orjson_
+except ModuleNotFoundError:
+    _orjson_ = None
+
+try: import simdjson as _simdjson_
+except ModuleNotFoundError:
+    _simdjson_ = None
+
+
+def _loads(buffer: bytes) -> Any:
+    r"""
+    Deserialize JSON,
+    with an accelerated library if installed (`orjson` or `simdjson`).
+    """
+
+    if _orjson_ is not None:
+        return _orjson_.loads(buffer)
+    if _simdjson_ is not None:
+        return _simdjson_.loads(buffer)
+    return _json_.loads(buffer)
+
+
+def _dumps(obj: Any) -> bytes:
+    r"""
+    Serialize JSON,
+    with an accelerated library if installed (`orjson`).
+    """
+
+    if _orjson_ is not None:
+        try: return _orjson_.dumps(obj)
+        except TypeError:
+            pass
+    return _json_.dumps(obj).encode()
+
+
+class _RawSection(NamedTuple):
+    r"""
+    Serialized (i.e. not yet parsed) value of a top-level section.
+    """
+
+    buffer: bytes
+
+
+def _index_sections(buffer: bytes) -> dict[str, _RawSection] | None:
+    r"""
+    Index the top-level sections of a JSON object without parsing them.
+
+    :param buffer: The serialized JSON object.
+    :return:
+        The serialized values keyed by their (parsed) keys, in order;
+        or `None` if the buffer is not an object 
+        of which all values are objects or arrays.
+    """
+
+    a = _numpy_.frombuffer(buffer, dtype=_numpy_.uint8)
+
+    # quotes delimiting strings, i.e. those not escaped
+    quotes = _numpy_.flatnonzero(a == ord('"'))
+    escaped = []
+    for i in _numpy_.flatnonzero(a[_numpy_.maximum(quotes - 1, 0)] == ord('\\')).tolist():
+        n, q = 0, int(quotes[i])
+        while q - n > 0 and buffer[q - n - 1] == ord('\\'):
+            n += 1
+        if n % 2 == 1:
+            escaped.append(i)
+    quotes = _numpy_.delete(quotes, escaped)
+
+    # brackets outside strings
+    brackets = _numpy_.flatnonzero(
+        (a == ord('{')) | (a == ord('}'))
+        | (a == ord('[')) | (a == ord(']'))
+    )
+    brackets = brackets[_numpy_.searchsorted(quotes, brackets) % 2 == 0]
+    if len(brackets) == 0 or a[brackets[0]] != ord('{'):
+        return None
+    opening = (a[brackets] == ord('{')) | (a[brackets] == ord('['))
+    depths = _numpy_.cumsum(_numpy_.where(opening, 1, -1))
+
+    starts = brackets[opening & (depths == 2)].tolist()
+    stops = (brackets[~opening & (depths == 1)] + 1).tolist()
+    end = int(brackets[-1])
+    if depths[-1] != 0 or buffer[end + 1:].strip():
+        return None
+
+    # NOTE only whitespaces, keys and delimiters are allowed in between
+    res = dict()
+    prev = int(brackets[0]) + 1
+    for start, stop in zip(starts, stops):
+        match = _SECTION_KEY_PATTERN.fullmatch(buffer, prev, start)
+        if match is None or (match.group(1) is None) == bool(res):
+            return None
+        res[_json_.loads(match.group(2))] = _RawSection(buffer[start:stop])
+        prev = stop
+    if buffer[prev:end].strip():
+        return None
+    return res
+
+
+_SECTION_KEY_PATTERN = _re_.compile(
+    rb'\s*(,)?\s*("(?:[^"\\]|\\.)*")\s*:\s*', 
+    flags=_re_.DOTALL,
+)
+
+
+class _LazySections(_collections_abc_.MutableMapping):
+    r"""
+    Mapping of top-level sections, parsed upon access.
+    """
+
+    def __init__(self, sections: dict[str, Any] = dict()):
+        self._sections = dict(sections)
+
+    def __getitem__(self, key):
+        value = self._sections[key]
+        if isinstance(value, _RawSection):
+            value = self._sections[key] = _loads(value.buffer)
+        return value
+
+    def __setitem__(self, key, value):
+        self._sections[key] = value
+
+    def __delitem__(self, key):
+        del self._sections[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __contains__(self, key):
+        return key in self._sections
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self) -> '_LazySections':
+        return type(self)(self._sections)
+
+    def dumps(self) -> bytes:
+        r"""
+        Serialize the sections.
+        Sections never accessed are serialized as loaded, byte-for-byte.
+        """
+
+        return b'{' + b','.join(
+            _dumps(key) + b':' + (
+                value.buffer if isinstance(value, _RawSection) else
+                _dumps(value)
+            )
+            for key, value in self._sections.items()
+        ) + b'}'
 
 
 class BuildingModel(_collections_.UserDict):
@@ -17,12 +179,69 @@ class BuildingModel(_collections_.UserDict):
     The building model.
     This represents an epJSON object.
 
+    Models are loaded lazily:
+    the top-level sections (i.e. object types) are indexed upon loading,
+    and each section is only parsed when first accessed.
+    Sections never accessed are dumped byte-for-byte as loaded.
+    JSON is (de)serialized with `orjson` or `simdjson` if installed.
+
+    .. doctest::
+
+        >>> building = BuildingModel.from_buffer(
+        ...     b'{"Version": {"Version 1": {"version_identifier": "24.1"}},'
+        ...     b' "Zone": {"ZONE ONE": {}}}'
+        ... )
+        >>> list(building.keys())
+        ['Version', 'Zone']
+        >>> building['Zone']['ZONE TWO'] = {}
+        >>> building.dumps()
+        b'{"Version":{"Version 1": {"version_identifier": "24.1"}},"Zone":{"ZONE ONE":{},"ZONE TWO":{}}}'
+
+    IDF files are converted in-process with :mod:`.idf`,
+    based on the epJSON schema of the kernel.
+
+    .. note::
+        Syntax errors within a section are only raised
+        when the section is accessed.
+
     .. seealso:: https://energyplus.readthedocs.io/en/latest/schema.html
     """
 
+    def __init__(self, dict=None, /, **kwargs):
+        if isinstance(dict, BuildingModel) and isinstance(dict.data, _LazySections):
+            super().__init__()
+            self.data = dict.data.copy()
+            self.data.update(kwargs)
+            return
+        super().__init__(dict, **kwargs)
+
+    def copy(self) -> Self:
+        return type(self)(self)
+
+    @_functools_.cached_property
+    def index(self) -> '_index_.BuildingIndex':
+        r"""
+        Secondary indices for querying this model.
+
+        .. seealso:: :class:`.index.BuildingIndex`
+        """
+
+        from . import index as _index_
+        return _index_.BuildingIndex(self)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if 'index' in self.__dict__:
+            self.index.invalidate(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        if 'index' in self.__dict__:
+            self.index.invalidate(key)
+
     @classmethod
     def from_buffer(cls, buffer: bytes):
-        return cls().load(buffer)
+        return cls().loads(buffer)
 
     @classmethod
     def from_file(cls, path: _os_.PathLike):
@@ -30,64 +249,85 @@ class BuildingModel(_collections_.UserDict):
 
     Formats = _kernel_.InputFormats
 
-    def load(self, fp):
-        self.data = _json_.load(fp)
+    def loads(self, buffer: bytes | str) -> Self:
+        r"""
+        Load from a serialized epJSON object.
+
+        :param buffer: The serialized epJSON object.
+        :return: This model.
+        """
+
+        if isinstance(buffer, str):
+            buffer = buffer.encode()
+        sections = _index_sections(buffer)
+        self.data = (
+            _LazySections(sections) if sections is not None else
+            _loads(buffer)
+        )
         return self
 
+    def dumps(self) -> bytes:
+        r"""
+        Serialize to an epJSON object.
+
+        :return: The serialized epJSON object.
+        """
+
+        if isinstance(self.data, _LazySections):
+            return self.data.dumps()
+        return _dumps(self.data)
+
+    def load(self, fp):
+        return self.loads(fp.read())
+
     def dump(self, fp):
-        _json_.dump(self.data, fp)
+        buffer = self.dumps()
+        fp.write(buffer.decode() if isinstance(fp, _io_.TextIOBase) else buffer)
         return fp
-    
+
     def loadf(
-        self, 
-        path: _os_.PathLike, 
+        self,
+        path: _os_.PathLike,
         format: Formats = None,
     ) -> Self:
         format = (
-            format if format is not None else 
+            format if format is not None else
             _kernel_.infer_format_from_path(path)
         )
         match format:
             case 'json':
-                path = path
+                with open(path, mode='rb') as fp:
+                    self.load(fp)
             case 'idf':
-                tempdir_ref = _tempfile_.TemporaryDirectory()
-                path = _kernel_.convert_idf_to_epjson(
-                    input_file=path,
-                    output_directory=tempdir_ref.name,
-                )
+                with open(path, mode='r') as fp:
+                    self.data = _idf_.load(fp)
             case _:
                 raise ValueError()
 
-        with open(path, mode='r') as fp:
-            self.load(fp)
-
         return self
-    
+
     def dumpf(
-        self, 
+        self,
         path: _os_.PathLike,
         format: Formats = None,
     ) -> _os_.PathLike:
         format = (
-            format if format is not None else 
+            format if format is not None else
             _kernel_.infer_format_from_path(path)
         )
         match format:
             case 'json':
-                path = path
-            # TODO
+                with open(path, mode='wb') as fp:
+                    self.dump(fp)
             case 'idf':
-                raise NotImplementedError('TODO')
+                with open(path, mode='w') as fp:
+                    _idf_.dump(self, fp)
             case _:
                 raise ValueError()
-            
-        with open(path, mode='w') as fp:
-            self.dump(fp)
 
         return path
-    
+
 
 __all__ = [
     'BuildingModel',
-]
\ No newline at end of file
+]
@@ -0,0 +1,372 @@
+r"""
+Input Data Files (IDF).
+
+Scope: Conversion between IDF and epJSON in pure Python,
+driven by the epJSON schema of the kernel.
+
+.. seealso:: https://energyplus.readthedocs.io/en/latest/schema.html
+"""
+
+
+import functools as _functools_
+import json as _json_
+import os as _os_
+import pathlib as _pathlib_
+from typing import Any, Iterable, Iterator, TextIO
+
+
+class Schema:
+    r"""
+    The epJSON schema, indexed for IDF conversion.
+
+    .. doctest::
+
+        >>> schema = Schema({'properties': {
+        ...     'Zone': {
+        ...         'name': {'type': 'string'},
+        ...         'patternProperties': {'.*': {'properties': {
+        ...             'x_origin': {'type': 'number'},
+        ...         }}},
+        ...         'legacy_idd': {
+        ...             'field_info': {
+        ...                 'name': {'field_name': 'Name', 'field_type': 'a'},
+        ...                 'x_origin': {'field_name': 'X Origin', 'field_type': 'n'},
+        ...             },
+        ...             'fields': ['name', 'x_origin'],
+        ...         },
+        ...     },
+        ... }})
+        >>> data = read(['ZONE, Zone One, 1.5;  ! a comment'], schema=schema)
+        >>> data
+        {'Zone': {'Zone One': {'x_origin': 1.5}}}
+        >>> print(''.join(write(data, schema=schema)), end='')
+        Zone,
+            Zone One,                !- Name
+            1.5;                     !- X Origin
+        <BLANKLINE>
+    """
+
+    FILENAME = 'Energy+.schema.epJSON'
+    r"""The file name of the schema shipped with the kernel."""
+
+    class ObjectType:
+        r"""
+        Schema of an object type.
+        """
+
+        def __init__(self, name: str, schema: dict):
+            self.name = name
+            self.named = 'name' in schema
+            legacy_idd = schema.get('legacy_idd', dict())
+            self.field_info: dict[str, dict] = legacy_idd.get('field_info', dict())
+            self.extensibles: list[str] = legacy_idd.get('extensibles', [])
+            self.extension: str | None = legacy_idd.get('extension')
+            self.fields: list[str] = [
+                field for field in legacy_idd.get('fields', [])
+                if field not in self.extensibles
+            ]
+
+            properties = (
+                next(iter(schema.get('patternProperties', dict()).values()), dict())
+                .get('properties', dict())
+            )
+            self._properties: dict[str, dict] = dict(properties)
+            if self.extension is not None:
+                self._properties.update(
+                    properties.get(self.extension, dict())
+                    .get('items', dict())
+                    .get('properties', dict())
+                )
+
+        def __repr__(self):
+            return f'{type(self).__name__}({self.name!r})'
+
+        @_functools_.cached_property
+        def _enums(self) -> dict[str, dict[str, str]]:
+            r"""
+            Enumerated values of the fields,
+            keyed by their lower-case forms.
+            """
+
+            def collect(prop: dict) -> Iterator[str]:
+                yield from prop.get('enum', [])
+                for alternative in prop.get('anyOf', []):
+                    yield from collect(alternative)
+
+            return {
+                field: {str(v).lower(): v for v in collect(prop)}
+                for field, prop in self._properties.items()
+            }
+
+        @_functools_.cached_property
+        def reference_fields(self) -> set[str]:
+            r"""
+            Fields referencing other objects by name
+            (i.e. of the `object_list` data type),
+            including those of extensible groups.
+            """
+
+            return {
+                field for field, prop in self._properties.items()
+                if prop.get('data_type') == 'object_list'
+            }
+
+        def _is_numeric(self, field: str) -> bool:
+            info = self.field_info.get(field)
+            if info is not None:
+                return info.get('field_type') == 'n'
+            return self._properties.get(field, dict()).get('type') == 'number'
+
+        def parse_value(self, field: str, value: str) -> Any:
+            r"""
+            Parse the IDF value of a field into its epJSON value.
+            """
+
+            enum = self._enums.get(field, dict())
+            if value.lower() in enum:
+                return enum[value.lower()]
+            if self._is_numeric(field):
+                try:
+                    number = float(value)
+                    if number.is_integer() and not any(c in value for c in '.eE'):
+                        return int(number)
+                    return number
+                except ValueError:
+                    pass
+            return value
+
+        @staticmethod
+        def format_value(value: Any) -> str:
+            r"""
+            Format the epJSON value of a field into its IDF value.
+            """
+
+            match value:
+                case bool():
+                    return 'Yes' if value else 'No'
+                case float():
+                    return repr(value)
+                case _:
+                    return str(value)
+
+        def field_name(self, field: str) -> str:
+            return self.field_info.get(field, dict()).get('field_name', field)
+
+    def __init__(self, schema: dict):
+        r"""
+        Initialize the schema.
+
+        :param schema: The epJSON schema.
+        """
+
+        self._object_types = {
+            name: self.ObjectType(name, object_schema)
+            for name, object_schema in schema.get('properties', dict()).items()
+        }
+        self._object_types_by_lower_name = {
+            name.lower(): object_type
+            for name, object_type in self._object_types.items()
+        }
+
+    def __getitem__(self, name: str) -> ObjectType:
+        r"""
+        Get the schema of an object type, by its (case-insensitive) name.
+
+        :raises KeyError: If the object type is unknown.
+        """
+
+        try: return self._object_types_by_lower_name[name.lower()]
+        except KeyError:
+            raise KeyError(f'Unknown object type: {name!r}')
+
+    @classmethod
+    def from_file(cls, path: _os_.PathLike):
+        with open(path, mode='rb') as fp:
+            return cls(_json_.load(fp))
+
+    @classmethod
+    @_functools_.cache
+    def default(cls) -> 'Schema':
+        r"""
+        Get the schema of the installed kernel.
+        This is located from the environment variable `ENERGYPLUS_SCHEMA`,
+        or else within the installation of `energyplus-core`.
+
+        :raises FileNotFoundError: If the schema cannot be located.
+        """
+
+        path = _os_.environ.get('ENERGYPLUS_SCHEMA')
+        if path is None:
+            try:
+                import energyplus.core as _energyplus_core_
+                path = next(
+                    p
+                    for root in _energyplus_core_.__path__
+                    for p in _pathlib_.Path(root).rglob(cls.FILENAME)
+                )
+            except (ModuleNotFoundError, StopIteration):
+                raise FileNotFoundError(
+                    f'Schema {cls.FILENAME!r} not found; '
+                    f'Install `energyplus-core` or '
+                    f'set the environment variable `ENERGYPLUS_SCHEMA`'
+                )
+        return cls.from_file(path)
+
+
+def tokenize(lines: Iterable[str]) -> Iterator[list[str]]:
+    r"""
+    Tokenize IDF lines into objects.
+    Comments are stripped; fields are stripped of whitespaces.
+
+    :param lines: The lines, e.g. an IDF file opened in text mode.
+    :return: The objects, each as a list of the object type and its fields.
+    """
+
+    fields: list[str] = []
+    partial = ''
+    for line in lines:
+        line, *_ = line.split('!', 1)
+        while True:
+            i_comma, i_semicolon = line.find(','), line.find(';')
+            if i_comma == -1 and i_semicolon == -1:
+                partial += line
+                break
+            i = (
+                i_semicolon if i_comma == -1 else
+                i_comma if i_semicolon == -1 else
+                min(i_comma, i_semicolon)
+            )
+            fields.append((partial + line[:i]).strip())
+            partial, line = '', line[i + 1:]
+            if i == i_semicolon:
+                yield fields
+                fields = []
+    if fields or partial.strip():
+        raise ValueError(f'Unterminated object: {fields + [partial.strip()]!r}')
+
+
+def read(lines: Iterable[str], schema: Schema | None = None) -> dict:
+    r"""
+    Read IDF into epJSON.
+
+    :param lines: The IDF lines, e.g. an IDF file opened in text mode.
+    :param schema: The schema. If `None`, :meth:`Schema.default`.
+    :return: The epJSON object.
+    :raises KeyError: If any of the object types is unknown.
+    """
+
+    schema = schema if schema is not None else Schema.default()
+
+    res: dict[str, dict[str, dict]] = dict()
+    for object_type_name, *values in tokenize(lines):
+        object_type = schema[object_type_name]
+        objects = res.setdefault(object_type.name, dict())
+
+        fields = object_type.fields
+        if object_type.named:
+            # NOTE name is the first field
+            name, *values = values or ['']
+            fields = fields[1:]
+        else:
+            name = f'{object_type.name} {len(objects) + 1}'
+
+        obj = {
+            field: object_type.parse_value(field, value)
+            for field, value in zip(fields, values)
+            if value != ''
+        }
+
+        extensibles = object_type.extensibles
+        rest = values[len(fields):]
+        if extensibles and rest:
+            obj[object_type.extension] = [
+                {
+                    field: object_type.parse_value(field, value)
+                    for field, value in zip(extensibles, group)
+                    if value != ''
+                }
+                for group in (
+                    rest[i:i + len(extensibles)]
+                    for i in range(0, len(rest), len(extensibles))
+                )
+            ]
+
+        objects[name] = obj
+    return res
+
+
+def write(data: dict, schema: Schema | None = None) -> Iterator[str]:
+    r"""
+    Write epJSON into IDF.
+
+    :param data: The epJSON object.
+    :param schema: The schema. If `None`, :meth:`Schema.default`.
+    :return: The IDF, chunk by chunk (one per object).
+    :raises KeyError: If any of the object types is unknown.
+    """
+
+    schema = schema if schema is not None else Schema.default()
+
+    for object_type_name, objects in data.items():
+        object_type = schema[object_type_name]
+        for name, obj in objects.items():
+            entries = []
+            if object_type.named:
+                entries.append((name, object_type.field_name('name')))
+            entries.extend(
+                (
+                    object_type.format_value(obj[field]) if field in obj else '',
+                    object_type.field_name(field),
+                )
+                for field in object_type.fields
+                if field != 'name' or not object_type.named
+            )
+            for group in obj.get(object_type.extension, []) if object_type.extension else []:
+                entries.extend(
+                    (
+                        object_type.format_value(group[field]) if field in group else '',
+                        object_type.field_name(field),
+                    )
+                    for field in object_type.extensibles
+                )
+
+            # NOTE trailing empty fields are omitted
+            while entries and entries[-1][0] == '':
+                entries.pop()
+
+            lines = [f'{object_type.name},' if entries else f'{object_type.name};']
+            for i, (value, field_name) in enumerate(entries):
+                value = value + (';' if i == len(entries) - 1 else ',')
+                lines.append(f'    {value:<24} !- {field_name}')
+            yield '\n'.join(lines) + '\n\n'
+
+
+def load(fp: TextIO, schema: Schema | None = None) -> dict:
+    r"""
+    Load an IDF file into epJSON.
+
+    .. seealso:: :func:`read`
+    """
+
+    return read(fp, schema=schema)
+
+
+def dump(data: dict, fp: TextIO, schema: Schema | None = None) -> TextIO:
+    r"""
+    Dump epJSON into an IDF file.
+
+    .. seealso:: :func:`write`
+    """
+
+    fp.writelines(write(data, schema=schema))
+    return fp
+
+
+__all__ = [
+    'Schema',
+    'tokenize',
+    'read',
+    'write',
+    'load',
+    'dump',
+]
@@ -0,0 +1,294 @@
+r"""
+Building model indices.
+
+Scope: Queries over building models by object type, name and reference,
+without running the kernel.
+"""
+
+
+import fnmatch as _fnmatch_
+import functools as _functools_
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
+
+from .idf import Schema
+
+if TYPE_CHECKING:
+    from .building import BuildingModel
+
+
+class ObjectKey(NamedTuple):
+    r"""
+    Key of an object in a building model.
+    """
+
+    type: str
+    r"""The object type."""
+    name: str
+    r"""The name of the object."""
+
+
+class Reference(NamedTuple):
+    r"""
+    Reference from a field of an object to another object (by name).
+    """
+
+    source: ObjectKey
+    r"""The referencing object."""
+    field: str
+    r"""The referencing field."""
+    name: str
+    r"""The referenced name, as in the field."""
+
+
+class BuildingIndex:
+    r"""
+    Secondary indices over a building model, built on demand.
+
+    * Object type to names (:meth:`names`),
+        per section (i.e. only the queried sections are parsed).
+    * Name to object types (:meth:`types`)
+        and name to references (:meth:`references`),
+        over the whole model.
+    * Zone to equipment (:meth:`zone_equipment`),
+        via `ZoneHVAC:EquipmentConnections` and `ZoneHVAC:EquipmentList`.
+
+    Names are matched case-insensitively, as in the kernel.
+    Indices are invalidated when sections are added, replaced or removed,
+    or when objects are added to, removed from or renamed in sections;
+    call :meth:`invalidate` after modifying the fields of objects in place.
+
+    .. doctest::
+
+        >>> from controllables.energyplus.models import BuildingModel
+        >>> building = BuildingModel({
+        ...     'Zone': {'ZONE ONE': {}},
+        ...     'ZoneHVAC:IdealLoadsAirSystem': {'IDEAL': {}},
+        ...     'ZoneHVAC:EquipmentConnections': {'CONN': {
+        ...         'zone_name': 'Zone One',
+        ...         'zone_conditioning_equipment_list_name': 'EQUIPMENT',
+        ...     }},
+        ...     'ZoneHVAC:EquipmentList': {'EQUIPMENT': {'equipment': [{
+        ...         'zone_equipment_object_type': 'ZoneHVAC:IdealLoadsAirSystem',
+        ...         'zone_equipment_name': 'IDEAL',
+        ...     }]}},
+        ... })
+        >>> building.index.names('ZoneHVAC:*Equipment*')
+        [ObjectKey(type='ZoneHVAC:EquipmentConnections', name='CONN'), ObjectKey(type='ZoneHVAC:EquipmentList', name='EQUIPMENT')]
+        >>> building.index.zone_equipment('zone one')
+        [ObjectKey(type='ZoneHVAC:IdealLoadsAirSystem', name='IDEAL')]
+        >>> [r.source for r in building.index.references('ZONE ONE')]
+        [ObjectKey(type='ZoneHVAC:EquipmentConnections', name='CONN')]
+    """
+
+    def __init__(
+        self,
+        building: 'BuildingModel',
+        schema: Schema | None = None,
+    ):
+        r"""
+        Initialize the index.
+
+        :param building: The building model.
+        :param schema:
+            The epJSON schema.
+            If provided, only fields of the `object_list` data type
+            are considered references;
+            otherwise any string matching the name of an object is.
+        """
+
+        self._building = building
+        self._schema = schema
+        self._signatures: dict[str, tuple[int, tuple[str, ...]]] = dict()
+
+    def invalidate(self, object_type: str | None = None):
+        r"""
+        Invalidate the indices.
+
+        :param object_type:
+            The object type whose section has changed.
+            If `None`, all indices are invalidated.
+        """
+
+        if object_type is not None:
+            self._by_type.pop(object_type, None)
+        else:
+            self._by_type.clear()
+        self._signatures.clear()
+        for attr in ('_by_name', '_references', '_zone_equipment'):
+            self.__dict__.pop(attr, None)
+
+    def _check(self, object_type: str):
+        r"""
+        Invalidate the indices if a section has changed
+        since it was last indexed.
+        """
+
+        section = self._building.get(object_type)
+        # NOTE the names (rather than their number) of the objects,
+        # such that objects renamed in place are detected
+        signature = (
+            (id(section), tuple(section.keys())) if section is not None else
+            None
+        )
+        if self._signatures.get(object_type, signature) != signature:
+            self.invalidate(object_type)
+        self._signatures[object_type] = signature
+
+    def _check_all(self):
+        for object_type in set(self._building.keys()) | set(self._signatures):
+            self._check(object_type)
+
+    @_functools_.cached_property
+    def _by_type(self) -> dict[str, list[ObjectKey]]:
+        return dict()
+
+    def object_types(self, pattern: str = '*') -> list[str]:
+        r"""
+        Get the object types present in the building model.
+
+        :param pattern: The object type or a pattern thereof (:mod:`fnmatch`).
+        :return: The matching object types, in order.
+        """
+
+        return [
+            object_type for object_type in self._building.keys()
+            if _fnmatch_.fnmatchcase(object_type, pattern)
+        ]
+
+    def names(self, pattern: str) -> list[ObjectKey]:
+        r"""
+        Get the objects of an object type.
+
+        :param pattern: The object type or a pattern thereof (:mod:`fnmatch`).
+        :return: The keys of the objects, in order.
+        """
+
+        res = []
+        for object_type in self.object_types(pattern):
+            self._check(object_type)
+            if object_type not in self._by_type:
+                self._by_type[object_type] = [
+                    ObjectKey(object_type, name)
+                    for name in self._building[object_type].keys()
+                ]
+            res.extend(self._by_type[object_type])
+        return res
+
+    @_functools_.cached_property
+    def _by_name(self) -> dict[str, list[ObjectKey]]:
+        res = dict()
+        for key in self.names('*'):
+            res.setdefault(key.name.lower(), []).append(key)
+        return res
+
+    def types(self, name: str) -> list[ObjectKey]:
+        r"""
+        Get the objects of a name.
+
+        :param name: The name (case-insensitive).
+        :return: The keys of the objects, of any object type.
+        """
+
+        self._check_all()
+        return list(self._by_name.get(name.lower(), []))
+
+    def _reference_fields(self, object_type: str) -> set[str] | None:
+        if self._schema is None:
+            return None
+        try: return self._schema[object_type].reference_fields
+        except KeyError:
+            return set()
+
+    @staticmethod
+    def _iter_strings(obj: dict) -> Iterator[tuple[str, str]]:
+        for field, value in obj.items():
+            match value:
+                case str():
+                    yield field, value
+                case list():
+                    for item in value:
+                        if isinstance(item, dict):
+                            yield from BuildingIndex._iter_strings(item)
+
+    @_functools_.cached_property
+    def _references(self) -> dict[str, list[Reference]]:
+        names = self._by_name
+        res = dict()
+        for object_type in self._building.keys():
+            fields = self._reference_fields(object_type)
+            for name, obj in self._building[object_type].items():
+                source = ObjectKey(object_type, name)
+                for field, value in self._iter_strings(obj):
+                    if fields is not None and field not in fields:
+                        continue
+                    if value.lower() not in names:
+                        continue
+                    res.setdefault(value.lower(), []).append(
+                        Reference(source=source, field=field, name=value)
+                    )
+        return res
+
+    def references(self, name: str) -> list[Reference]:
+        r"""
+        Get the references to a name.
+
+        :param name: The referenced name (case-insensitive).
+        :return: The references, in order of the referencing objects.
+        """
+
+        self._check_all()
+        return list(self._references.get(name.lower(), []))
+
+    def get(self, key: ObjectKey) -> dict[str, Any]:
+        r"""
+        Get an object by its key.
+
+        :param key: The key of the object.
+        :return: The object.
+        """
+
+        return self._building[key.type][key.name]
+
+    @_functools_.cached_property
+    def _zone_equipment(self) -> dict[str, list[ObjectKey]]:
+        lists = {
+            key.name.lower(): self.get(key)
+            for key in self.names('ZoneHVAC:EquipmentList')
+        }
+        res = dict()
+        for key in self.names('ZoneHVAC:EquipmentConnections'):
+            connections = self.get(key)
+            zone = connections.get('zone_name')
+            equipment_list = lists.get(
+                str(connections.get('zone_conditioning_equipment_list_name', '')).lower()
+            )
+            if zone is None or equipment_list is None:
+                continue
+            res.setdefault(zone.lower(), []).extend(
+                ObjectKey(
+                    equipment['zone_equipment_object_type'],
+                    equipment['zone_equipment_name'],
+                )
+                for equipment in equipment_list.get('equipment', [])
+                if 'zone_equipment_object_type' in equipment
+                and 'zone_equipment_name' in equipment
+            )
+        return res
+
+    def zone_equipment(self, zone: str) -> list[ObjectKey]:
+        r"""
+        Get the equipment serving a zone.
+
+        :param zone: The name of the zone (case-insensitive).
+        :return: The keys of the equipment, in order of priority.
+        """
+
+        self._check_all()
+        return list(self._zone_equipment.get(zone.lower(), []))
+
+
+__all__ = [
+    'ObjectKey',
+    'Reference',
+    'BuildingIndex',
+]
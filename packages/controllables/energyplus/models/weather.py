@@ -1,10 +1,25 @@
 r"""
-TODO !!!!!!
+Weather models.
+
+Scope: Parsing of EnergyPlus weather (EPW) files
+into columnar arrays for fast access by time, 
+and in-memory transformation thereof.
+
+.. seealso::
+    https://bigladdersoftware.com/epx/docs/24-1/auxiliary-programs/energyplus-weather-file-epw-data-dictionary.html
 """
 
 
 import abc as _abc_
+import csv as _csv_
+import datetime as _datetime_
+import functools as _functools_
+import math as _math_
 import os as _os_
+import tempfile as _tempfile_
+from typing import Iterable, NamedTuple, Sequence
+
+import numpy as _numpy_
 
 
 # TODO deprecate!!!!
@@ -25,11 +40,572 @@ class FileBacked(_abc_.ABC):
         return self._path
 
 
-# TODO !!!!!
+class WeatherField(NamedTuple):
+    r"""
+    Field of weather data records.
+
+    :param name: The name of the field.
+    :param dtype: The NumPy data type of the field.
+    :param missing: The value indicating missing data.
+    """
+
+    name: str
+    dtype: str
+    missing: float | int | str | None = None
+
+
 class WeatherModel(FileBacked):
-    pass
+    r"""
+    The weather model.
+    This represents an EnergyPlus weather (EPW) file.
+
+    Data records are parsed into a NumPy structured array,
+    i.e. one column per field of :attr:`FIELDS`,
+    in the order of the records in the file.
+    The array is cached as a binary file next to the weather file
+    (`.<name>.v<version>.npy`, if the directory is writable)
+    and memory-mapped upon subsequent loads.
+
+    .. code-block:: python
+
+        weather = WeatherModel('USA_CO_Denver.epw')
+        # next 24 h of dry bulb temperatures
+        weather.window(
+            system['time'].value, hours=24.,
+            fields='dry_bulb_temperature',
+        )
+
+    .. note::
+        Records are assumed to be contiguous in time.
+        Lookups by time are relative to the time of the year
+        (i.e. the year of the records is ignored) and
+        wrap around the end of the records.
+    """
+
+    HEADER_NAMES = [
+        'LOCATION',
+        'DESIGN CONDITIONS',
+        'TYPICAL/EXTREME PERIODS',
+        'GROUND TEMPERATURES',
+        'HOLIDAYS/DAYLIGHT SAVINGS',
+        'COMMENTS 1',
+        'COMMENTS 2',
+        'DATA PERIODS',
+    ]
+    r"""Names of the header lines, in order."""
+
+    FIELDS = [
+        WeatherField('year', 'i4'),
+        WeatherField('month', 'i4'),
+        WeatherField('day', 'i4'),
+        WeatherField('hour', 'i4'),
+        WeatherField('minute', 'i4'),
+        WeatherField('data_source_and_uncertainty_flags', 'U', ''),
+        WeatherField('dry_bulb_temperature', 'f8', 99.9),
+        WeatherField('dew_point_temperature', 'f8', 99.9),
+        WeatherField('relative_humidity', 'f8', 999.),
+        WeatherField('atmospheric_station_pressure', 'f8', 999999.),
+        WeatherField('extraterrestrial_horizontal_radiation', 'f8', 9999.),
+        WeatherField('extraterrestrial_direct_normal_radiation', 'f8', 9999.),
+        WeatherField('horizontal_infrared_radiation_intensity', 'f8', 9999.),
+        WeatherField('global_horizontal_radiation', 'f8', 9999.),
+        WeatherField('direct_normal_radiation', 'f8', 9999.),
+        WeatherField('diffuse_horizontal_radiation', 'f8', 9999.),
+        WeatherField('global_horizontal_illuminance', 'f8', 999999.),
+        WeatherField('direct_normal_illuminance', 'f8', 999999.),
+        WeatherField('diffuse_horizontal_illuminance', 'f8', 999999.),
+        WeatherField('zenith_luminance', 'f8', 9999.),
+        WeatherField('wind_direction', 'f8', 999.),
+        WeatherField('wind_speed', 'f8', 999.),
+        WeatherField('total_sky_cover', 'f8', 99.),
+        WeatherField('opaque_sky_cover', 'f8', 99.),
+        WeatherField('visibility', 'f8', 9999.),
+        WeatherField('ceiling_height', 'f8', 99999.),
+        WeatherField('present_weather_observation', 'f8', 9.),
+        WeatherField('present_weather_codes', 'U', '999999999'),
+        WeatherField('precipitable_water', 'f8', 999.),
+        WeatherField('aerosol_optical_depth', 'f8', .999),
+        WeatherField('snow_depth', 'f8', 999.),
+        WeatherField('days_since_last_snowfall', 'f8', 99.),
+        WeatherField('albedo', 'f8', 999.),
+        WeatherField('liquid_precipitation_depth', 'f8', 999.),
+        WeatherField('liquid_precipitation_quantity', 'f8', 99.),
+    ]
+    r"""Fields of the data records, in order."""
+
+    _CACHE_VERSION = 1
+
+    def __init__(self, path: _os_.PathLike = None):
+        r"""
+        Initialize the weather model.
+
+        :param path: The path to the weather file, if any.
+        """
+
+        self._source: WeatherModel | None = None
+        self._transforms: tuple[WeatherTransform, ...] = tuple()
+        self._seed = None
+        super().__init__(path)
+
+    @classmethod
+    def from_file(cls, path: _os_.PathLike):
+        return cls(path)
+
+    def __repr__(self):
+        if self._source is not None:
+            return (
+                f'{type(self).__name__}'
+                f'({self._source!r}, transforms={list(self._transforms)!r})'
+            )
+        return f'{type(self).__name__}({self._path!r})'
+
+    def open(self, path: _os_.PathLike) -> 'WeatherModel':
+        for attr in ('headers', 'data', '_index_base'):
+            self.__dict__.pop(attr, None)
+        self._source, self._transforms = None, tuple()
+        return super().open(path)
+
+    @property
+    def backed(self) -> bool:
+        r"""
+        Whether this model is backed by a weather file as is.
+        Transformed models are not backed until written 
+        to a file with :meth:`dumpf`.
+        """
+
+        return self._path is not None
+
+    def transform(
+        self, 
+        *transforms: 'WeatherTransform', 
+        seed: int | None = None,
+    ) -> 'WeatherModel':
+        r"""
+        Create a transformed weather model.
+        The transformations are applied in memory, 
+        in order, upon first access to :attr:`data` 
+        of the resulting model; this model is not modified.
+        When passed to :class:`controllables.energyplus.System`,
+        the resulting model is written to the (pooled) 
+        working directory of the system only when it starts.
+
+        .. code-block:: python
+
+            weather = WeatherModel('USA_CO_Denver.epw')
+            system = System(
+                building=...,
+                weather=weather.transform(
+                    WeatherOffset('dry_bulb_temperature', 2.),
+                    WeatherNoise('dry_bulb_temperature', std=.5),
+                    seed=episode,
+                ),
+            )
+
+        :param transforms: The transformations to apply.
+        :param seed: 
+            The seed for the random number generator 
+            passed to the transformations.
+        :return: The transformed weather model.
+        """
+
+        res = type(self)()
+        res._source = self
+        res._transforms = tuple(transforms)
+        res._seed = seed
+        return res
+
+    def _cache_path(self) -> str:
+        dirname, basename = _os_.path.split(_os_.path.abspath(self.path))
+        return _os_.path.join(
+            dirname, f'.{basename}.v{self._CACHE_VERSION}.npy',
+        )
+
+    @_functools_.cached_property
+    def headers(self) -> dict[str, list[str]]:
+        r"""
+        The header lines, keyed by their names
+        (e.g. `'LOCATION'`, `'DATA PERIODS'`).
+        """
+
+        if self._source is not None:
+            return self._source.headers
+
+        res = dict()
+        with open(self.path, mode='r', newline='') as fp:
+            for line, _ in zip(_csv_.reader(fp), self.HEADER_NAMES):
+                name, *values = line
+                res[name.strip().upper()] = values
+        return res
+
+    @property
+    def records_per_hour(self) -> int:
+        r"""
+        The number of records per hour, from the `'DATA PERIODS'` header.
+        """
+
+        try: return int(self.headers['DATA PERIODS'][1])
+        except (KeyError, IndexError, ValueError):
+            return 1
+
+    @classmethod
+    def parse(cls, lines: Iterable[str]) -> _numpy_.ndarray:
+        r"""
+        Parse EPW data lines into a structured array.
+        Missing trailing fields are filled with their missing values.
+
+        :param lines: The data lines (i.e. excluding the header lines).
+        :return: The structured array, one row per record.
+        """
+
+        n_fields = len(cls.FIELDS)
+        rows = [
+            row + [''] * (n_fields - len(row)) if len(row) < n_fields else
+            row[:n_fields]
+            for row in _csv_.reader(lines)
+            if row
+        ]
+        columns = list(zip(*rows)) or [() for _ in cls.FIELDS]
+
+        arrays = []
+        for field, column in zip(cls.FIELDS, columns):
+            column = _numpy_.asarray(column, dtype=str)
+            if field.missing is not None:
+                column = _numpy_.where(
+                    _numpy_.char.str_len(_numpy_.char.strip(column)) == 0,
+                    str(field.missing), column,
+                )
+            arrays.append(column.astype(field.dtype))
+
+        data = _numpy_.empty(len(rows), dtype=[
+            (field.name, array.dtype)
+            for field, array in zip(cls.FIELDS, arrays)
+        ])
+        for field, array in zip(cls.FIELDS, arrays):
+            data[field.name] = array
+        return data
+
+    def _load(self) -> _numpy_.ndarray:
+        with open(self.path, mode='r', newline='') as fp:
+            for _ in self.HEADER_NAMES:
+                fp.readline()
+            return self.parse(fp)
+
+    @_functools_.cached_property
+    def data(self) -> _numpy_.ndarray:
+        r"""
+        The data records as a (read-only) structured array.
+        Columns are accessible by field names,
+        e.g. `data['dry_bulb_temperature']`.
+        """
+
+        if self._source is not None:
+            rng = _numpy_.random.default_rng(self._seed)
+            data = _numpy_.array(self._source.data)
+            for transform in self._transforms:
+                data = transform(data, rng=rng)
+            data.flags.writeable = False
+            return data
+
+        cache_path = self._cache_path()
+        try:
+            if _os_.path.getmtime(cache_path) >= _os_.path.getmtime(self.path):
+                return _numpy_.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass
+
+        data = self._load()
+        try:
+            fd, tmp_path = _tempfile_.mkstemp(
+                dir=_os_.path.dirname(cache_path), suffix='.npy',
+            )
+        except OSError:
+            return data
+        try:
+            with _os_.fdopen(fd, mode='wb') as fp:
+                _numpy_.save(fp, data)
+            _os_.replace(tmp_path, cache_path)
+        except OSError:
+            _os_.unlink(tmp_path)
+            return data
+        return _numpy_.load(cache_path, mmap_mode='r')
+
+    def dump(self, fp):
+        r"""
+        Write this model in the EPW format.
+
+        :param fp: The text file-like object to write to.
+        """
+
+        for name in self.HEADER_NAMES:
+            fp.write(','.join([name, *self.headers.get(name, [])]) + '\n')
+
+        data = self.data
+        columns = [
+            _numpy_.char.mod('%.10g', data[field.name]) 
+            if _numpy_.issubdtype(data.dtype[field.name], _numpy_.floating) else
+            data[field.name].astype(str)
+            for field in self.FIELDS
+        ]
+        fp.writelines(
+            ','.join(row) + '\n'
+            for row in zip(*columns)
+        )
+        return fp
+
+    def dumpf(self, path: _os_.PathLike) -> _os_.PathLike:
+        r"""
+        Write this model to an EPW file.
+
+        :param path: The path of the file.
+        :return: The path of the file.
+        """
+
+        with open(path, mode='w', newline='') as fp:
+            self.dump(fp)
+        return path
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, field: str) -> _numpy_.ndarray:
+        r"""
+        Get a column of the data records.
+
+        :param field: The name of the field.
+        :return: The column.
+        """
+
+        return self.data[field]
+
+    @staticmethod
+    def _hours_of_year(
+        month: int, day: int, hours: float,
+        leap: bool,
+    ) -> float:
+        if not leap and (month, day) == (2, 29):
+            day = 28
+        day_of_year = _datetime_.date(
+            _LEAP_YEAR if leap else _NONLEAP_YEAR, month, day,
+        ).timetuple().tm_yday
+        return (day_of_year - 1) * 24 + hours
+
+    @_functools_.cached_property
+    def _index_base(self) -> tuple[int, bool]:
+        data = self.data
+        if len(data) == 0:
+            raise ValueError(f'{self!r}: No data records')
+        leap = bool(_numpy_.any(
+            (data['month'] == 2) & (data['day'] == 29)
+        ))
+        rph = self.records_per_hour
+        first = data[0]
+        base = round(self._hours_of_year(
+            int(first['month']), int(first['day']),
+            int(first['hour']) - 1, leap=leap,
+        ) * rph)
+        return base, leap
+
+    def index(self, time: _datetime_.datetime) -> int:
+        r"""
+        Get the index of the record covering a time.
+        Records cover the interval ending at their hour (and minute),
+        consistent with :class:`controllables.energyplus.WallClock`.
+
+        :param time: The time, e.g. the value of a wall clock.
+        :return: The index of the record in :attr:`data`.
+        """
+
+        base, leap = self._index_base
+        rph = self.records_per_hour
+        hours = self._hours_of_year(
+            time.month, time.day,
+            time.hour + time.minute / 60 + time.second / 3600,
+            leap=leap,
+        )
+        return (_math_.ceil(hours * rph - 1e-9) - 1 - base) % len(self.data)
+
+    def window(
+        self,
+        time: _datetime_.datetime,
+        hours: float = 24.,
+        fields: str | list[str] | None = None,
+    ) -> _numpy_.ndarray:
+        r"""
+        Get the records following a time, e.g. as weather forecasts.
+
+        :param time: The time, e.g. the value of a wall clock.
+        :param hours: The duration of the window in hours.
+        :param fields:
+            The name(s) of the field(s) to include.
+            If `None`, all fields are included.
+        :return:
+            The records covering the `hours` after `time`.
+            This is a view of :attr:`data` unless
+            the window wraps around the end of the records.
+        """
+
+        data = self.data if fields is None else self.data[fields]
+        start = self.index(time) + 1
+        stop = start + round(hours * self.records_per_hour)
+        if stop <= len(data):
+            return data[start:stop]
+        return _numpy_.take(
+            data, _numpy_.arange(start, stop), mode='wrap',
+        )
+
+
+class WeatherTransform(_abc_.ABC):
+    r"""
+    Transformation of weather data records.
+
+    .. seealso:: :meth:`WeatherModel.transform`
+    """
+
+    @_abc_.abstractmethod
+    def __call__(
+        self, 
+        data: _numpy_.ndarray, 
+        rng: _numpy_.random.Generator,
+    ) -> _numpy_.ndarray:
+        r"""
+        Transform the data records.
+
+        :param data: 
+            The structured array of data records.
+            This may be modified in place.
+        :param rng: The random number generator to use, if any.
+        :return: The transformed data records.
+        """
+
+        ...
+
+    @staticmethod
+    def _present(data: _numpy_.ndarray, field: str) -> _numpy_.ndarray:
+        r"""
+        Get the mask of records with the field not missing.
+        """
+
+        missing = _FIELDS_BY_NAME[field].missing
+        if missing is None:
+            return _numpy_.ones(len(data), dtype=bool)
+        return data[field] != missing
+
+    def __repr__(self):
+        return f'{type(self).__name__}({vars(self)!r})'
+
+
+class WeatherOffset(WeatherTransform):
+    r"""
+    Add a constant to a field.
+    Missing values are left as is.
+    """
+
+    def __init__(self, field: str, offset: float):
+        self.field = field
+        self.offset = offset
+
+    def __call__(self, data, rng):
+        mask = self._present(data, self.field)
+        data[self.field][mask] += self.offset
+        return data
+
+
+class WeatherScale(WeatherTransform):
+    r"""
+    Multiply a field by a constant.
+    Missing values are left as is.
+    """
+
+    def __init__(self, field: str, factor: float):
+        self.field = field
+        self.factor = factor
+
+    def __call__(self, data, rng):
+        mask = self._present(data, self.field)
+        data[self.field][mask] *= self.factor
+        return data
+
+
+class WeatherNoise(WeatherTransform):
+    r"""
+    Add Gaussian noise to a field, optionally clipped.
+    Missing values are left as is.
+    """
+
+    def __init__(
+        self, 
+        field: str, 
+        std: float, 
+        clip: tuple[float | None, float | None] | None = None,
+    ):
+        r"""
+        Initialize the transformation.
+
+        :param field: The name of the field.
+        :param std: The standard deviation of the noise.
+        :param clip: The lower and upper bounds of the results, if any.
+        """
+
+        self.field = field
+        self.std = std
+        self.clip = clip
+
+    def __call__(self, data, rng):
+        mask = self._present(data, self.field)
+        values = data[self.field][mask] + rng.normal(
+            scale=self.std, size=int(mask.sum()),
+        )
+        if self.clip is not None:
+            values = _numpy_.clip(values, *self.clip)
+        data[self.field][mask] = values
+        return data
+
+
+class WeatherYearShuffle(WeatherTransform):
+    r"""
+    Assemble a year from months drawn at random 
+    from the weather model being transformed and other weather models,
+    in the manner of typical meteorological years.
+    The data source fields (e.g. the year) are kept from the drawn month.
+    """
+
+    def __init__(self, sources: Sequence[WeatherModel]):
+        r"""
+        Initialize the transformation.
+
+        :param sources: 
+            The other weather models to draw months from.
+            These must have the same records per hour 
+            and number of records for each month.
+        """
+
+        self.sources = list(sources)
+
+    def __call__(self, data, rng):
+        candidates = [data, *(source.data for source in self.sources)]
+        for month in _numpy_.unique(data['month']):
+            masks = [c['month'] == month for c in candidates]
+            if any(m.sum() != masks[0].sum() for m in masks):
+                raise ValueError(
+                    f'{self!r}: Inconsistent number of records in month {month}'
+                )
+            i = rng.integers(len(candidates))
+            data[masks[0]] = candidates[i][masks[i]]
+        return data
+
+
+_NONLEAP_YEAR = 2017
+_LEAP_YEAR = 2016
+
+_FIELDS_BY_NAME = {field.name: field for field in WeatherModel.FIELDS}
 
 
 __all__ = [
+    'WeatherField',
     'WeatherModel',
-]
\ No newline at end of file
+    'WeatherTransform',
+    'WeatherOffset',
+    'WeatherScale',
+    'WeatherNoise',
+    'WeatherYearShuffle',
+]
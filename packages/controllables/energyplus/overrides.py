@@ -0,0 +1,164 @@
+r"""
+Overrides.
+
+Scope: Overriding kernel inputs at runtime via actuators.
+"""
+
+
+import functools as _functools_
+import os as _os_
+from typing import Iterable
+
+import numpy as _numpy_
+
+from controllables.core.components import Component
+from controllables.core.errors import TemporaryUnavailableError
+
+from .events import Event
+from .models.weather import WeatherModel
+from .systems import System
+from .variables import Actuator
+
+
+class WeatherOverride(Component[System]):
+    r"""
+    Weather override.
+
+    Feeds the records of a :class:`WeatherModel` into the kernel
+    through the `Weather Data` actuators at each occurrence of an event,
+    such that in-memory (e.g. transformed) weather
+    needs not be written to a weather file.
+    The values of all actuators are looked up in a single row of
+    a table precomputed from the model,
+    keyed by the simulation time
+    (see :meth:`WeatherModel.index`).
+    Missing values release the respective actuators
+    back to the weather of the kernel.
+
+    .. code-block:: python
+
+        weather = WeatherModel('USA_CO_Denver.epw')
+        system = System(building=..., weather=weather)
+        system.add(WeatherOverride(
+            weather.transform(WeatherNoise('dry_bulb_temperature', std=1.)),
+        ))
+
+    .. note::
+        Values are not interpolated between records.
+        The kernel still requires a weather file for run periods;
+        the overridden quantities replace those of the weather file.
+
+    .. seealso::
+        https://bigladdersoftware.com/epx/docs/24-1/ems-application-guide/ems-calling-points.html
+    """
+
+    CONTROL_TYPES: dict[str, str] = {
+        'Outdoor Dry Bulb': 'dry_bulb_temperature',
+        'Outdoor Dew Point': 'dew_point_temperature',
+        'Outdoor Relative Humidity': 'relative_humidity',
+        'Diffuse Solar': 'diffuse_horizontal_radiation',
+        'Direct Solar': 'direct_normal_radiation',
+        'Wind Speed': 'wind_speed',
+        'Wind Direction': 'wind_direction',
+    }
+    r"""
+    Control types of the `Weather Data` actuators,
+    mapped to the respective fields of :class:`WeatherModel`.
+    """
+
+    def __init__(
+        self,
+        weather: WeatherModel | _os_.PathLike,
+        control_types: Iterable[str] | None = None,
+        event_ref: Event.RefT = Event.Ref(
+            'begin_zone_timestep_before_set_current_weather',
+            include_warmup=True,
+        ),
+    ):
+        r"""
+        Initialize the weather override.
+
+        :param weather: The weather model or the path to the weather model.
+        :param control_types:
+            The control types of the actuators to override.
+            If `None`, all of :attr:`CONTROL_TYPES`.
+        :param event_ref: The event to override at.
+        """
+
+        super().__init__()
+        self.weather = (
+            weather if isinstance(weather, WeatherModel) else
+            WeatherModel(weather)
+        )
+        self.control_types = list(
+            control_types if control_types is not None else
+            self.CONTROL_TYPES.keys()
+        )
+        for control_type in self.control_types:
+            if control_type not in self.CONTROL_TYPES:
+                raise ValueError(f'Unknown control type: {control_type!r}')
+        self.event_ref = event_ref
+
+    @_functools_.cached_property
+    def _table(self) -> _numpy_.ndarray:
+        r"""
+        The values of the actuators, one row per record;
+        `nan` where missing.
+        """
+
+        fields = {
+            field.name: field
+            for field in WeatherModel.FIELDS
+        }
+        columns = []
+        for control_type in self.control_types:
+            field = fields[self.CONTROL_TYPES[control_type]]
+            column = _numpy_.array(self.weather[field.name], dtype=float)
+            column[column == field.missing] = _numpy_.nan
+            columns.append(column)
+        return _numpy_.stack(columns, axis=-1)
+
+    def __attach__(self, parent):
+        super().__attach__(parent)
+        self._clock = parent['time']
+        self._actuators: list[Actuator] = [
+            parent[Actuator.Ref(
+                type='Weather Data',
+                control_type=control_type,
+                key='Environment',
+            )]
+            for control_type in self.control_types
+        ]
+        self._table
+        self._event = parent.events[self.event_ref]
+        self._event.on(self)
+        return self
+
+    def __detach__(self, parent=None):
+        self._event.off(self)
+        for actuator in self._actuators:
+            try: actuator.reset()
+            except TemporaryUnavailableError:
+                pass
+        return super().__detach__(parent)
+
+    def __call__(self, *args, **kwargs):
+        try: time = self._clock.value
+        except TemporaryUnavailableError:
+            return
+        values = self._table[self.weather.index(time)].tolist()
+
+        for actuator, value in zip(self._actuators, values):
+            try:
+                # NOTE `nan` for missing values
+                if value != value:
+                    actuator.reset()
+                else:
+                    actuator.value = value
+            except TemporaryUnavailableError:
+                continue
+
+
+__all__ = [
+    'WeatherOverride',
+]
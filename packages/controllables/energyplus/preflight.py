@@ -0,0 +1,343 @@
+r"""
+Preflight.
+
+Scope: Checking building models for input errors in batches,
+before committing to simulations.
+"""
+
+
+import concurrent.futures as _concurrent_futures_
+import hashlib as _hashlib_
+import json as _json_
+import multiprocessing as _multiprocessing_
+import os as _os_
+from typing import Iterable, Literal, NamedTuple
+
+from . import _caches as _caches_
+from .diagnostics import Diagnostic, DiagnosticParser
+from .models.building import BuildingModel
+from .systems import System
+
+
+class PreflightError(RuntimeError):
+    r"""
+    Exception raised for building models failing preflight.
+    """
+
+    def __init__(self, result: 'PreflightResult'):
+        self.result = result
+        super().__init__(
+            f'Preflight failed with error {result.error!r}'
+            if result.error is not None else
+            f'Preflight failed with status {result.status!r}: '
+            + '; '.join(
+                f'[{d.severity}] {d.message}' for d in result.errors
+            )
+        )
+
+
+class PreflightResult(NamedTuple):
+    r"""
+    Result of the preflight of a building model.
+    """
+
+    hash: str
+    r"""The hash of the building model (and the mode)."""
+    status: int | None
+    r"""The exit status of the kernel."""
+    diagnostics: tuple[Diagnostic, ...] = ()
+    r"""The warnings and errors reported by the kernel."""
+    error: str | None = None
+    r"""
+    The error of the preflight itself (e.g. a crashed worker process), if any,
+    in which case the kernel gave no verdict on the building model.
+    """
+
+    @property
+    def errors(self) -> list[Diagnostic]:
+        r"""The severe and fatal errors."""
+
+        return [d for d in self.diagnostics if d.severity != 'Warning']
+
+    @property
+    def ok(self) -> bool:
+        r"""Whether the building model passed preflight."""
+
+        return self.error is None and self.status == 0 and not self.errors
+
+    @property
+    def definite(self) -> bool:
+        r"""
+        Whether the kernel gave a verdict on the building model.
+        Only definite results are cached.
+        """
+
+        return self.error is None and self.status is not None
+
+    def raise_for_errors(self) -> 'PreflightResult':
+        r"""
+        :return: This result.
+        :raises PreflightError: If the building model failed preflight.
+        """
+
+        if not self.ok:
+            raise PreflightError(self)
+        return self
+
+    def dumps(self) -> str:
+        return _json_.dumps(
+            dict(
+                status=self.status,
+                diagnostics=[
+                    [d.severity, d.message, list(d.details)]
+                    for d in self.diagnostics
+                ],
+                error=self.error,
+            ),
+            separators=(',', ':'),
+        )
+
+    @classmethod
+    def loads(cls, hash: str, s: str | bytes) -> 'PreflightResult':
+        data = _json_.loads(s)
+        return cls(
+            hash=hash,
+            status=data['status'],
+            diagnostics=tuple(
+                Diagnostic(severity, message, tuple(details))
+                for severity, message, details in data['diagnostics']
+            ),
+            error=data.get('error'),
+        )
+
+
+class Preflight:
+    r"""
+    Batch preflight of building models.
+
+    Building models are checked by the kernel in parallel processes,
+    each in one of the modes:
+
+    * `'convert'`: Input processing only (`--convert-only`),
+        i.e. syntax and schema validation. This takes seconds.
+    * `'input'`: Input processing and retrieval of the inputs
+        of all components, in lean design day mode,
+        stopping before the first environment is simulated.
+        This also catches errors in the semantics of the inputs
+        (e.g. references to missing objects).
+
+    Warnings and errors are parsed from the `'message'` events
+    of the kernel into :class:`Diagnostic`s.
+    Results with a verdict of the kernel are cached
+    by the hash of the building model (and the version of the kernel),
+    in memory and on disk. Failures of the preflight itself
+    (e.g. crashed worker processes) are reported in the results
+    (see :attr:`PreflightResult.error`) and checked again on the next run.
+
+    .. code-block:: python
+
+        preflight = Preflight(mode='input', max_workers=8)
+        for result in preflight.run(buildings):
+            result.raise_for_errors()
+    """
+
+    Mode = Literal['convert', 'input']
+
+    def __init__(
+        self,
+        mode: Mode = 'convert',
+        max_workers: int | None = None,
+        cache_dir: _os_.PathLike | None = None,
+    ):
+        r"""
+        Initialize the preflight.
+
+        :param mode: The mode of the checks.
+        :param max_workers:
+            The maximum number of processes.
+            If `None`, defaults to the number of processors.
+        :param cache_dir:
+            The cache directory.
+            If `None`, defaults to :meth:`default_cache_dir`.
+        """
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.cache_dir = (
+            cache_dir if cache_dir is not None else
+            self.default_cache_dir()
+        )
+        self._results: dict[str, PreflightResult] = dict()
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        r"""
+        Get the default cache directory,
+        under `$XDG_CACHE_HOME` (or `~/.cache`).
+        """
+
+        return _caches_.default_dir('preflight')
+
+    def hash(self, building: BuildingModel) -> str:
+        r"""
+        Hash a building model, along with the mode
+        and the version of the kernel, for caching.
+        """
+
+        h = _hashlib_.sha256(
+            f'{_caches_.kernel_version()}\0{self.mode}\0'.encode()
+        )
+        h.update(BuildingModel(building).dumps())
+        return h.hexdigest()
+
+    def _cache_path(self, hash: str) -> str:
+        return _os_.path.join(self.cache_dir, f'{hash}.json')
+
+    def _load_cached(self, hash: str) -> PreflightResult | None:
+        if hash in self._results:
+            return self._results[hash]
+        try:
+            with open(self._cache_path(hash), mode='r') as fp:
+                result = PreflightResult.loads(hash, fp.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        if not result.definite:
+            return None
+        self._results[hash] = result
+        return result
+
+    def _store(self, result: PreflightResult):
+        if not result.definite:
+            return
+        self._results[result.hash] = result
+        try: _caches_.write(self._cache_path(result.hash), result.dumps())
+        except OSError:
+            pass
+
+    def run(
+        self,
+        buildings: Iterable[BuildingModel | _os_.PathLike],
+    ) -> list[PreflightResult]:
+        r"""
+        Check building models.
+        Building models already checked are not checked again;
+        identical building models are checked once.
+
+        :param buildings:
+            The building models or the paths to the building models.
+        :return: The results, in order of the building models.
+        """
+
+        buildings = [
+            building if isinstance(building, BuildingModel) else
+            BuildingModel().loadf(building)
+            for building in buildings
+        ]
+        hashes = [self.hash(building) for building in buildings]
+
+        results: dict[str, PreflightResult] = dict()
+        pending: dict[str, BuildingModel] = dict()
+        for hash, building in zip(hashes, buildings):
+            result = self._load_cached(hash)
+            if result is None:
+                pending[hash] = building
+            else:
+                results[hash] = result
+
+        if pending:
+            # NOTE spawn (rather than fork) the worker processes,
+            # as the parent process may be running kernel threads
+            with _concurrent_futures_.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=_multiprocessing_.get_context('spawn'),
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_preflight,
+                        _PreflightTask(hash=hash, building=building, mode=self.mode),
+                    ): hash
+                    for hash, building in pending.items()
+                }
+                for future in _concurrent_futures_.as_completed(futures):
+                    hash = futures[future]
+                    # NOTE failures (including crashes of the worker processes,
+                    # i.e. `BrokenProcessPool`) are reported per building model
+                    try: result = future.result()
+                    except Exception as e:
+                        result = PreflightResult(
+                            hash=hash, status=None,
+                            error=f'{type(e).__name__}: {e}',
+                        )
+                    results[hash] = result
+                    self._store(result)
+
+        return [results[hash] for hash in hashes]
+
+    def check(self, building: BuildingModel | _os_.PathLike) -> PreflightResult:
+        r"""
+        Check a building model.
+
+        .. seealso:: :meth:`run`
+        """
+
+        result, = self.run([building])
+        return result
+
+
+class _PreflightTask(NamedTuple):
+    hash: str
+    building: BuildingModel
+    mode: Preflight.Mode
+
+
+def _run_preflight(task: _PreflightTask) -> PreflightResult:
+    r"""
+    Check a building model.
+    This is the entry point of the worker processes.
+    """
+
+    from .events import Event
+
+    match task.mode:
+        case 'convert':
+            system = System(building=task.building, convert_only=True)
+        case 'input':
+            system = System(building=task.building, design_day=True, lean=True)
+        case mode:
+            raise ValueError(f'Unknown preflight mode: {mode!r}')
+
+    parser = DiagnosticParser()
+    diagnostics: list[Diagnostic] = []
+    system.events[Event.Ref('message', include_warmup=True)].on(
+        lambda ctx: diagnostics.extend(parser.feed(ctx.message))
+    )
+
+    stopped = False
+    if task.mode == 'input':
+        @system.events[Event.Ref('after_component_get_input', include_warmup=True)].on
+        def _stop(*args, **kwargs):
+            nonlocal stopped
+            stopped = True
+            system.stop()
+
+    # NOTE run in this (worker) thread;
+    # failures of the kernel are verdicts reported by the exit status,
+    # other exceptions are reported by the parent process
+    try: system.run()
+    except RuntimeError:
+        if not stopped and system.status in (None, 0):
+            raise
+    diagnostics.extend(parser.close())
+
+    return PreflightResult(
+        hash=task.hash,
+        status=0 if stopped else system.status,
+        diagnostics=tuple(diagnostics),
+    )
+
+
+__all__ = [
+    'PreflightError',
+    'PreflightResult',
+    'Preflight',
+]
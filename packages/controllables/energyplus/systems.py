@@ -3,12 +3,18 @@ Systems.
 """
 
 
+import concurrent.futures as _concurrent_futures_
+import datetime as _datetime_
 import functools as _functools_
+import heapq as _heapq_
+import multiprocessing as _multiprocessing_
 import os as _os_
 import threading as _threading_
 from typing import (
+    Callable,
     Dict,
     Literal,
+    NamedTuple,
     Optional,
     Self,
     TypedDict,
@@ -18,6 +24,7 @@ from typing import (
 from controllables.core.systems import BaseSystem
 from controllables.core.components import Component
 
+from . import _workdirs as _workdirs_
 from ._kernel import Kernel
 from .models.building import BuildingModel
 from .models.weather import WeatherModel
@@ -38,7 +45,12 @@ class System(BaseSystem):
         """
 
         weather: Optional[WeatherModel | _os_.PathLike | None]
-        r"""The weather model or the path to the weather model."""
+        r"""
+        The weather model or the path to the weather model.
+        Weather models not backed by files 
+        (e.g. from :meth:`WeatherModel.transform`) are written 
+        to the working directory of the system upon start.
+        """
 
         report: Optional[_os_.PathLike | None]
         r"""The path of the report to generate."""
@@ -50,6 +62,15 @@ class System(BaseSystem):
         .. seealso:: https://energyplus.readthedocs.io/en/latest/tips_and_tricks/tips_and_tricks.html#design-day-creation
         """
 
+        convert_only: Optional[bool | None]
+        r"""
+        Whether to only process (and convert) the building model,
+        without simulating.
+        Input processing errors are reported in `'message'` events.
+
+        .. seealso:: :mod:`.preflight`
+        """
+
         repeat: Optional[bool | int | float | None]
         r"""
         Repetition.
@@ -58,6 +79,80 @@ class System(BaseSystem):
         * If number-like, the maximum number of repetitions.
         Floating numbers are treated as integers, except infinity.
         """
+
+        lean: Optional[bool | None]
+        r"""
+        Lean output mode.
+        If `True`, the building model is patched to strip 
+        reporting objects (e.g. `Output:Variable`, `Output:Meter`, 
+        `Output:Table:*`, `Output:SQLite`) and to turn off 
+        report files via `OutputControl:Files`.
+        None of the variables accessible from the system 
+        depend on those objects: :class:`OutputVariable`s 
+        are requested through the kernel API and 
+        :class:`OutputMeter`s are available regardless.
+        """
+
+        split: Optional[Literal['run_period', 'design_day'] | None]
+        r"""
+        Split the simulation into independent sub-simulations
+        that run in parallel processes.
+
+        * `'run_period'`: One sub-simulation per `RunPeriod` object.
+        * `'design_day'`: One sub-simulation per `SizingPeriod:*` object.
+            This implies :attr:`design_day`. 
+            Note that sizing calculations then only account for 
+            the sizing period of the respective sub-simulation.
+
+        Variables referenced in :attr:`records` are recorded
+        at each timestep of the sub-simulations and merged
+        in time order into :attr:`System.records`.
+        Events of the system only include `'begin'` and `'end'`;
+        variables of the sub-simulations are not accessible 
+        from the system in this mode.
+
+        .. note::
+            Worker processes are spawned, i.e. they import 
+            the main module; scripts shall guard their entry point 
+            with `if __name__ == '__main__'`.
+        """
+
+        records: Optional[list | None]
+        r"""
+        References of the variables to record in split mode, 
+        e.g. :class:`OutputMeter.Ref`s.
+        """
+
+        chunks: Optional[int | None]
+        r"""
+        Split each `RunPeriod` into (up to) this number of consecutive
+        time windows that run as sub-simulations in parallel processes.
+        This implies split mode; 
+        :attr:`split` may be `None` or `'run_period'`.
+        Each window is preceded by :attr:`chunk_overlap` days 
+        (in addition to the warmup days of the kernel);
+        variables recorded during those days are discarded and
+        the remaining records are stitched back together in time order.
+
+        .. note::
+            This assumes that the state of the building is 
+            (close to) independent of the state before the overlap, 
+            e.g. for evaluating non-learning policies.
+        """
+
+        chunk_overlap: Optional[int | None]
+        r"""
+        The number of days each time window in chunked mode 
+        starts before its recorded period. Defaults to 7.
+
+        .. seealso:: :attr:`chunks`
+        """
+
+        max_workers: Optional[int | None]
+        r"""
+        The maximum number of processes in split mode.
+        If `None`, defaults to the number of processors.
+        """
         
     def __init__(
         self, 
@@ -72,6 +167,7 @@ class System(BaseSystem):
         """
                 
         self._config = self.Config(config, **config_kwds)
+        self._running = False
 
     @property
     def config(self) -> Config:
@@ -94,24 +190,31 @@ class System(BaseSystem):
         def __init__(
             self, 
             kernel: Kernel, 
-            cli_args: list[str], 
+            cli_args: Callable[[str], list[str]], 
             iterations: float,
+            workdirs: _workdirs_.WorkingDirectoryPool = _workdirs_.pool,
         ):
             super().__init__()
             self._kernel = kernel
             self._cli_args = cli_args
             self._iterations = iterations
+            self._workdirs = workdirs
+            self.status: int | None = None
 
         def run(self):
-            while self._iterations > 0:
-                self._iterations -= 1
-                self._kernel.reset()
-                self._kernel.configure(print_output=False)
-                status = self._kernel.run(args=self._cli_args)
-                if status != 0:
-                    raise RuntimeError(
-                        f'{self!r}: Operation failed with status {status!r}'
-                    )
+            # NOTE the working directory is acquired on run (rather than init)
+            # so that threads never started do not hold one
+            with self._workdirs.use() as workdir:
+                cli_args = self._cli_args(workdir)
+                while self._iterations > 0:
+                    self._iterations -= 1
+                    self._kernel.reset()
+                    self._kernel.configure(print_output=False)
+                    status = self.status = self._kernel.run(args=cli_args)
+                    if status != 0:
+                        raise RuntimeError(
+                            f'{self!r}: Operation failed with status {status!r}'
+                        )
 
         def kill(self):
             r"""Signal the thread to stop."""
@@ -119,47 +222,238 @@ class System(BaseSystem):
             self._iterations = 0
             self._kernel.stop()
 
+    class _SplitThread(_threading_.Thread):
+        def __init__(
+            self, 
+            dispatch: Callable[[str], None],
+            tasks: list['_SubsystemTask'],
+            max_workers: int | None = None,
+            ordered: bool = True,
+        ):
+            r"""
+            :param dispatch: 
+                The callable dispatching the events of the system 
+                by name (i.e. `'begin'` and `'end'`).
+            """
+
+            super().__init__()
+            self._dispatch = dispatch
+            self._tasks = tasks
+            self._max_workers = max_workers
+            self._ordered = ordered
+            self._futures: list[_concurrent_futures_.Future] = []
+            self.results: list[dict[str, list]] = []
+            self.exception: Exception | None = None
+
+        def run(self):
+            # NOTE the kernel of this process does not run in split mode
+            self._dispatch('begin')
+            try:
+                # NOTE spawn (rather than fork) the worker processes,
+                # as the parent process may be running kernel threads
+                with _concurrent_futures_.ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=_multiprocessing_.get_context('spawn'),
+                ) as executor:
+                    self._futures = [
+                        executor.submit(_run_subsystem, task)
+                        for task in self._tasks
+                    ]
+                    try:
+                        self.results = [
+                            future.result() for future in self._futures
+                            if not future.cancelled()
+                        ]
+                    except Exception as e:
+                        self.exception = e
+                        self.kill()
+            finally:
+                self._dispatch('end')
+
+        def raise_for_exception(self):
+            r"""
+            :raises Exception: 
+                The exception raised by the first failed sub-simulation, if any.
+            """
+
+            if self.exception is not None:
+                raise self.exception
+
+        def merge(self) -> dict[str, list]:
+            r"""
+            Merge the results of the sub-simulations in time order.
+            """
+
+            if self._ordered:
+                rows = _heapq_.merge(
+                    *(zip(res['time'], res['values']) for res in self.results),
+                    key=lambda row: row[0],
+                )
+            else:
+                rows = (
+                    row for res in self.results 
+                    for row in zip(res['time'], res['values'])
+                )
+            times, values = [], []
+            for time, vals in rows:
+                times.append(time)
+                values.append(vals)
+            return dict(time=times, values=values)
+
+        def kill(self):
+            r"""
+            Signal the thread to stop.
+            Pending sub-simulations are cancelled;
+            running sub-simulations run to completion.
+            """
+
+            for future in self._futures:
+                future.cancel()
+
+    @property
+    def _split(self) -> bool:
+        r"""Whether the system runs in split (or chunked) mode."""
+
+        c = self._config
+        return c.get('split') is not None or c.get('chunks') is not None
+
+    def _dispatch(self, name: str):
+        r"""
+        Dispatch the events of the system (i.e. `'begin'` and `'end'`)
+        without running the kernel, i.e. in split mode.
+
+        :param name: The name of the events.
+        """
+
+        # NOTE events never accessed have no listeners
+        if 'events' in self.__dict__:
+            self.events._std_dispatch(name)
+
+    def _split_tasks(self) -> tuple[list['_SubsystemTask'], bool]:
+        r"""
+        Split the simulation into sub-simulation tasks.
+
+        :return: 
+            The tasks, and whether their results 
+            need to be merged by time.
+        """
+
+        c = self._config
+        building = _load_building(c['building'])
+        # NOTE sub-simulations run on their own,
+        # i.e. never split (or chunked) again
+        config = System.Config({
+            **c,
+            'split': None,
+            'records': None,
+            'repeat': False,
+            'chunks': None,
+            'chunk_overlap': None,
+            'max_workers': None,
+        })
+        refs = list(c.get('records') or [])
+
+        chunks = c.get('chunks')
+        if chunks is not None:
+            if c.get('split') not in (None, 'run_period'):
+                raise ValueError(
+                    f'Chunked mode is incompatible with split mode {c["split"]!r}'
+                )
+            return [
+                _SubsystemTask(
+                    config=System.Config({**config, 'building': building}),
+                    refs=refs,
+                    skip_days=skip_days,
+                )
+                for building, skip_days in _split_run_period_windows(
+                    building, 
+                    chunks=chunks, 
+                    overlap=(
+                        c['chunk_overlap'] 
+                        if c.get('chunk_overlap') is not None else 
+                        7
+                    ),
+                )
+            ], False
+
+        match c['split']:
+            case 'run_period':
+                buildings = _split_run_periods(building)
+                kinds_of_sim = _KINDS_OF_SIM_RUN_PERIOD
+            case 'design_day':
+                buildings = _split_sizing_periods(building)
+                kinds_of_sim = _KINDS_OF_SIM_SIZING_PERIOD
+                config['design_day'] = True
+            case split:
+                raise ValueError(f'Unknown split mode: {split!r}')
+
+        return [
+            _SubsystemTask(
+                config=System.Config({**config, 'building': building}),
+                refs=refs,
+                kinds_of_sim=kinds_of_sim,
+            )
+            for building in buildings
+        ], True
+
     @_functools_.cached_property
     def _thread(self):
-        import tempfile as _tempfile_
         import pathlib as _pathlib_
 
         c = self._config
 
+        if self._split:
+            if c.get('building') is None:
+                raise ValueError(f'Building model is required in {self.Config!r}')
+            tasks, ordered = self._split_tasks()
+            return self._SplitThread(
+                dispatch=self._dispatch,
+                tasks=tasks,
+                max_workers=c.get('max_workers'),
+                ordered=ordered,
+            )
+
         if c.get('building') is None:
             raise ValueError(f'Building model is required in {self.Config!r}')
 
-        args = [
-            # 0
-            str(
-                BuildingModel(c['building']).dumpf(
-                    _tempfile_.NamedTemporaryFile(suffix='.epJSON').name,
-                    format='json',
-                ) 
-                if isinstance(c['building'], (BuildingModel, Dict)) else
-                _pathlib_.Path(c['building'])
-            ),
-            # "--output-directory"
-            '--output-directory', 
-            str(
-                # TODO
-                c['report']
-            ) 
-            if c.get('report') is not None else 
-            _tempfile_.TemporaryDirectory(
-                prefix='.energyplus_output_',
-            ).name,
-        ]
-        if c.get('weather') is not None:
-            args.extend([
-                '--weather', str(
-                    c['weather'].path
-                    if isinstance(c['weather'], WeatherModel) else
-                    c['weather']
+        building = c['building']
+        if c.get('lean'):
+            building = _lean_building(_load_building(building))
+
+        def cli_args(workdir: str) -> list[str]:
+            args = [
+                # 0
+                str(
+                    BuildingModel(building).dumpf(
+                        _os_.path.join(workdir, 'in.epJSON'),
+                        format='json',
+                    ) 
+                    if isinstance(building, (BuildingModel, Dict)) else
+                    _pathlib_.Path(building)
+                ),
+                # "--output-directory"
+                '--output-directory', 
+                str(
+                    # TODO
+                    c['report']
+                    if c.get('report') is not None else 
+                    workdir
                 ),
-            ])
-        if c.get('design_day') is True:
-            args.extend(['--design-day'])
+            ]
+            weather = c.get('weather')
+            if weather is not None:
+                if isinstance(weather, WeatherModel):
+                    # NOTE transformed models are only written when needed
+                    weather = (
+                        weather.path if weather.backed else
+                        weather.dumpf(_os_.path.join(workdir, 'in.epw'))
+                    )
+                args.extend(['--weather', str(weather)])
+            if c.get('design_day') is True:
+                args.extend(['--design-day'])
+            if c.get('convert_only') is True:
+                args.extend(['--convert-only'])
+            return args
 
         iterations = c.get('repeat')
         match c.get('repeat'):
@@ -170,33 +464,111 @@ class System(BaseSystem):
 
         return self._CoreThread(
             kernel=self._kernel,
-            cli_args=args, 
+            cli_args=cli_args, 
             iterations=iterations,
         )
 
     def start(self):
-        if self._thread.is_alive():
+        if self.started:
             raise RuntimeError(f'{self!r} is already running')
         del self._thread
         self._thread.start()
         return self
     
+    def run(self):
+        r"""
+        Run the system in the calling thread (rather than a background thread),
+        blocking until it finishes.
+        The system may be stopped by :meth:`stop` from within its events.
+
+        :raises RuntimeError: 
+            If the system is already running, or if the kernel fails.
+        :raises Exception: 
+            The exception raised by the first failed sub-simulation in split mode.
+        """
+
+        if self.started:
+            raise RuntimeError(f'{self!r} is already running')
+        del self._thread
+        thread = self._thread
+        self._running = True
+        try: thread.run()
+        finally:
+            self._running = False
+        if isinstance(thread, self._SplitThread):
+            thread.raise_for_exception()
+        return self
+
     @property
     def started(self):
-        return self._thread.is_alive()    
+        return self._running or self._thread.is_alive()
 
     def wait(self, timeout=None):
+        r"""
+        Wait for the system to finish.
+
+        :raises Exception: 
+            The exception raised by the first failed sub-simulation in split mode.
+        """
+
         self._thread.join(timeout=timeout)
+        if isinstance(self._thread, self._SplitThread):
+            if not self._thread.is_alive():
+                self._thread.raise_for_exception()
         return self
     
     # TODO __await__?
 
     def stop(self):
-        if not self._thread.is_alive():
+        if not self.started:
             raise RuntimeError(f'{self!r} is not running')
         self._thread.kill()
         return self
 
+    @property
+    def status(self) -> int | None:
+        r"""
+        The exit status of the last run of the kernel,
+        or `None` if the kernel has not run (or in split mode).
+        """
+
+        return getattr(self._thread, 'status', None)
+
+    @property
+    def records(self):
+        r"""
+        Records of the variables referenced in :attr:`Config.records`,
+        keyed by their references, along with their times under `'time'`.
+        Only available in split (or chunked) mode, after the system finishes.
+
+        .. seealso:: :attr:`Config.split`
+
+        :raises RuntimeError: If not in split mode or not finished.
+        :raises Exception: 
+            The exception raised by the first failed sub-simulation.
+        """
+
+        from controllables.core.tools.records import (
+            VariableRecord, 
+            VariableRecords,
+        )
+
+        if not isinstance(self._thread, self._SplitThread):
+            raise RuntimeError(f'{self!r} is not in split mode')
+        if self._thread.is_alive():
+            raise RuntimeError(f'{self!r} is still running')
+        self._thread.raise_for_exception()
+
+        res = self._thread.merge()
+        refs = self._config.get('records') or []
+        columns = list(zip(*res['values'])) or [() for _ in refs]
+        records = VariableRecords(dict())
+        for key, values in [('time', res['time']), *zip(refs, columns)]:
+            record = VariableRecord()
+            record.value.extend(values)
+            records[key] = record
+        return records
+
     @_functools_.cached_property
     def events(self):
         from .events import EventManager
@@ -228,6 +600,307 @@ class System(BaseSystem):
         return super().add(component)
 
 
+def _load_building(building: BuildingModel | Dict | _os_.PathLike) -> BuildingModel:
+    if isinstance(building, (BuildingModel, Dict)):
+        return BuildingModel(building)
+    return BuildingModel().loadf(building)
+
+
+_REPORTING_OBJECT_TYPES = {
+    'Output:Variable',
+    'Output:Meter',
+    'Output:Meter:MeterFileOnly',
+    'Output:Meter:Cumulative',
+    'Output:Meter:Cumulative:MeterFileOnly',
+    'Output:Table:SummaryReports',
+    'Output:Table:Monthly',
+    'Output:Table:Annual',
+    'Output:Table:TimeBins',
+    'Output:SQLite',
+    'Output:JSON',
+    'Output:Surfaces:List',
+    'Output:Surfaces:Drawing',
+    'Output:Schedules',
+    'Output:Constructions',
+    'Output:EnergyManagementSystem',
+    'Output:VariableDictionary',
+    'Output:DebuggingData',
+    'Output:EnvironmentalImpactFactors',
+    'Output:DaylightFactors',
+    'Output:IlluminanceMap',
+    'OutputControl:Table:Style',
+    'OutputControl:IlluminanceMap:Style',
+}
+
+_REPORT_FILE_FIELDS = [
+    'output_csv', 'output_mtr', 'output_eso', 'output_eio', 
+    'output_tabular', 'output_sqlite', 'output_json', 'output_audit',
+    'output_zone_sizing', 'output_system_sizing', 'output_dxf', 'output_bnd',
+    'output_rdd', 'output_mdd', 'output_mtd', 'output_end', 'output_shd',
+    'output_dfs', 'output_glhe', 'output_delightin', 'output_delighteldmp',
+    'output_delightdfdmp', 'output_edd', 'output_dbg', 'output_perflog',
+    'output_sln', 'output_sci', 'output_wrl', 'output_screen', 
+    'output_extshd', 'output_tarcog',
+]
+
+
+def _lean_building(building: BuildingModel) -> BuildingModel:
+    r"""
+    Strip reporting objects from a building model and 
+    turn off report files.
+
+    .. seealso:: :attr:`System.Config.lean`
+    """
+
+    building = BuildingModel(building)
+    for object_type in _REPORTING_OBJECT_TYPES & building.keys():
+        del building[object_type]
+    building['OutputControl:Files'] = {
+        name: {**o, **{field: 'No' for field in _REPORT_FILE_FIELDS}}
+        for name, o in (
+            building.get('OutputControl:Files') 
+            or {'OutputControl:Files 1': dict()}
+        ).items()
+    }
+    return building
+
+
+def _split_run_periods(building: BuildingModel) -> list[BuildingModel]:
+    r"""
+    Split a building model into one building model per `RunPeriod`.
+    Sizing periods are not run in any of the resulting models,
+    including those without `SimulationControl` (which run them by default).
+    """
+
+    simulation_control = {
+        name: {**o, 'run_simulation_for_sizing_periods': 'No'}
+        for name, o in (
+            building.get('SimulationControl') 
+            or {'SimulationControl 1': dict()}
+        ).items()
+    }
+    return [
+        BuildingModel(
+            building, 
+            RunPeriod={name: period},
+            SimulationControl=simulation_control,
+        )
+        for name, period in building.get('RunPeriod', dict()).items()
+    ]
+
+
+def _split_sizing_periods(building: BuildingModel) -> list[BuildingModel]:
+    r"""
+    Split a building model into one building model per `SizingPeriod:*` object.
+    """
+
+    object_types = [
+        object_type for object_type in building.keys()
+        if object_type.startswith('SizingPeriod:')
+    ]
+    sizing_periods = [
+        (object_type, name, o)
+        for object_type in object_types
+        for name, o in building[object_type].items()
+    ]
+    others = BuildingModel(building)
+    for object_type in object_types:
+        del others[object_type]
+    return [
+        BuildingModel(others, **{object_type: {name: o}})
+        for object_type, name, o in sizing_periods
+    ]
+
+
+def _split_run_period_windows(
+    building: BuildingModel, 
+    chunks: int, 
+    overlap: int = 0,
+) -> list[tuple[BuildingModel, int]]:
+    r"""
+    Split each `RunPeriod` of a building model into consecutive time windows,
+    each extended by `overlap` leading days.
+
+    :return: 
+        One building model per window, in time order, 
+        along with the number of leading days to discard.
+    """
+
+    res = []
+    for building_ in _split_run_periods(building):
+        (name, period), = building_['RunPeriod'].items()
+
+        begin_year = period.get('begin_year')
+        year = begin_year if begin_year is not None else _NONLEAP_YEAR
+        begin = _datetime_.date(
+            year, period['begin_month'], period['begin_day_of_month'],
+        )
+        end_year = period.get('end_year')
+        end = _datetime_.date(
+            end_year if end_year is not None else year, 
+            period['end_month'], period['end_day_of_month'],
+        )
+        if end < begin:
+            end = end.replace(year=end.year + 1)
+
+        n_days = (end - begin).days + 1
+        n_chunks = max(min(chunks, n_days), 1)
+        starts = [
+            begin + _datetime_.timedelta(days=i * n_days // n_chunks)
+            for i in range(n_chunks)
+        ]
+        ends = [
+            start - _datetime_.timedelta(days=1) 
+            for start in starts[1:]
+        ] + [end]
+
+        for start, stop in zip(starts, ends):
+            sim_begin = max(begin, start - _datetime_.timedelta(days=overlap))
+            window = {
+                **period,
+                'begin_month': sim_begin.month,
+                'begin_day_of_month': sim_begin.day,
+                'end_month': stop.month,
+                'end_day_of_month': stop.day,
+            }
+            if begin_year is not None:
+                window['begin_year'] = sim_begin.year
+                window['end_year'] = stop.year
+            elif period.get('day_of_week_for_start_day') in _WEEKDAYS:
+                window['day_of_week_for_start_day'] = _WEEKDAYS[
+                    (
+                        _WEEKDAYS.index(period['day_of_week_for_start_day'])
+                        + (sim_begin - begin).days
+                    ) % len(_WEEKDAYS)
+                ]
+            res.append((
+                BuildingModel(building_, RunPeriod={name: window}),
+                (start - sim_begin).days,
+            ))
+
+    return res
+
+
+_NONLEAP_YEAR = 2017
+
+_WEEKDAYS = [
+    'Sunday', 'Monday', 'Tuesday', 'Wednesday', 
+    'Thursday', 'Friday', 'Saturday',
+]
+
+
+# NOTE `DataExchange.kind_of_sim`; 
+# sizing calculations (of HVAC) are never recorded
+_KINDS_OF_SIM_SIZING_PERIOD = frozenset({
+    1, # design day
+    2, # run period design (weather file days)
+})
+_KINDS_OF_SIM_RUN_PERIOD = frozenset({
+    3, # run period weather
+})
+
+
+class _SubsystemTask(NamedTuple):
+    config: System.Config
+    r"""The configuration of the sub-simulation."""
+    refs: list
+    r"""References of the variables to record."""
+    skip_days: int = 0
+    r"""
+    The number of leading days of the run period not to record,
+    i.e. the overlap of its window.
+    """
+    kinds_of_sim: frozenset[int] = _KINDS_OF_SIM_RUN_PERIOD
+    r"""
+    The kinds of environments (`DataExchange.kind_of_sim`) to record,
+    e.g. sizing periods in split mode `'design_day'`.
+    """
+
+
+class _WindowRecorder:
+    r"""
+    Recorder of the variables at each timestep of the run period 
+    of a sub-simulation, from the start date of its window on.
+
+    The start date is taken from the beginning of the first timestep 
+    of the run period (rather than computed from the building model),
+    as the year of the clock may differ from that of the window arithmetic.
+    """
+
+    def __init__(self, skip_days: int = 0):
+        self.skip_days = skip_days
+        self.start: _datetime_.datetime | None = None
+        self.time: list[_datetime_.datetime] = []
+        self.values: list[list] = []
+
+    def begin_environment(self):
+        self.start = None
+
+    def record(
+        self, 
+        time: _datetime_.datetime, 
+        timestep: _datetime_.timedelta, 
+        values: list,
+    ):
+        r"""
+        Record the values of a timestep.
+
+        :param time: The time at the end of the timestep, as of the clock.
+        :param timestep: The length of the timestep.
+        :param values: The values of the variables.
+        """
+
+        # NOTE the clock reports the end of the timestep, 
+        # e.g. the last timestep of a day ends at 24:00 (of the next day)
+        begin = time - timestep
+        if self.start is None:
+            self.start = begin.replace(
+                hour=0, minute=0, second=0, microsecond=0,
+            ) + _datetime_.timedelta(days=self.skip_days)
+        if begin < self.start:
+            return
+        self.time.append(time)
+        self.values.append(values)
+
+
+def _run_subsystem(task: _SubsystemTask) -> dict[str, list]:
+    r"""
+    Run a sub-simulation and record variables at each timestep.
+    This is the entry point of the worker processes in split mode.
+    """
+
+    from controllables.core.errors import TemporaryUnavailableError
+    from .events import Event
+
+    system = System(task.config)
+    kernel = system._kernel
+    clock = system['time']
+    variables = [system[ref] for ref in task.refs]
+    recorder = _WindowRecorder(skip_days=task.skip_days)
+
+    system.events[Event.Ref('begin_new_environment', include_warmup=True)] \
+        .on(lambda *args, **kwargs: recorder.begin_environment())
+
+    @system.events['timestep'].on
+    def _record(*args, **kwargs):
+        exchange = kernel.api.exchange
+        if exchange.kind_of_sim(kernel.state) not in task.kinds_of_sim:
+            return
+        try:
+            time = clock.value
+            values = [variable.value for variable in variables]
+        except TemporaryUnavailableError:
+            return
+        recorder.record(
+            time, 
+            _datetime_.timedelta(hours=exchange.zone_time_step(kernel.state)),
+            values,
+        )
+
+    system.start().wait()
+    return dict(time=recorder.time, values=recorder.values)
+
+
 __all__ = [
     'System',
 ]
\ No newline at end of file
@@ -111,6 +111,60 @@ class CommonMutableVariable(
     pass
 
 
+class _KernelHandleMixin:
+    r"""
+    Mixin for variables accessed via kernel handles.
+
+    Handles are resolved in one pass by :class:`VariableManager`
+    as soon as the kernel has completed the warmup of an environment
+    (i.e. all components have registered their variables),
+    and invalidated upon kernel resets.
+    Handles that are not available then 
+    (e.g. of variables attached during a run)
+    are resolved upon first access.
+    """
+
+    @_abc_.abstractmethod
+    def _lookup_kernel_handle(self) -> int:
+        r"""
+        (IMPLEMENT) Look up the internal handle of the variable.
+
+        :return: The handle, or `-1` if not available.
+        """
+
+        ...
+
+    @_functools_.cached_property
+    def _kernel_handle(self) -> int:
+        r"""
+        Get the internal handle of the variable.
+
+        :raises: :class:`TemporaryUnavailableError` if the handle is not available.
+        """
+
+        res = self._lookup_kernel_handle()
+        if res == -1:
+            raise TemporaryUnavailableError(f'{self!r}')
+        return res
+
+    def _resolve_kernel_handle(self) -> bool:
+        r"""
+        Resolve the internal handle of the variable, if not already.
+
+        :return: Whether the handle is available.
+        """
+
+        try: self._kernel_handle
+        except TemporaryUnavailableError:
+            return False
+        return True
+
+    def _invalidate_kernel_handle(self):
+        r"""Invalidate the resolved internal handle, if any."""
+
+        self.__dict__.pop('_kernel_handle', None)
+
+
 # TODO make readonly
 class RunIndicator(
     CommonVariable[bool],
@@ -185,7 +239,7 @@ class WallClock(CommonVariable[_datetime_.datetime]):
                 raise TemporaryUnavailableError(f'{self!r}') from e
 
 
-class Actuator(CommonMutableVariable):
+class Actuator(_KernelHandleMixin, CommonMutableVariable):
     r"""
     Actuator variable class.
     """
@@ -206,12 +260,9 @@ class Actuator(CommonMutableVariable):
 
     ref: Ref
 
-    @_functools_.cached_property
-    def _kernel_handle(self):
+    def _lookup_kernel_handle(self):
         r"""
-        Get the internal handle of the actuator.
-
-        :raises: :class:`TemporaryUnavailableError` if the handle is not available.
+        Look up the internal handle of the actuator.
 
         .. seealso:: 
         * https://energyplus.readthedocs.io/en/latest/datatransfer.html#datatransfer.DataExchange.get_actuator_handle
@@ -219,22 +270,13 @@ class Actuator(CommonMutableVariable):
 
         kernel = self._kernel
 
-        res = kernel.api.exchange \
+        return kernel.api.exchange \
             .get_actuator_handle(
                 kernel.state,
                 component_type=self.ref.type,
                 control_type=self.ref.control_type,
                 actuator_key=self.ref.key,
             )
-        if res == -1:
-            raise TemporaryUnavailableError(f'{self!r}') 
-        
-        @kernel.hooks['reset:post'].on
-        def _cleanup(*args, **kwargs):
-            kernel.hooks['reset:post'].off(_cleanup)
-            del self._kernel_handle
-
-        return res
 
     @property
     def value(self):
@@ -282,7 +324,7 @@ class Actuator(CommonMutableVariable):
             )
 
 
-class InternalVariable(CommonVariable):
+class InternalVariable(_KernelHandleMixin, CommonVariable):
     r"""
     Internal variable class.
     """
@@ -294,25 +336,15 @@ class InternalVariable(CommonVariable):
 
     ref: Ref
 
-    @_functools_.cached_property
-    def _kernel_handle(self):
+    def _lookup_kernel_handle(self):
         kernel = self._kernel
 
-        res = kernel.api.exchange \
+        return kernel.api.exchange \
             .get_internal_variable_handle(
                 kernel.state,
                 variable_type=self.ref.type,
                 variable_key=self.ref.key
             )
-        if res == -1:
-            raise TemporaryUnavailableError(f'{self!r}')
-
-        @kernel.hooks['reset:post'].on
-        def _cleanup(*args, **kwargs):
-            kernel.hooks['reset:post'].off(_cleanup)
-            del self._kernel_handle
-
-        return res
 
     @property
     def value(self):
@@ -324,7 +356,7 @@ class InternalVariable(CommonVariable):
                 )
 
 
-class OutputMeter(CommonVariable):
+class OutputMeter(_KernelHandleMixin, CommonVariable):
     r"""
     Output meter class.
 
@@ -336,24 +368,14 @@ class OutputMeter(CommonVariable):
         
     ref: Ref
 
-    @_functools_.cached_property
-    def _kernel_handle(self):
+    def _lookup_kernel_handle(self):
         kernel = self._kernel
 
-        res = kernel.api.exchange \
+        return kernel.api.exchange \
             .get_meter_handle(
                 kernel.state,
                 meter_name=self.ref.type,
             )
-        if res == -1:
-            raise TemporaryUnavailableError(f'{self!r}')
-
-        @kernel.hooks['reset:post'].on
-        def _cleanup(*args, **kwargs):
-            kernel.hooks['reset:post'].off(_cleanup)
-            del self._kernel_handle
-
-        return res
 
     @property
     def value(self):
@@ -365,7 +387,7 @@ class OutputMeter(CommonVariable):
                 )
 
 
-class OutputVariable(CommonVariable):
+class OutputVariable(_KernelHandleMixin, CommonVariable):
     r"""
     Output variable class.
     """
@@ -404,25 +426,15 @@ class OutputVariable(CommonVariable):
             
         return self
     
-    @_functools_.cached_property
-    def _kernel_handle(self):
+    def _lookup_kernel_handle(self):
         kernel = self._kernel
 
-        res = kernel.api.exchange \
+        return kernel.api.exchange \
             .get_variable_handle(
                 kernel.state,
                 variable_name=self.ref.type,
                 variable_key=self.ref.key,
             )
-        if res == -1:
-            raise TemporaryUnavailableError(f'{self!r}')
-        
-        @kernel.hooks['reset:post'].on
-        def _cleanup(*args, **kwargs):
-            kernel.hooks['reset:post'].off(_cleanup)
-            del self._kernel_handle
-
-        return res
 
     @property
     def value(self):
@@ -457,7 +469,69 @@ class VariableManager(
     @property
     def _kernel(self):
         return self.parent._kernel
-    
+
+    def __attach__(self, parent):
+        super().__attach__(parent)
+
+        self._unresolved_refs = set()
+
+        return self
+
+    @_functools_.cached_property
+    def _kernel_handle_resolution(self) -> bool:
+        r"""
+        Set up the resolution (and invalidation) of the internal handles.
+        This is deferred until the first variable accessed via a handle,
+        such that neither the kernel nor the event manager 
+        is instantiated otherwise.
+        """
+
+        @self._kernel.hooks['reset:post'].on
+        def _invalidate(*args, **kwargs):
+            for variable in list(self._variables.values()):
+                if isinstance(variable, _KernelHandleMixin):
+                    variable._invalidate_kernel_handle()
+
+        from .events import Event
+        # NOTE registered with the core via the event manager, 
+        # i.e. once per run along with other events of the calling point
+        self.parent.events[
+            Event.Ref('after_new_environment_warmup_complete', include_warmup=True)
+        ].on(self._resolve_kernel_handles)
+
+        return True
+
+    def _resolve_kernel_handles(self, *args, **kwargs):
+        r"""
+        Resolve the internal handles of all variables in one pass.
+        This is called upon the `after_new_environment_warmup_complete` event 
+        (rather than once the input is read, when many actuators 
+        and output variables are not yet registered by their components),
+        such that accessing variables during the run
+        does not require resolving handles (or handling failures thereof).
+        Variables whose handles cannot be resolved by then
+        are reported (once per reference) and
+        retried upon their next access.
+        """
+
+        unresolved = [
+            variable.ref
+            for variable in list(self._variables.values())
+            if isinstance(variable, _KernelHandleMixin)
+            if not variable._resolve_kernel_handle()
+        ]
+        unreported = [
+            ref for ref in unresolved
+            if ref not in self._unresolved_refs
+        ]
+        self._unresolved_refs.update(unreported)
+        if unreported:
+            _warnings_.warn(
+                f'{self._kernel!r}: Unresolved references '
+                f'(not available in the building model?): {unreported!r}',
+                RuntimeWarning,
+            )
+
     _symbols: dict[str, Callable[[], CommonVariable]] = {
         # std
         'running': lambda: RunIndicator(),
@@ -493,8 +567,10 @@ class VariableManager(
         if ref in self._variables:
             return self._variables[ref]
 
-        self._variables[ref] = build(ref).attach(self)
-        return self._variables[ref]
+        variable = self._variables[ref] = build(ref).attach(self)
+        if isinstance(variable, _KernelHandleMixin):
+            self._kernel_handle_resolution
+        return variable
     
     def __contains__(self, ref):
         return any((
@@ -1,8 +1,172 @@
 
 import controllables.core.tools.gymnasium.spaces as _mod_
 import doctest as _doctest_
+import threading as _threading_
+import types as _types_
+
+from controllables.core import MutableVariable
+from controllables.core.callbacks import Callback
+from controllables.core.systems import BaseSystem
+from controllables.core.tools.gymnasium.agent import (
+    Agent,
+    StalenessGate,
+    StalenessMetrics,
+)
+from controllables.core.tools.gymnasium.spaces import BoxSpace
 
 
 class TestDocs:
     def test_doctests(self):
         _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+class _System(BaseSystem):
+    started = False
+    events = None
+    variables = None
+
+    def start(self):
+        return self
+
+    def wait(self, timeout=None):
+        return self
+
+    def stop(self):
+        return self
+
+
+class TestStalenessGate:
+    def make_gate(self, staleness):
+        parent = _types_.SimpleNamespace(
+            action=MutableVariable(None),
+            staleness_metrics=StalenessMetrics(),
+        )
+        event = Callback()
+        gate = StalenessGate(event, staleness=staleness)
+        gate.__attach__(parent)
+        return parent, event, gate
+
+    def test_hold(self):
+        parent, event, gate = self.make_gate(staleness=3)
+        gate.submit(1, wait=False)
+        event()
+        assert parent.action.value == 1
+        # zero-order hold within the staleness bound
+        event()
+        event()
+        gate.submit(2, wait=False)
+        event()
+        assert parent.action.value == 2
+        assert parent.staleness_metrics.count == 2
+        assert parent.staleness_metrics.max == 3
+
+    def test_bound(self):
+        parent, event, gate = self.make_gate(staleness=1)
+        gate.submit(1, wait=False)
+        event()
+        # the held action is now as stale as allowed
+        thread = _threading_.Thread(target=event)
+        thread.start()
+        thread.join(timeout=.1)
+        assert thread.is_alive()
+        gate.submit(2, wait=False)
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+        assert parent.action.value == 2
+        assert parent.staleness_metrics.last == 1
+
+    def test_detach_releases(self):
+        parent, event, gate = self.make_gate(staleness=0)
+        thread = _threading_.Thread(target=event)
+        thread.start()
+        gate.__detach__(parent)
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+
+
+class TestAgentCommit:
+    def test_commit_staleness(self):
+        target = MutableVariable(0.)
+        agent = Agent(
+            action_space=BoxSpace(low=0., high=10., shape=()).bind(target),
+            observation_space=BoxSpace(low=0., high=10., shape=()),
+            staleness=2,
+        ).attach(_System())
+        event = Callback()
+        stopped = _threading_.Event()
+
+        def run():
+            while not stopped.is_set():
+                event()
+
+        thread = _threading_.Thread(target=run)
+        thread.start()
+        for action in (1., 2., 3.):
+            with agent.commit(action, event_ref=event):
+                assert target.value == action
+        stopped.set()
+        # NOTE releasing unblocks the event source if held
+        agent.release()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+
+        metrics = agent.staleness_metrics
+        assert metrics.count == 3
+        assert metrics.max <= 2
+
+
+class TestAgentManager:
+    def make_manager(self):
+        from controllables.core.tools.gymnasium.agent import AgentManager
+
+        system = _System()
+        evaluations = []
+
+        def participation(agent):
+            evaluations.append(agent)
+            return True
+
+        manager = AgentManager(agents={
+            ref: dict(
+                action_space=BoxSpace(low=0., high=1., shape=())
+                    .bind(MutableVariable(0.)),
+                observation_space=BoxSpace(low=0., high=1., shape=())
+                    .bind(MutableVariable(.5)),
+                participation=participation,
+                reward=lambda _: 1.,
+                termination=lambda _: False,
+            )
+            for ref in ('a', 'b')
+        }).attach(system)
+        return system, manager, evaluations
+
+    def test_participation_once_per_step(self):
+        system, manager, evaluations = self.make_manager()
+        manager.observations.value
+        manager.rewards.value
+        manager.actions.value = {'a': 1., 'b': 0.}
+        assert len(evaluations) == 2
+        # NOTE evaluated anew upon each step, regardless of the clock
+        for n in (4, 6):
+            assert manager.collect(('observation', 'reward'))['reward'] == {
+                'a': 1., 'b': 1.,
+            }
+            assert len(evaluations) == n
+        manager.actions.value = {'a': 1., 'b': 0.}
+        assert len(evaluations) == 6
+        manager.invalidate()
+        manager.observations.value
+        assert len(evaluations) == 8
+
+    def test_replaced_agent(self):
+        system, manager, evaluations = self.make_manager()
+        observations = manager.observations
+        assert manager.observations is observations
+        manager['a'] = Agent(
+            action_space=BoxSpace(low=0., high=1., shape=())
+                .bind(MutableVariable(0.)),
+            observation_space=BoxSpace(low=0., high=1., shape=())
+                .bind(MutableVariable(1.)),
+        )
+        assert manager.observations is not observations
+        assert manager.observations.value['a'] == 1.
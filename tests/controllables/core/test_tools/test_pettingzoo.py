@@ -0,0 +1,227 @@
+import functools as _functools_
+import os as _os_
+import time as _time_
+import types as _types_
+
+import numpy as _numpy_
+import pytest as _pytest_
+
+from controllables.core import MutableVariable
+from controllables.core.systems import BaseSystem
+from controllables.core.tools.gymnasium.spaces import BoxSpace
+from controllables.core.tools.pettingzoo import AECEnv, ParallelEnv
+from controllables.core.tools.pettingzoo.vector import VectorParallelEnv
+
+
+class _AECEnv(AECEnv):
+    metadata = dict(name='fake_aec_v0')
+
+    def reset(self, seed=None, options=None):
+        # NOTE the fake system restarts along with the environment
+        self.parent.restart()
+        return super().reset(seed=seed, options=options)
+
+    def render(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _System(BaseSystem):
+    r"""
+    A system that steps synchronously on the step event of the environment.
+    """
+
+    started = False
+    events = None
+
+    def __init__(self, horizons: dict[str, int]):
+        self.horizons = horizons
+        self.variables = {'time': MutableVariable(0)}
+        self.observation = MutableVariable(_numpy_.array(0., dtype=_numpy_.float32))
+        self.actions = {agent: MutableVariable(0.) for agent in horizons}
+        self.n_writes = 0
+
+    def start(self):
+        self.started = True
+        return self
+
+    def restart(self):
+        self.variables['time'].value = 0
+        self.observation.value = _numpy_.array(0., dtype=_numpy_.float32)
+
+    def wait(self, timeout=None):
+        return self
+
+    def stop(self):
+        return self
+
+    class StepEvent:
+        def __init__(self, system: '_System'):
+            self.system = system
+
+        def wait(self, deferred=False, timeout=None):
+            time = self.system.variables['time']
+            time.value += 1
+            self.system.observation.value = _numpy_.array(time.value, dtype=_numpy_.float32)
+            return _types_.SimpleNamespace(ack=lambda: None)
+
+    def make_env(self, env_type: type = _AECEnv):
+        time = self.variables['time']
+        env = env_type(
+            agents={
+                agent: dict(
+                    action_space=BoxSpace(low=0., high=1., shape=())
+                        .bind(self.actions[agent]),
+                    observation_space=BoxSpace(low=0., high=100., shape=())
+                        .bind(self.observation),
+                    reward=lambda _, agent=agent: float(self.actions[agent].value),
+                    termination=lambda _, horizon=horizon: time.value >= horizon,
+                    truncation=lambda _: False,
+                )
+                for agent, horizon in self.horizons.items()
+            },
+            event_sources=dict(step=self.StepEvent(self)),
+        )
+        return env.attach(self)
+
+
+class TestAECEnv:
+    def test_cycle(self):
+        system = _System({'a': 2, 'b': 5})
+        env = system.make_env()
+        env.reset()
+        assert sorted(env.agents) == ['a', 'b']
+        first, second = env.agents
+        assert env.agent_selection == first
+
+        # actions are buffered until the cycle completes
+        env.step(1.)
+        assert system.actions[first].value == 0.
+        assert env.agent_selection == second
+        env.step(.5)
+        assert system.actions[first].value == 1.
+        assert system.actions[second].value == .5
+        assert env.observe(first) == 1.
+        assert env.rewards == {first: 1., second: .5}
+
+    def test_done_agents_removed(self):
+        system = _System({'a': 1, 'b': 5})
+        env = system.make_env()
+        env.reset()
+        env.step(1.)
+        env.step(1.)
+        assert env.terminations['a']
+        # done agents are selected first, with None as the only valid action
+        assert env.agent_selection == 'a'
+        with _pytest_.raises(ValueError):
+            env.step(1.)
+        env.step(None)
+        assert env.agents == ['b']
+        assert env.agent_selection == 'b'
+
+    def test_step_unselected(self):
+        system = _System({'a': 1})
+        env = system.make_env()
+        with _pytest_.raises(RuntimeError):
+            env.step(1.)
+        env.reset()
+        env.step(1.)
+        env.step(None)
+        assert env.agents == []
+        with _pytest_.raises(RuntimeError):
+            env.step(None)
+
+    def test_api(self):
+        from pettingzoo.test import api_test
+
+        system = _System({'a': 10, 'b': 20, 'c': 30})
+        api_test(system.make_env(), num_cycles=100)
+
+
+class _ParallelEnv(ParallelEnv):
+    def step(self, actions):
+        if any(action is None for action in actions.values()):
+            # NOTE simulates a crash of the worker process
+            _os_._exit(1)
+        system = self.parent
+        if system.variables['time'].value >= max(system.horizons.values()):
+            # NOTE simulates a finished system, whose step event never fires
+            _os_._exit(2)
+        return super().step(actions)
+
+
+def _make_parallel_env(horizons: dict[str, int], stop_hangs: bool = False):
+    system = _System(horizons)
+    if stop_hangs:
+        system.stop = lambda: _time_.sleep(60)
+    return system.make_env(_ParallelEnv)
+
+
+class TestVectorParallelEnv:
+    def make_env(self):
+        return VectorParallelEnv({
+            'x': _functools_.partial(_make_parallel_env, {'a': 1, 'b': 3}),
+            'y': _functools_.partial(_make_parallel_env, {'a': 2}),
+        }, context='fork')
+
+    def test_step(self):
+        env = self.make_env()
+        try:
+            observations, infos = env.reset()
+            # the systems are started and stepped once before reset
+            assert observations == {('x', 'a'): 1., ('x', 'b'): 1., ('y', 'a'): 1.}
+            assert sorted(env.agents) == sorted(env.possible_agents)
+
+            res = env.step({agent: 1. for agent in env.agents})
+            assert res.rewards == {('x', 'a'): 1., ('x', 'b'): 1., ('y', 'a'): 1.}
+            assert res.terminations == {('x', 'a'): True, ('x', 'b'): False, ('y', 'a'): True}
+            # terminated agents are pruned
+            assert sorted(env.agents) == [('x', 'b')]
+        finally:
+            env.close()
+
+    def test_worker_exit(self):
+        env = self.make_env()
+        try:
+            env.reset()
+            with _pytest_.raises(RuntimeError, match="'y'"):
+                env.step({('x', 'a'): 1., ('y', 'a'): None})
+        finally:
+            env.close()
+
+    def test_step_done_systems(self):
+        env = self.make_env()
+        try:
+            env.reset()
+            env.step({agent: 1. for agent in env.agents})
+            # NOTE all agents of 'y' are done; 'y' is no longer stepped
+            res = env.step({('x', 'b'): 1., ('y', 'a'): 1.})
+            assert {system_id for system_id, _ in res.rewards} == {'x'}
+        finally:
+            env.close()
+
+    def test_worker_exit_sync(self):
+        env = self.make_env()
+        try:
+            env.reset()
+            with _pytest_.raises(RuntimeError, match="'y'"):
+                env.step({('x', 'a'): 1., ('y', 'a'): None})
+            # NOTE sending to the exited worker fails
+            with _pytest_.raises(RuntimeError, match="'y'"):
+                env.step({('x', 'b'): 1., ('y', 'a'): 1.})
+            # the replies of the other workers are received nonetheless
+            assert not env._conns['x'].poll()
+        finally:
+            env.close()
+
+    def test_close_timeout(self):
+        env = VectorParallelEnv({
+            'x': _functools_.partial(_make_parallel_env, {'a': 1}, stop_hangs=True),
+        }, context='fork')
+        env.reset()
+        start = _time_.monotonic()
+        env.close(timeout=.5)
+        assert _time_.monotonic() - start < 10.
+        assert not any(p.is_alive() for p in env._processes.values())
@@ -0,0 +1,51 @@
+import concurrent.futures as _concurrent_futures_
+
+import controllables.core.tools.rllib.inference as _mod_
+import doctest as _doctest_
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+class TestBatchedInference:
+    def test_compute_actions_batched(self):
+        batches = []
+        def policy(observations):
+            batches.append(list(observations))
+            return [o * 10 for o in observations]
+
+        inference = _mod_.BatchedInference(policy, timeout=None)
+        for _ in range(4):
+            inference.register()
+
+        with _concurrent_futures_.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(inference.compute_action, range(4)))
+
+        assert results == [0, 10, 20, 30]
+        assert len(batches) == 1
+        assert sorted(batches[0]) == [0, 1, 2, 3]
+
+    def test_compute_actions_timeout(self):
+        inference = _mod_.BatchedInference(
+            lambda observations: [-o for o in observations], 
+            timeout=.01,
+        )
+        for _ in range(2):
+            inference.register()
+        # partial batch dispatched after timeout
+        assert inference.compute_actions([1, 2]) == [-1, -2]
+
+
+class TestEpisodeScheduler:
+    def test_detach_shuts_down_executor(self):
+        from controllables.core.tools.rllib.env import Env
+
+        scheduler = Env.EpisodeScheduler(None, staleness=1)
+        scheduler.__attach__(object())
+        executor = scheduler._executor
+        assert executor.submit(lambda: 1).result() == 1
+        scheduler.__detach__()
+        assert executor._shutdown
+        assert '_executor' not in scheduler.__dict__
@@ -0,0 +1,185 @@
+r"""
+Fakes of the kernel (and the API of its core), driven by the tests.
+"""
+
+
+import collections as _collections_
+import contextlib as _contextlib_
+import datetime as _datetime_
+import types as _types_
+from typing import Callable
+
+import pytest as _pytest_
+
+from controllables.energyplus._kernel import Kernel
+from controllables.energyplus.systems import System
+
+
+class _Runtime:
+    r"""
+    A fake of the runtime API of the core,
+    counting the registrations of each calling point.
+    """
+
+    def __init__(self):
+        self.registrations = _collections_.Counter()
+        self.callbacks = _collections_.defaultdict(list)
+
+    def __getattr__(self, name: str):
+        if not name.startswith('callback_'):
+            raise AttributeError(name)
+        point = name.removeprefix('callback_')
+
+        def callback_setter(state, f):
+            self.registrations[point] += 1
+            self.callbacks[point].append(f)
+        return callback_setter
+
+    def stop_simulation(self, state):
+        pass
+
+
+class _Exchange:
+    r"""
+    A fake of the data exchange API of the core,
+    with a settable clock and simulation state,
+    counting the queries of the warmup state and the lookups of actuators,
+    and recording the actuator writes.
+    """
+
+    def __init__(self):
+        self.warmup = False
+        self.warmup_queries = 0
+        self.sim_time = 0.
+        self.time = _datetime_.datetime(2017, 1, 1)
+        self.kind = 3
+        self.timestep = _datetime_.timedelta(minutes=15)
+        self.actuators: dict[tuple[str, str, str], float] = dict()
+        r"""The values of the actuators available, by their keys."""
+        self.handles: dict[tuple[str, str, str], int] = dict()
+        self.lookups = _collections_.Counter()
+        self.writes: list[tuple[int, float | None]] = []
+
+    def warmup_flag(self, state):
+        self.warmup_queries += 1
+        return int(self.warmup)
+
+    def current_sim_time(self, state):
+        return self.sim_time
+
+    def kind_of_sim(self, state):
+        return self.kind
+
+    def zone_time_step(self, state):
+        return self.timestep / _datetime_.timedelta(hours=1)
+
+    def calendar_year(self, state):
+        return self.time.year
+
+    def year(self, state):
+        return self.time.year
+
+    def day_of_year(self, state):
+        return self.time.timetuple().tm_yday
+
+    def current_time(self, state):
+        return self.time.hour + self.time.minute / 60
+
+    def get_actuator_handle(self, state, component_type, control_type, actuator_key):
+        key = (component_type, control_type, actuator_key)
+        self.lookups[key] += 1
+        if key not in self.actuators:
+            return -1
+        return self.handles.setdefault(key, len(self.handles))
+
+    def _actuator_key(self, actuator_handle: int):
+        key, = (k for k, h in self.handles.items() if h == actuator_handle)
+        return key
+
+    def get_actuator_value(self, state, actuator_handle):
+        return self.actuators[self._actuator_key(actuator_handle)]
+
+    def set_actuator_value(self, state, actuator_handle, actuator_value):
+        self.writes.append((actuator_handle, actuator_value))
+        self.actuators[self._actuator_key(actuator_handle)] = actuator_value
+
+    def reset_actuator(self, state, actuator_handle):
+        self.writes.append((actuator_handle, None))
+
+    def api_error_flag(self, state):
+        return False
+
+
+class _Kernel(Kernel):
+    r"""
+    A kernel without the core, driven by the tests.
+    """
+
+    def __init__(self, on_run: Callable[['_Kernel'], int] | None = None):
+        r"""
+        :param on_run:
+            The callable called (with this kernel) within each run,
+            returning the exit status.
+        """
+
+        self.api = _types_.SimpleNamespace(
+            runtime=_Runtime(),
+            exchange=_Exchange(),
+        )
+        self.state = None
+        self.__running__ = False
+        self.on_run = on_run
+        self.stopped = False
+
+    def __del__(self):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+    def stop(self):
+        self.stopped = True
+
+    def reset(self):
+        self.hooks.__call__('reset:pre')
+        # NOTE resetting the core clears all registrations
+        self.api.runtime.callbacks.clear()
+        self.hooks.__call__('reset:post')
+
+    @_contextlib_.contextmanager
+    def running(self):
+        r"""Simulate a run, within which calling points may be fired."""
+
+        self.reset()
+        self.hooks.__call__('run:pre')
+        self.__running__ = True
+        try: yield self
+        finally:
+            self.__running__ = False
+            self.hooks.__call__('run:post')
+
+    def run(self, args=None):
+        with self.running():
+            return self.on_run(self) if self.on_run is not None else 0
+
+    def fire(self, point: str, *args):
+        for f in list(self.api.runtime.callbacks[point]):
+            f(*(args or (self.state, )))
+
+
+@_pytest_.fixture
+def fake_kernel() -> type[_Kernel]:
+    r"""The class of fake kernels."""
+
+    return _Kernel
+
+
+@_pytest_.fixture
+def fake_system(fake_kernel) -> Callable[..., System]:
+    r"""A factory of systems running on fake kernels."""
+
+    def make(*args, **kwargs) -> System:
+        system = System(*args, **kwargs)
+        system._kernel = fake_kernel()
+        return system
+    return make
@@ -0,0 +1,71 @@
+import doctest as _doctest_
+
+import pytest as _pytest_
+
+import controllables.energyplus._caches as _caches_
+import controllables.energyplus.catalogs as _mod_
+from controllables.energyplus.catalogs import Catalog
+from controllables.energyplus.models import BuildingModel
+from controllables.energyplus.systems import System
+from controllables.energyplus.variables import (
+    Actuator,
+    InternalVariable,
+    OutputMeter,
+    OutputVariable,
+)
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+_REFS = [
+    Actuator.Ref(
+        type='Schedule:Constant',
+        control_type='Schedule Value',
+        key='ALWAYS ON',
+    ),
+    InternalVariable.Ref(type='Zone Floor Area', key='ZONE ONE'),
+    OutputMeter.Ref(type='Electricity:Facility'),
+    OutputVariable.Ref(type='Zone Mean Air Temperature', key='ZONE ONE'),
+]
+
+
+class TestCatalog:
+    def test_serialization(self):
+        catalog = Catalog(_REFS)
+        assert list(Catalog.loads(catalog.dumps())) == _REFS
+        assert catalog.filter(OutputVariable.Ref, key='zone one') == [_REFS[-1]]
+        assert len(catalog.filter(key='ZONE ONE')) == 2
+
+    def test_cached(self, tmp_path, monkeypatch):
+        building = BuildingModel({'Zone': {'ZONE ONE': {}}})
+        monkeypatch.setattr(Catalog, 'generate', classmethod(
+            lambda cls, building: cls(_REFS)
+        ))
+        catalog = Catalog.from_building(building, cache_dir=tmp_path)
+        assert (tmp_path / f'{Catalog.hash(building)}.json').exists()
+
+        monkeypatch.setattr(Catalog, 'generate', None)
+        assert Catalog.from_building(building, cache_dir=tmp_path) == catalog
+
+    def test_cache_key(self, monkeypatch):
+        building = BuildingModel({'Zone': {'ZONE ONE': {}}})
+        monkeypatch.setattr(_caches_, 'kernel_version', lambda: '24.1.0')
+        h = Catalog.hash(building)
+        assert Catalog.hash(BuildingModel(building)) == h
+        monkeypatch.setattr(_caches_, 'kernel_version', lambda: '24.2.0')
+        assert Catalog.hash(building) != h
+
+    def test_generate_no_warmup(self, tmp_path, monkeypatch, fake_kernel):
+        building = BuildingModel({'Zone': {'ZONE ONE': {}}})
+        # NOTE runs completing no warmup (e.g. without sizing periods)
+        # never fire the events the catalog is collected on
+        kernel = fake_kernel()
+        monkeypatch.setattr(System, '_kernel', property(lambda self: kernel))
+        monkeypatch.setattr(System, 'start', lambda self: self)
+        monkeypatch.setattr(System, 'wait', lambda self, timeout=None: self)
+        with _pytest_.raises(RuntimeError, match='SizingPeriod'):
+            Catalog.from_building(building, cache_dir=tmp_path)
+        assert list(tmp_path.iterdir()) == []
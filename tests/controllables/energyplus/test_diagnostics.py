@@ -0,0 +1,26 @@
+import doctest as _doctest_
+
+import controllables.energyplus.diagnostics as _mod_
+from controllables.energyplus.diagnostics import Diagnostic, parse
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+def test_parse():
+    assert parse([
+        'Initializing Simulation',
+        '   ** Warning ** GetSurfaceData: Zone One is not closed\n'
+        '   **   ~~~   ** see details\n'
+        '   **   ~~~   ** in the eio file',
+        '   ** Severe  ** Node not found',
+        'EnergyPlus Terminated--Fatal Error Detected.',
+    ]) == [
+        Diagnostic(
+            'Warning', 'GetSurfaceData: Zone One is not closed',
+            ('see details', 'in the eio file'),
+        ),
+        Diagnostic('Severe', 'Node not found'),
+    ]
@@ -0,0 +1,47 @@
+import pytest as _pytest_
+
+from controllables.core.variables import compute
+import controllables.energyplus.ems as _mod_
+import doctest as _doctest_
+from controllables.energyplus.models import BuildingModel
+from controllables.energyplus.variables import (
+    Actuator,
+    OutputVariable,
+)
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+class TestProgram:
+    @_pytest_.fixture(autouse=True)
+    def make_refs(self):
+        self.temperature = OutputVariable(OutputVariable.Ref(
+            type='Site Outdoor Air Drybulb Temperature', 
+            key='Environment',
+        ))
+        self.setpoint = Actuator(Actuator.Ref(
+            type='Schedule:Compact', 
+            control_type='Schedule Value', 
+            key='SETPOINT',
+        ))
+
+    def test_inject(self):
+        building = _mod_.Program('rules').set(
+            self.setpoint, 
+            compute(max, self.temperature * .5, 18.),
+        ).inject(BuildingModel())
+        assert building['EnergyManagementSystem:Program']['rules']['lines'] == [
+            dict(program_line='SET rules_a0 = @Max (rules_s0 * 0.5) 18.0'),
+        ]
+        assert set(building['EnergyManagementSystem:Sensor']) == {'rules_s0'}
+        assert set(building['EnergyManagementSystem:Actuator']) == {'rules_a0'}
+
+    def test_compile_unsupported(self):
+        with _pytest_.raises(_mod_.CompileError):
+            _mod_.Program('rules').set(
+                self.setpoint, 
+                self.temperature.cast(lambda x: x),
+            ).compile()
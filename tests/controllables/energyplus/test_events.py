@@ -0,0 +1,195 @@
+import threading as _threading_
+
+import pytest as _pytest_
+
+from controllables.energyplus.events import Event
+
+
+class TestWarmup:
+    def test_registrations_shared(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        calls = []
+        system.events['begin_new_environment'].on(calls.append)
+        system.events[Event.Ref('begin_new_environment', include_warmup=True)] \
+            .on(calls.append)
+
+        registrations = kernel.api.runtime.registrations
+        registrations.clear()
+        with kernel.running():
+            # NOTE the tracker shares the registrations of the events
+            assert registrations == {
+                'begin_new_environment': 1,
+                'after_new_environment_warmup_complete': 1,
+            }
+            kernel.api.exchange.warmup = True
+            kernel.fire('begin_new_environment')
+        # only the event including the warmup period is called
+        assert len(calls) == 1
+
+    def test_invalidation(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        exchange = kernel.api.exchange
+        calls = []
+        system.events['timestep'].on(calls.append)
+
+        with kernel.running():
+            exchange.warmup = True
+            kernel.fire('begin_new_environment')
+            for _ in range(3):
+                kernel.fire('begin_zone_timestep_after_init_heat_balance')
+            assert calls == []
+            assert exchange.warmup_queries == 1
+
+            exchange.warmup = False
+            kernel.fire('after_new_environment_warmup_complete')
+            for _ in range(3):
+                kernel.fire('begin_zone_timestep_after_init_heat_balance')
+            assert len(calls) == 3
+            assert exchange.warmup_queries == 2
+
+    def test_warmup_before_events(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        exchange = kernel.api.exchange
+        with kernel.running():
+            exchange.warmup = True
+            assert system.events.warmup
+            exchange.warmup = False
+            kernel.fire('after_new_environment_warmup_complete')
+            assert not system.events.warmup
+
+
+class TestEventManager:
+    def test_exception_reraised(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+
+        @system.events[Event.Ref('begin_new_environment', include_warmup=True)].on
+        def _fail(*args, **kwargs):
+            raise ValueError('listener failed')
+
+        with _pytest_.raises(ValueError, match='listener failed'):
+            with kernel.running():
+                kernel.fire('begin_new_environment')
+                assert kernel.stopped
+
+    def test_registrations_across_runs(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        registrations = kernel.api.runtime.registrations
+        point = 'begin_zone_timestep_after_init_heat_balance'
+        calls = []
+
+        first, second = calls.append, lambda ctx: calls.append(ctx)
+        system.events['timestep'].on(first)
+        system.events[Event.Ref(point, include_warmup=True)].on(second)
+
+        for _ in range(2):
+            registrations.clear()
+            # NOTE registered once per run regardless of the number of events
+            with kernel.running():
+                assert registrations[point] == 1
+                kernel.fire(point)
+        assert len(calls) == 2 * 2
+
+        system.events['timestep'].off(first)
+        registrations.clear()
+        with kernel.running():
+            assert registrations[point] == 1
+
+        system.events[Event.Ref(point, include_warmup=True)].off(second)
+        registrations.clear()
+        with kernel.running():
+            # NOTE calling points without subscriptions are not registered
+            assert registrations[point] == 0
+            kernel.fire(point)
+            # subscribing mid-run registers the calling point
+            system.events['timestep'].on(first)
+            assert registrations[point] == 1
+            system.events[Event.Ref(point, include_warmup=True)].on(second)
+            assert registrations[point] == 1
+        assert len(calls) == 2 * 2
+
+    def test_delitem(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        registrations = kernel.api.runtime.registrations
+        point = 'end_zone_timestep_after_zone_reporting'
+        calls = []
+        system.events[Event.Ref(point, include_warmup=True)].on(calls.append)
+        system.events[Event.Ref(point, include_warmup=True)].on(lambda ctx: calls.append(ctx))
+
+        del system.events[Event.Ref(point, include_warmup=True)]
+        registrations.clear()
+        with kernel.running():
+            assert registrations[point] == 0
+            kernel.fire(point)
+        assert calls == []
+
+    def test_concurrent_subscriptions(self, fake_system):
+        system = fake_system()
+        point = 'end_zone_timestep_after_zone_reporting'
+        event = system.events[Event.Ref(point, include_warmup=True)]
+        listeners = [lambda ctx: None for _ in range(8)]
+
+        def churn(listener):
+            for _ in range(500):
+                event.on(listener)
+                event.off(listener)
+
+        threads = [
+            _threading_.Thread(target=churn, args=(listener, ))
+            for listener in listeners
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert system.events._core_subscriptions[point] == 0
+
+
+class TestDecimatedEvent:
+    def test_every(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        exchange = kernel.api.exchange
+        point = 'begin_zone_timestep_after_init_heat_balance'
+        calls = []
+        system.events['timestep'].every(hours=24).on(
+            lambda ctx: calls.append(exchange.sim_time)
+        )
+        assert system.events['timestep'].every(hours=24) \
+            is system.events['timestep'].every(days=1)
+
+        for _ in range(2):
+            with kernel.running():
+                # NOTE a design day followed by a run period,
+                # both starting in the same interval the last one ended in
+                for times in ([.25, .5, 23.75], [.25, 23.75, 24., 48.]):
+                    kernel.fire('begin_new_environment')
+                    for exchange.sim_time in times:
+                        kernel.fire(point)
+        assert calls == [.25, .25, 24., 48.] * 2
+
+    def test_off(self, fake_system):
+        system = fake_system()
+        kernel = system._kernel
+        registrations = kernel.api.runtime.registrations
+        point = 'begin_zone_timestep_after_init_heat_balance'
+        calls = []
+        event = system.events['timestep'].every(minutes=15)
+        event.on(calls.append)
+        event.off(calls.append)
+
+        registrations.clear()
+        with kernel.running():
+            assert registrations[point] == 0
+            kernel.fire(point)
+        assert calls == []
+
+    def test_interval(self, fake_system):
+        system = fake_system()
+        with _pytest_.raises(ValueError):
+            system.events['timestep'].every(minutes=0)
@@ -0,0 +1,68 @@
+import doctest as _doctest_
+import logging as _logging_
+import types as _types_
+
+import controllables.energyplus.logging.message as _mod_
+from controllables.energyplus.logging.message import MessageLogger
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+class TestMessageLogger:
+    def test_diagnostics(self, caplog):
+        logger = _logging_.getLogger('test_message')
+        message_logger = MessageLogger(logger)
+        with caplog.at_level(_logging_.INFO, logger='test_message'):
+            for message in [
+                'Initializing Simulation',
+                '   ** Warning ** Zone One is not closed',
+                '   **   ~~~   ** see the eio file',
+                '   **  Fatal  ** Errors occurred on processing input file.',
+            ]:
+                message_logger.log(message)
+            message_logger.flush()
+        assert [
+            (r.levelno, r.getMessage(), r.diagnostic and r.diagnostic.severity)
+            for r in caplog.records
+        ] == [
+            (_logging_.INFO, 'Initializing Simulation', None),
+            (_logging_.WARNING, 'Zone One is not closed\nsee the eio file', 'Warning'),
+            (_logging_.CRITICAL, 'Errors occurred on processing input file.', 'Fatal'),
+        ]
+
+    def test_rate_limited(self, caplog):
+        logger = _logging_.getLogger('test_message_rate')
+        message_logger = MessageLogger(logger, max_rate=2)
+        with caplog.at_level(_logging_.INFO, logger='test_message_rate'):
+            for i in range(5):
+                message_logger.log(f'Message {i}')
+            message_logger.log('   ** Severe  ** Node not found')
+            message_logger.flush()
+        assert [r.getMessage() for r in caplog.records] == [
+            'Message 0',
+            'Message 1',
+            '3 messages dropped (rate limited)',
+            'Node not found',
+        ]
+
+    def test_rate_limited_fractional(self, caplog, monkeypatch):
+        logger = _logging_.getLogger('test_message_rate_fractional')
+        now = 0.
+        monkeypatch.setattr(
+            _mod_, '_time_', _types_.SimpleNamespace(monotonic=lambda: now),
+        )
+        message_logger = MessageLogger(logger, max_rate=.5)
+        with caplog.at_level(_logging_.INFO, logger='test_message_rate_fractional'):
+            # NOTE one message every 2 seconds
+            for i, now in enumerate([0., 1., 2.1, 3.3]):
+                message_logger.log(f'Message {i}')
+            message_logger.flush()
+        assert [r.getMessage() for r in caplog.records] == [
+            'Message 0',
+            '1 messages dropped (rate limited)',
+            'Message 2',
+            '1 messages dropped (rate limited)',
+        ]
@@ -0,0 +1,25 @@
+import pickle as _pickle_
+
+from controllables.energyplus.logging.progress import ProgressDashboard
+
+
+class TestProgressDashboard:
+    def test_stats(self):
+        with ProgressDashboard(interval=.01) as dashboard:
+            a, b = dashboard.reporter('a'), dashboard.reporter('b')
+            for reporter, progress, timesteps in [
+                (a, 0., 0), (b, 0., 0), (a, .5, 100), (b, 1., 50),
+            ]:
+                reporter._progress, reporter._timesteps = progress, timesteps
+                reporter._report(done=progress == 1.)
+        stats = {s.name: s for s in dashboard.stats()}
+        assert stats['a'].progress == .5 and stats['a'].timesteps == 100
+        assert stats['a'].rate > 0 and stats['a'].eta is not None
+        assert stats['b'].done and stats['b'].eta.total_seconds() == 0
+
+    def test_shared(self):
+        with ProgressDashboard(shared=True, interval=.01) as dashboard:
+            reporter = _pickle_.loads(_pickle_.dumps(dashboard.reporter()))
+            reporter._report(done=True)
+        stats, = dashboard.stats()
+        assert stats.done
@@ -0,0 +1,52 @@
+import doctest as _doctest_
+import json as _json_
+
+import controllables.energyplus.models.building as _mod_
+from controllables.energyplus.models.building import BuildingModel
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+_BUFFER = (
+    b'{\n'
+    b'    "Version": {"Version 1": {"version_identifier": "24.1"}},\n'
+    b'    "Schedule:Constant": {\n'
+    b'        "Always \\"On\\" {}": {"hourly_value": 1.0}\n'
+    b'    },\n'
+    b'    "Zone": {"ZONE ONE": {"x_origin": 0}}\n'
+    b'}\n'
+)
+
+
+class TestBuildingModel:
+    def test_lazy(self):
+        building = BuildingModel.from_buffer(_BUFFER)
+        assert list(building.keys()) == ['Version', 'Schedule:Constant', 'Zone']
+        assert building['Schedule:Constant'] == {
+            'Always "On" {}': {'hourly_value': 1.0},
+        }
+        assert dict(building) == _json_.loads(_BUFFER)
+
+    def test_dumps_untouched(self):
+        building = BuildingModel.from_buffer(_BUFFER)
+        building['Zone']['ZONE TWO'] = {}
+        res = building.dumps()
+        assert b'"Schedule:Constant":{\n        "Always' in res
+        assert _json_.loads(res)['Zone'] == {
+            'ZONE ONE': {'x_origin': 0},
+            'ZONE TWO': {},
+        }
+
+    def test_copy(self):
+        building = BuildingModel.from_buffer(_BUFFER)
+        copied = BuildingModel(building, Zone={})
+        assert copied['Zone'] == {}
+        assert building['Zone'] == {'ZONE ONE': {'x_origin': 0}}
+
+    def test_dumpf(self, tmp_path):
+        building = BuildingModel({'Zone': {'ZONE ONE': {}}})
+        path = building.dumpf(tmp_path / 'building.epJSON')
+        assert dict(BuildingModel.from_file(path)) == dict(building)
@@ -0,0 +1,131 @@
+import doctest as _doctest_
+
+import pytest as _pytest_
+
+import controllables.energyplus.models.idf as _mod_
+from controllables.energyplus.models.building import BuildingModel
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+@_pytest_.fixture
+def schema():
+    return _mod_.Schema({'properties': {
+        'Version': {
+            'patternProperties': {'.*': {'properties': {
+                'version_identifier': {'type': 'string'},
+            }}},
+            'legacy_idd': {
+                'field_info': {
+                    'version_identifier': {
+                        'field_name': 'Version Identifier', 'field_type': 'a',
+                    },
+                },
+                'fields': ['version_identifier'],
+            },
+        },
+        'Zone': {
+            'name': {'type': 'string'},
+            'patternProperties': {'.*': {'properties': {
+                'x_origin': {'type': 'number'},
+                'ceiling_height': {'anyOf': [
+                    {'type': 'number'},
+                    {'type': 'string', 'enum': ['', 'Autocalculate']},
+                ]},
+                'part_of_total_floor_area': {
+                    'type': 'string', 'enum': ['No', 'Yes'],
+                },
+            }}},
+            'legacy_idd': {
+                'field_info': {
+                    'name': {'field_name': 'Name', 'field_type': 'a'},
+                    'x_origin': {'field_name': 'X Origin', 'field_type': 'n'},
+                    'ceiling_height': {'field_name': 'Ceiling Height', 'field_type': 'n'},
+                    'part_of_total_floor_area': {
+                        'field_name': 'Part of Total Floor Area', 'field_type': 'a',
+                    },
+                },
+                'fields': ['name', 'x_origin', 'ceiling_height', 'part_of_total_floor_area'],
+            },
+        },
+        'Shading:Site': {
+            'name': {'type': 'string'},
+            'patternProperties': {'.*': {'properties': {
+                'azimuth_angle': {'type': 'number'},
+                'vertices': {'type': 'array', 'items': {'properties': {
+                    'vertex_x_coordinate': {'type': 'number'},
+                    'vertex_y_coordinate': {'type': 'number'},
+                }}},
+            }}},
+            'legacy_idd': {
+                'field_info': {
+                    'name': {'field_name': 'Name', 'field_type': 'a'},
+                    'azimuth_angle': {'field_name': 'Azimuth Angle', 'field_type': 'n'},
+                    'vertex_x_coordinate': {'field_name': 'Vertex X-coordinate', 'field_type': 'n'},
+                    'vertex_y_coordinate': {'field_name': 'Vertex Y-coordinate', 'field_type': 'n'},
+                },
+                'fields': ['name', 'azimuth_angle'],
+                'extensibles': ['vertex_x_coordinate', 'vertex_y_coordinate'],
+                'extension': 'vertices',
+            },
+        },
+    }})
+
+
+_IDF = '''
+! A comment
+  Version,24.1;
+
+ZONE,
+    Zone One,                !- Name
+    0,                       !- X Origin
+    autocalculate,           !- Ceiling Height
+    yes;                     !- Part of Total Floor Area
+
+Shading:Site, Fence, 90.5,
+    0, 1,
+    2, 3;
+'''
+
+
+class TestIDF:
+    def test_tokenize(self):
+        assert list(_mod_.tokenize(['A, b,', ' c; ! x', 'D;'])) == [
+            ['A', 'b', 'c'], ['D'],
+        ]
+        with _pytest_.raises(ValueError):
+            list(_mod_.tokenize(['A, b']))
+
+    def test_read(self, schema):
+        assert _mod_.read(_IDF.splitlines(), schema=schema) == {
+            'Version': {'Version 1': {'version_identifier': '24.1'}},
+            'Zone': {'Zone One': {
+                'x_origin': 0,
+                'ceiling_height': 'Autocalculate',
+                'part_of_total_floor_area': 'Yes',
+            }},
+            'Shading:Site': {'Fence': {
+                'azimuth_angle': 90.5,
+                'vertices': [
+                    {'vertex_x_coordinate': 0, 'vertex_y_coordinate': 1},
+                    {'vertex_x_coordinate': 2, 'vertex_y_coordinate': 3},
+                ],
+            }},
+        }
+
+    def test_roundtrip(self, schema):
+        data = _mod_.read(_IDF.splitlines(), schema=schema)
+        idf = ''.join(_mod_.write(data, schema=schema))
+        assert _mod_.read(idf.splitlines(), schema=schema) == data
+
+    def test_building_model(self, schema, tmp_path, monkeypatch):
+        monkeypatch.setattr(_mod_.Schema, 'default', lambda: schema)
+        path = tmp_path / 'building.idf'
+        path.write_text(_IDF)
+        building = BuildingModel.from_file(path)
+        assert building['Zone']['Zone One']['x_origin'] == 0
+        out = building.dumpf(tmp_path / 'out.idf')
+        assert dict(BuildingModel.from_file(out)) == dict(building)
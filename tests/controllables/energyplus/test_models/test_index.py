@@ -0,0 +1,61 @@
+import doctest as _doctest_
+
+import controllables.energyplus.models.index as _mod_
+from controllables.energyplus.models.building import BuildingModel
+from controllables.energyplus.models.idf import Schema
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+class TestBuildingIndex:
+    def test_invalidation(self):
+        building = BuildingModel({'Zone': {'ZONE ONE': {}}})
+        index = building.index
+        assert index.names('Zone') == [_mod_.ObjectKey('Zone', 'ZONE ONE')]
+
+        building['Zone']['ZONE TWO'] = {}
+        assert len(index.names('Zone')) == 2
+
+        building['People'] = {'OCCUPANTS': {'zone_name': 'zone two'}}
+        assert index.references('ZONE TWO') == [_mod_.Reference(
+            source=_mod_.ObjectKey('People', 'OCCUPANTS'),
+            field='zone_name',
+            name='zone two',
+        )]
+
+        del building['People']
+        assert index.references('ZONE TWO') == []
+
+    def test_rename(self):
+        building = BuildingModel({'Zone': {'A': {}}})
+        index = building.index
+        assert index.names('Zone') == [_mod_.ObjectKey('Zone', 'A')]
+        assert index.types('A') == [_mod_.ObjectKey('Zone', 'A')]
+
+        # NOTE renamed in place, i.e. the same section of the same length
+        building['Zone'].pop('A')
+        building['Zone']['B'] = {}
+        assert index.names('Zone') == [_mod_.ObjectKey('Zone', 'B')]
+        assert index.types('A') == []
+        assert index.types('B') == [_mod_.ObjectKey('Zone', 'B')]
+        assert index.get(_mod_.ObjectKey('Zone', 'B')) == {}
+
+    def test_schema(self):
+        schema = Schema({'properties': {
+            'People': {
+                'name': {'type': 'string'},
+                'patternProperties': {'.*': {'properties': {
+                    'zone_name': {'type': 'string', 'data_type': 'object_list'},
+                    'notes': {'type': 'string'},
+                }}},
+            },
+        }})
+        building = BuildingModel({
+            'Zone': {'ZONE ONE': {}},
+            'People': {'OCCUPANTS': {'zone_name': 'ZONE ONE', 'notes': 'ZONE ONE'}},
+        })
+        index = _mod_.BuildingIndex(building, schema=schema)
+        assert [r.field for r in index.references('ZONE ONE')] == ['zone_name']
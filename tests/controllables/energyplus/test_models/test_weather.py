@@ -0,0 +1,134 @@
+import datetime as _datetime_
+
+import numpy as _numpy_
+import pytest as _pytest_
+
+from controllables.energyplus.models.weather import (
+    WeatherModel,
+    WeatherOffset,
+    WeatherScale,
+    WeatherNoise,
+    WeatherYearShuffle,
+)
+
+
+_HEADERS = [
+    'LOCATION,Somewhere,ST,USA,TMY3,724695,39.72,-104.75,-7.0,1724.0',
+    'DESIGN CONDITIONS,0',
+    'TYPICAL/EXTREME PERIODS,0',
+    'GROUND TEMPERATURES,0',
+    'HOLIDAYS/DAYLIGHT SAVINGS,No,0,0,0',
+    'COMMENTS 1,',
+    'COMMENTS 2,',
+    'DATA PERIODS,1,1,Data,Sunday, 1/ 1,12/31',
+]
+
+
+def _record(time: _datetime_.datetime, dry_bulb: float):
+    return ','.join([
+        str(time.year), str(time.month), str(time.day),
+        str(time.hour + 1), '60', 'A7A7A7*0?9?9?9?9?9?9?9A7A7A7A7A7A7*0E8*0*0',
+        f'{dry_bulb:.1f}', '-12.0', '80', '83100',
+        *['0'] * 10,
+        '240', '2.1', '8', '2', '16.1', '77777', '9', '999999999',
+        '5', '0.08', '0', '88', '0.2', '0', '0',
+    ])
+
+
+@_pytest_.fixture
+def epw_path(tmp_path):
+    start = _datetime_.datetime(1995, 1, 1)
+    records = [
+        _record(start + _datetime_.timedelta(hours=i), dry_bulb=i % 400 / 10)
+        for i in range(365 * 24)
+    ]
+    path = tmp_path / 'weather.epw'
+    path.write_text('\n'.join(_HEADERS + records) + '\n')
+    return path
+
+
+class TestWeatherModel:
+    def test_parse(self, epw_path):
+        weather = WeatherModel(epw_path)
+        assert len(weather) == 365 * 24
+        assert weather.records_per_hour == 1
+        assert weather.headers['LOCATION'][0] == 'Somewhere'
+        assert weather['dry_bulb_temperature'][10] == _pytest_.approx(1.)
+        assert weather['present_weather_codes'][0] == '999999999'
+
+    def test_cache(self, epw_path):
+        data = WeatherModel(epw_path)._load()
+        cached = WeatherModel(epw_path).data
+        assert isinstance(cached, _numpy_.memmap)
+        assert (data == cached).all()
+        assert any(
+            p.name.startswith('.weather.epw')
+            for p in epw_path.parent.iterdir()
+        )
+
+    def test_window(self, epw_path):
+        weather = WeatherModel(epw_path)
+        # end of the 1st hour of Jan 2 (of any year)
+        time = _datetime_.datetime(2024, 1, 2, 1, tzinfo=_datetime_.timezone.utc)
+        assert weather.index(time) == 24
+        window = weather.window(time, hours=24., fields='dry_bulb_temperature')
+        assert len(window) == 24
+        assert window[0] == _pytest_.approx(2.5)
+
+    def test_window_wrap(self, epw_path):
+        weather = WeatherModel(epw_path)
+        time = _datetime_.datetime(2023, 12, 31, 23)
+        window = weather.window(time, hours=2.)
+        assert list(window['month']) == [12, 1]
+
+
+class TestWeatherTransform:
+    def test_transform(self, epw_path):
+        weather = WeatherModel(epw_path)
+        transformed = weather.transform(
+            WeatherOffset('dry_bulb_temperature', 1.),
+            WeatherScale('wind_speed', 2.),
+            WeatherNoise('relative_humidity', std=5., clip=(0., 100.)),
+            seed=0,
+        )
+        assert not transformed.backed
+        assert (
+            transformed['dry_bulb_temperature'] 
+            == _pytest_.approx(weather['dry_bulb_temperature'] + 1.)
+        )
+        assert (
+            transformed['wind_speed'] 
+            == _pytest_.approx(weather['wind_speed'] * 2.)
+        )
+        assert (transformed['relative_humidity'] <= 100.).all()
+        assert (
+            transformed['relative_humidity']
+            == weather.transform(
+                WeatherNoise('relative_humidity', std=5., clip=(0., 100.)),
+                seed=0,
+            )['relative_humidity']
+        ).all()
+
+    def test_year_shuffle(self, epw_path):
+        weather = WeatherModel(epw_path)
+        other = weather.transform(WeatherOffset('dry_bulb_temperature', 1000.))
+        shuffled = weather.transform(WeatherYearShuffle([other]), seed=1)
+        for month in range(1, 13):
+            mask = weather['month'] == month
+            diff = set(_numpy_.round(
+                shuffled['dry_bulb_temperature'][mask] 
+                - weather['dry_bulb_temperature'][mask]
+            ))
+            assert diff in ({0.}, {1000.})
+
+    def test_dumpf(self, epw_path, tmp_path):
+        transformed = WeatherModel(epw_path).transform(
+            WeatherOffset('dry_bulb_temperature', .5),
+        )
+        reloaded = WeatherModel(transformed.dumpf(tmp_path / 'out.epw'))
+        assert reloaded.headers == transformed.headers
+        assert (
+            reloaded['dry_bulb_temperature'] 
+            == _pytest_.approx(transformed['dry_bulb_temperature'])
+        )
+        assert (reloaded['month'] == transformed['month']).all()
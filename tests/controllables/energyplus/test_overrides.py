@@ -0,0 +1,114 @@
+import datetime as _datetime_
+
+import numpy as _numpy_
+import pytest as _pytest_
+
+from controllables.energyplus.models.weather import WeatherModel
+from controllables.energyplus.overrides import WeatherOverride
+
+
+_HEADERS = [
+    'LOCATION,Somewhere,ST,USA,TMY3,724695,39.72,-104.75,-7.0,1724.0',
+    'DESIGN CONDITIONS,0',
+    'TYPICAL/EXTREME PERIODS,0',
+    'GROUND TEMPERATURES,0',
+    'HOLIDAYS/DAYLIGHT SAVINGS,No,0,0,0',
+    'COMMENTS 1,',
+    'COMMENTS 2,',
+    'DATA PERIODS,1,1,Data,Sunday, 1/ 1,12/31',
+]
+
+
+def _record(time: _datetime_.datetime, dry_bulb: float, wind_speed: float):
+    return ','.join([
+        str(time.year), str(time.month), str(time.day),
+        str(time.hour + 1), '60', 'A7A7A7*0?9?9?9?9?9?9?9A7A7A7A7A7A7*0E8*0*0',
+        f'{dry_bulb:.1f}', '-12.0', '80', '83100',
+        *['0'] * 10,
+        '240', f'{wind_speed:.1f}', '8', '2', '16.1', '77777', '9', '999999999',
+        '5', '0.08', '0', '88', '0.2', '0', '0',
+    ])
+
+
+@_pytest_.fixture
+def weather(tmp_path):
+    start = _datetime_.datetime(1995, 1, 1)
+    records = [
+        _record(
+            start + _datetime_.timedelta(hours=i),
+            # NOTE every 3rd dry bulb temperature is missing
+            dry_bulb=99.9 if i % 3 == 2 else i / 10,
+            wind_speed=i % 10,
+        )
+        for i in range(2 * 24)
+    ]
+    path = tmp_path / 'weather.epw'
+    path.write_text('\n'.join(_HEADERS + records) + '\n')
+    return WeatherModel(path)
+
+
+class TestWeatherOverride:
+    @_pytest_.fixture(autouse=True)
+    def make_system(self, weather, fake_system):
+        self.system = fake_system()
+        self.kernel = self.system._kernel
+        self.override = WeatherOverride(
+            weather,
+            control_types=['Outdoor Dry Bulb', 'Wind Speed'],
+        )
+        self.kernel.api.exchange.actuators.update({
+            ('Weather Data', control_type, 'Environment'): 0.
+            for control_type in self.override.control_types
+        })
+        self.system.add(self.override)
+        with self.kernel.running():
+            self.kernel.fire('after_component_get_input')
+            yield
+
+    def step(self, time: _datetime_.datetime):
+        exchange = self.kernel.api.exchange
+        exchange.time = time
+        exchange.writes.clear()
+        self.kernel.fire('begin_zone_timestep_before_set_current_weather')
+        handles = {
+            control_type: exchange.handles[('Weather Data', control_type, 'Environment')]
+            for control_type in self.override.control_types
+        }
+        writes = dict(exchange.writes)
+        return {
+            control_type: writes[handle]
+            for control_type, handle in handles.items()
+        }
+
+    def test_table(self):
+        table = self.override._table
+        assert table.shape == (2 * 24, 2)
+        assert table[0].tolist() == [0., 0.]
+        assert _numpy_.isnan(table[2, 0])
+        assert table[2, 1] == 2.
+
+    def test_index(self):
+        # NOTE the clock reports the end of the timestep;
+        # records cover the hour ending at their time
+        assert self.step(_datetime_.datetime(2017, 1, 1, 0, 15)) \
+            == {'Outdoor Dry Bulb': 0., 'Wind Speed': 0.}
+        assert self.step(_datetime_.datetime(2017, 1, 1, 1)) \
+            == {'Outdoor Dry Bulb': 0., 'Wind Speed': 0.}
+        assert self.step(_datetime_.datetime(2017, 1, 2, 1, 30)) \
+            == {'Outdoor Dry Bulb': _pytest_.approx(2.5), 'Wind Speed': 5.}
+
+    def test_missing(self):
+        # NOTE missing values release the actuators
+        assert self.step(_datetime_.datetime(2017, 1, 1, 3)) \
+            == {'Outdoor Dry Bulb': None, 'Wind Speed': 2.}
+
+    def test_detach(self):
+        exchange = self.kernel.api.exchange
+        exchange.writes.clear()
+        self.system.remove(self.override)
+        assert sorted(exchange.writes) == [
+            (handle, None) for handle in sorted(exchange.handles.values())
+        ]
+        exchange.writes.clear()
+        self.kernel.fire('begin_zone_timestep_before_set_current_weather')
+        assert exchange.writes == []
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import controllables.energyplus.preflight as _mod_
+from controllables.energyplus.diagnostics import Diagnostic
+from controllables.energyplus.models import BuildingModel
+from controllables.energyplus.preflight import (
+    Preflight,
+    PreflightError,
+    PreflightResult,
+)
+
+import pytest
+
+
+class TestPreflightResult:
+    def test_errors(self):
+        result = PreflightResult(hash='0', status=1, diagnostics=(
+            Diagnostic('Warning', 'Zone One is not closed'),
+            Diagnostic('Fatal', 'Errors occurred on processing input file.'),
+        ))
+        assert not result.ok
+        assert result.errors == [result.diagnostics[1]]
+        with pytest.raises(PreflightError):
+            result.raise_for_errors()
+        assert PreflightResult.loads('0', result.dumps()) == result
+
+
+class TestPreflight:
+    def test_cached(self, tmp_path):
+        building = BuildingModel({'Zone': {'ZONE ONE': {}}})
+        preflight = Preflight(cache_dir=tmp_path)
+        hash = preflight.hash(building)
+        assert hash != Preflight(mode='input', cache_dir=tmp_path).hash(building)
+
+        (tmp_path / f'{hash}.json').write_text(
+            PreflightResult(hash=hash, status=0).dumps()
+        )
+        results = preflight.run([building, BuildingModel(building)])
+        assert [r.hash for r in results] == [hash, hash]
+        assert all(r.ok for r in results)
+
+    def test_failures_reported(self, tmp_path, monkeypatch):
+        ok, broken = (
+            BuildingModel({'Zone': {f'ZONE {name}': {}}})
+            for name in ('ONE', 'TWO')
+        )
+        preflight = Preflight(cache_dir=tmp_path)
+        checked = []
+
+        def run_preflight(task):
+            checked.append(task.hash)
+            if task.hash == preflight.hash(broken):
+                raise BrokenProcessPool('A worker process terminated abruptly')
+            return PreflightResult(hash=task.hash, status=0)
+
+        # NOTE workers in threads, so that the patches apply
+        monkeypatch.setattr(_mod_, '_run_preflight', run_preflight)
+        monkeypatch.setattr(
+            _mod_._concurrent_futures_, 'ProcessPoolExecutor',
+            lambda max_workers, mp_context: ThreadPoolExecutor(max_workers),
+        )
+
+        result_ok, result_broken = preflight.run([ok, broken])
+        assert result_ok.ok and result_ok.definite
+        assert not result_broken.ok and not result_broken.definite
+        assert 'BrokenProcessPool' in result_broken.error
+        with pytest.raises(PreflightError, match='BrokenProcessPool'):
+            result_broken.raise_for_errors()
+
+        # NOTE only definite results are cached
+        assert [p.name for p in tmp_path.iterdir()] \
+            == [f'{preflight.hash(ok)}.json']
+        checked.clear()
+        preflight.run([ok, broken])
+        assert checked == [preflight.hash(broken)]
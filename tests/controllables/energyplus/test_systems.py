@@ -1,7 +1,18 @@
+import datetime as _datetime_
+
 import pytest as _pytest_
 
 from controllables.energyplus import examples
-from controllables.energyplus.systems import System
+from controllables.energyplus.models import BuildingModel
+from controllables.energyplus.systems import (
+    System, 
+    _REPORT_FILE_FIELDS,
+    _WindowRecorder,
+    _lean_building,
+    _run_subsystem,
+    _split_run_period_windows,
+    _split_run_periods,
+)
 
 
 class TestSystem:
@@ -20,6 +31,13 @@ class TestSystem:
         with _pytest_.raises(RuntimeError):
             self.system.stop()
 
+    def test_run(self):
+        self.system.run()
+        assert not self.system.started
+        assert self.system.status == 0
+        with _pytest_.raises(RuntimeError):
+            self.system.stop()
+
     @_pytest_.mark.asyncio
     async def test_awaitable(self):
         return
@@ -31,6 +49,308 @@ class TestSystem:
             await self.system.awaitable.stop()
     
 
+
+class TestRun:
+    @_pytest_.fixture(autouse=True)
+    def setup(self, fake_system):
+        self.fake_system = fake_system
+
+    def make_system(self, on_run) -> System:
+        system = self.fake_system(
+            building=BuildingModel({'Zone': {'ZONE ONE': dict()}}),
+        )
+        system._kernel.on_run = on_run
+        return system
+
+    def test_run(self):
+        started = []
+        system = self.make_system(lambda kernel: started.append(system.started) or 0)
+        assert system.run() is system
+        assert started == [True]
+        assert not system.started
+        assert system.status == 0
+
+    def test_stop(self):
+        # NOTE stopped from within the run, i.e. the calling thread
+        system = self.make_system(lambda kernel: system.stop() and 0)
+        system.run()
+        assert system._kernel.stopped
+        with _pytest_.raises(RuntimeError):
+            system.stop()
+
+    def test_failure(self):
+        system = self.make_system(lambda kernel: 1)
+        with _pytest_.raises(RuntimeError):
+            system.run()
+        assert system.status == 1
+        assert not system.started
+
+
+def _run_period(begin: tuple[int, int], end: tuple[int, int], **fields):
+    (begin_month, begin_day), (end_month, end_day) = begin, end
+    return dict(
+        begin_month=begin_month, begin_day_of_month=begin_day,
+        end_month=end_month, end_day_of_month=end_day,
+        **fields,
+    )
+
+
+class TestLean:
+    def make_building(self):
+        return BuildingModel({
+            'Zone': {'ZONE ONE': dict()},
+            'Output:Variable': {
+                'Output:Variable 1': dict(
+                    key_value='*', 
+                    variable_name='Zone Mean Air Temperature',
+                ),
+            },
+            'Output:Meter': {
+                'Output:Meter 1': dict(key_name='Electricity:Facility'),
+            },
+            'Output:Table:SummaryReports': {
+                'Output:Table:SummaryReports 1': dict(),
+            },
+            'Output:SQLite': {'Output:SQLite 1': dict(option_type='Simple')},
+            'OutputControl:Files': {
+                'OutputControl:Files 1': dict(output_csv='Yes', output_eso='Yes'),
+            },
+        })
+
+    def test_lean_building(self):
+        building = self.make_building()
+        lean = _lean_building(building)
+        assert set(lean.keys()) == {'Zone', 'OutputControl:Files'}
+        assert lean['Zone'] == building['Zone']
+        assert lean['OutputControl:Files'] == {
+            'OutputControl:Files 1': {
+                field: 'No' for field in _REPORT_FILE_FIELDS
+            },
+        }
+        # NOTE the input model is not mutated
+        assert building == self.make_building()
+
+    def test_lean_building_default_files(self):
+        lean = _lean_building(BuildingModel({'Zone': {'ZONE ONE': dict()}}))
+        (files, ), = [lean['OutputControl:Files'].values()]
+        assert set(files.values()) == {'No'}
+
+
+class TestSplit:
+    def test_split_run_periods(self):
+        building = BuildingModel({
+            'RunPeriod': {
+                'winter': _run_period((1, 1), (3, 31)),
+                'summer': _run_period((6, 1), (8, 31)),
+            },
+        })
+        buildings = _split_run_periods(building)
+        assert [list(b['RunPeriod']) for b in buildings] == [['winter'], ['summer']]
+        for b in buildings:
+            # NOTE sizing periods run by default without `SimulationControl`
+            assert [
+                o['run_simulation_for_sizing_periods'] 
+                for o in b['SimulationControl'].values()
+            ] == ['No']
+        assert 'SimulationControl' not in building
+
+        building['SimulationControl'] = {
+            'SimulationControl 1': dict(do_zone_sizing_calculation='Yes'),
+        }
+        for b in _split_run_periods(building):
+            assert b['SimulationControl'] == {
+                'SimulationControl 1': dict(
+                    do_zone_sizing_calculation='Yes',
+                    run_simulation_for_sizing_periods='No',
+                ),
+            }
+
+    def test_failure(self):
+        system = System(
+            building=BuildingModel({
+                'RunPeriod': {'winter': _run_period((1, 1), (1, 31))},
+            }),
+            split='run_period',
+            records=['unknown'],
+        )
+        # NOTE sub-simulations fail on unknown references
+        with _pytest_.raises(TypeError):
+            system.start().wait()
+        with _pytest_.raises(TypeError):
+            system.records
+
+
+    def test_design_day_records(self, monkeypatch, fake_kernel):
+        system = System(
+            building=BuildingModel({
+                'SizingPeriod:DesignDay': {
+                    'winter': dict(month=1, day_of_month=21),
+                },
+            }),
+            split='design_day',
+        )
+        task, = system._split_tasks()[0]
+
+        def on_run(kernel):
+            exchange = kernel.api.exchange
+            # NOTE design day environments only
+            exchange.kind = 1
+            kernel.fire('begin_new_environment')
+            for hour in range(1, 4):
+                exchange.time = _datetime_.datetime(2017, 1, 21, hour)
+                kernel.fire('begin_zone_timestep_after_init_heat_balance')
+            return 0
+
+        # NOTE run the sub-simulation in this process
+        kernel = fake_kernel(on_run)
+        monkeypatch.setattr(System, '_kernel', property(lambda self: kernel))
+        res = _run_subsystem(task)
+        assert [time.hour for time in res['time']] == [1, 2, 3]
+
+    def test_events(self):
+        system = System(
+            building=BuildingModel({
+                'RunPeriod': {'winter': _run_period((1, 1), (1, 31))},
+            }),
+            split='run_period',
+        )
+        calls = []
+        system.events['begin'].on(lambda ctx: calls.append('begin'))
+        system.events['end'].on(lambda ctx: calls.append('end'))
+
+        System._SplitThread(dispatch=system._dispatch, tasks=[]).run()
+        assert calls == ['begin', 'end']
+        # NOTE no kernel in the parent process
+        assert '_kernel' not in system.__dict__
+
+
+class TestChunks:
+    def windows(self, period: dict, chunks: int, overlap: int):
+        return [
+            (
+                (window['begin_month'], window['begin_day_of_month']),
+                (window['end_month'], window['end_day_of_month']),
+                skip_days,
+            )
+            for building, skip_days in _split_run_period_windows(
+                BuildingModel({'RunPeriod': {'year': period}}),
+                chunks=chunks, overlap=overlap,
+            )
+            for window in building['RunPeriod'].values()
+        ]
+
+    def test_windows(self):
+        assert self.windows(
+            _run_period((1, 1), (12, 31)), chunks=4, overlap=7,
+        ) == [
+            ((1, 1), (4, 1), 0),
+            ((3, 26), (7, 1), 7),
+            ((6, 25), (9, 30), 7),
+            ((9, 24), (12, 31), 7),
+        ]
+        # NOTE overlaps are bounded by the beginning of the run period
+        assert self.windows(
+            _run_period((1, 1), (1, 4)), chunks=2, overlap=7,
+        ) == [
+            ((1, 1), (1, 2), 0),
+            ((1, 1), (1, 4), 2),
+        ]
+
+    def test_windows_wrap(self):
+        # NOTE runs across the end of the year; 
+        # `end_year` may be present but `None`
+        assert self.windows(
+            _run_period((12, 1), (1, 30), begin_year=None, end_year=None), 
+            chunks=2, overlap=1,
+        ) == [
+            ((12, 1), (12, 30), 0),
+            ((12, 30), (1, 30), 1),
+        ]
+
+    def test_windows_weekday(self):
+        buildings = _split_run_period_windows(
+            BuildingModel({'RunPeriod': {'year': _run_period(
+                (1, 1), (1, 14), day_of_week_for_start_day='Sunday',
+            )}}),
+            chunks=2, overlap=0,
+        )
+        assert [
+            window['day_of_week_for_start_day']
+            for building, _ in buildings
+            for window in building['RunPeriod'].values()
+        ] == ['Sunday', 'Sunday']
+
+    def test_tasks(self, fake_kernel):
+        system = System(
+            building=BuildingModel({
+                'RunPeriod': {'year': _run_period((1, 1), (12, 31))},
+            }),
+            chunks=4,
+            max_workers=2,
+        )
+        tasks, ordered = system._split_tasks()
+        assert len(tasks) == 4 and not ordered
+        for task in tasks:
+            # NOTE sub-simulations must never be split (or chunked) again
+            subsystem = System(task.config)
+            subsystem._kernel = fake_kernel()
+            assert isinstance(subsystem._thread, System._CoreThread)
+
+
+class TestWindowRecorder:
+    @staticmethod
+    def clock(begin: _datetime_.datetime, timestep: _datetime_.timedelta, days: int):
+        r"""A fake clock reporting the end of each timestep."""
+
+        for i in range(1, int(_datetime_.timedelta(days=days) / timestep) + 1):
+            yield begin + i * timestep
+
+    def test_skip(self):
+        begin = _datetime_.datetime(2017, 1, 1, tzinfo=_datetime_.timezone.utc)
+        timestep = _datetime_.timedelta(hours=1)
+        recorder = _WindowRecorder(skip_days=1)
+        for i, time in enumerate(self.clock(begin, timestep, days=3)):
+            recorder.record(time, timestep, [i])
+        # NOTE the timestep ending at 24:00 belongs to the previous day
+        assert recorder.time[0] == begin + _datetime_.timedelta(days=1, hours=1)
+        assert recorder.time[-1] == begin + _datetime_.timedelta(days=3)
+        assert len(recorder.time) == 2 * 24
+        assert recorder.values[0] == [24]
+
+    def test_stitch(self):
+        begin = _datetime_.datetime(2017, 1, 1, tzinfo=_datetime_.timezone.utc)
+        timestep = _datetime_.timedelta(minutes=15)
+        # NOTE windows of days 0-1 and days 2-3 (with an overlap of 2 days)
+        first, second = _WindowRecorder(skip_days=0), _WindowRecorder(skip_days=2)
+        for time in self.clock(begin, timestep, days=2):
+            first.record(time, timestep, [])
+        for time in self.clock(begin, timestep, days=4):
+            second.record(time, timestep, [])
+        times = first.time + second.time
+        assert times == list(self.clock(begin, timestep, days=4))
+
+    def test_environments(self):
+        timestep = _datetime_.timedelta(hours=1)
+        recorder = _WindowRecorder(skip_days=1)
+        # NOTE the start date is relative to the first timestep
+        # of each environment, regardless of the year of the clock
+        for begin in (
+            _datetime_.datetime(2017, 7, 21),
+            _datetime_.datetime(2023, 1, 1),
+        ):
+            recorder.begin_environment()
+            for time in self.clock(begin, timestep, days=2):
+                recorder.record(time, timestep, [])
+        assert recorder.time == [
+            *self.clock(_datetime_.datetime(2017, 7, 22), timestep, days=1),
+            *self.clock(_datetime_.datetime(2023, 1, 2), timestep, days=1),
+        ]
+
+
 __all__ = [
     'TestSystem',
+    'TestLean',
+    'TestSplit',
+    'TestChunks',
+    'TestWindowRecorder',
 ]
\ No newline at end of file
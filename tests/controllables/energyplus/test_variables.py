@@ -1,3 +1,7 @@
+import warnings as _warnings_
+
+import pytest as _pytest_
+
 from controllables.core import TemporaryUnavailableError
 from controllables.energyplus import examples
 from controllables.energyplus.systems import System
@@ -92,3 +96,94 @@ class TestOutputVariable:
                 key='ENVIRONMENT',
             ),
         )
+
+
+class TestVariableManager:
+    @_pytest_.fixture(autouse=True)
+    def make_system(self, fake_system):
+        self.system = fake_system()
+        self.system._kernel.on_run = self.on_run
+        self.exchange = self.system._kernel.api.exchange
+        self.exchange.actuators.update({
+            ('Weather Data', 'Outdoor Dry Bulb', 'Environment'): 25.,
+        })
+        self.known = _mod_.Actuator.Ref(
+            type='Weather Data',
+            control_type='Outdoor Dry Bulb',
+            key='Environment',
+        )
+        self.unknown = _mod_.Actuator.Ref(
+            type='Schedule:Compact',
+            control_type='Schedule Value',
+            key='MISSING',
+        )
+        self.late = _mod_.Actuator.Ref(
+            type='Schedule:Constant',
+            control_type='Schedule Value',
+            key='LATE',
+        )
+
+    def on_run(self, kernel) -> int:
+        kernel.fire('after_component_get_input')
+        # NOTE some components register their variables 
+        # only after the input is read
+        self.exchange.actuators[
+            ('Schedule:Constant', 'Schedule Value', 'LATE')
+        ] = 1.
+        kernel.fire('after_new_environment_warmup_complete')
+        return 0
+
+    def test_lazy(self):
+        system = System()
+        system.variables['time']
+        # NOTE neither the kernel nor the events are needed until then
+        assert '_kernel' not in system.__dict__
+        assert 'events' not in system.__dict__
+
+    def test_resolve_late(self):
+        late = self.system[self.late]
+        with _warnings_.catch_warnings():
+            _warnings_.simplefilter('error', RuntimeWarning)
+            self.system._kernel.run()
+        key = ('Schedule:Constant', 'Schedule Value', 'LATE')
+        assert self.exchange.lookups[key] == 1
+        assert late.value == 1.
+
+    def test_resolve_once(self):
+        known = self.system[self.known]
+        self.system._kernel.run()
+        key = ('Weather Data', 'Outdoor Dry Bulb', 'Environment')
+        assert self.exchange.lookups == {key: 1}
+        # NOTE resolved handles are reused upon access
+        for _ in range(3):
+            assert known.value == 25.
+        assert self.exchange.lookups == {key: 1}
+
+    def test_warn_once(self):
+        self.system[self.known]
+        unknown = self.system[self.unknown]
+        key = ('Schedule:Compact', 'Schedule Value', 'MISSING')
+
+        with _warnings_.catch_warnings(record=True) as records:
+            _warnings_.simplefilter('always')
+            for _ in range(2):
+                self.system._kernel.run()
+        assert [
+            str(record.message).count('MISSING') for record in records
+            if issubclass(record.category, RuntimeWarning)
+        ] == [1]
+        # NOTE handles are resolved again after each reset
+        assert self.exchange.lookups[key] == 2
+
+        # NOTE unresolved handles are retried upon access
+        with _pytest_.raises(TemporaryUnavailableError):
+            unknown.value
+        assert self.exchange.lookups[key] == 3
+
+    def test_registrations(self):
+        self.system[self.known]
+        for _ in range(2):
+            registrations = self.system._kernel.api.runtime.registrations
+            registrations.clear()
+            self.system._kernel.run()
+            assert registrations['after_new_environment_warmup_complete'] == 1
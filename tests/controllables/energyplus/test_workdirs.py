@@ -0,0 +1,76 @@
+import doctest as _doctest_
+import os as _os_
+
+import controllables.energyplus._workdirs as _mod_
+from controllables.energyplus._workdirs import WorkingDirectoryPool
+
+
+class TestDocs:
+    def test_doctests(self):
+        _doctest_.testmod(_mod_, raise_on_error=True, verbose=True)
+
+
+class TestWorkingDirectoryPool:
+    def test_reuse(self, tmp_path):
+        pool = WorkingDirectoryPool(root=str(tmp_path))
+        with pool.use() as a:
+            assert _os_.path.dirname(a) == str(tmp_path)
+            with pool.use() as b:
+                assert a != b
+        with pool.use() as c:
+            assert c in (a, b)
+        assert sorted(_os_.listdir(tmp_path)) == sorted(
+            _os_.path.basename(path) for path in (a, b)
+        )
+
+    def test_release_empties(self, tmp_path):
+        pool = WorkingDirectoryPool(root=str(tmp_path))
+        with pool.use() as a:
+            with open(_os_.path.join(a, 'in.epJSON'), 'w') as f:
+                f.write('{}')
+            _os_.makedirs(_os_.path.join(a, 'reports', 'nested'))
+        assert _os_.listdir(a) == []
+        with pool.use() as b:
+            assert b == a
+            assert _os_.listdir(b) == []
+
+    def test_max_free(self, tmp_path):
+        pool = WorkingDirectoryPool(root=str(tmp_path), max_free=2)
+        paths = [pool.acquire() for _ in range(4)]
+        for path in paths:
+            pool.release(path)
+        # NOTE directories beyond the bound are removed on release
+        assert [_os_.path.isdir(path) for path in paths] \
+            == [True, True, False, False]
+        assert len(_os_.listdir(tmp_path)) == 2
+        assert {pool.acquire(), pool.acquire()} == set(paths[:2])
+
+    def test_release_unknown(self, tmp_path):
+        pool = WorkingDirectoryPool(root=str(tmp_path))
+        path = _os_.path.join(tmp_path, 'other')
+        _os_.mkdir(path)
+        with open(_os_.path.join(path, 'keep'), 'w'):
+            pass
+        # NOTE directories not of the pool are left alone
+        pool.release(path)
+        assert _os_.listdir(path) == ['keep']
+
+    def test_removed_while_free(self, tmp_path):
+        pool = WorkingDirectoryPool(root=str(tmp_path))
+        with pool.use() as a:
+            pass
+        _os_.rmdir(a)
+        with pool.use() as b:
+            assert b != a
+            assert _os_.path.isdir(b)
+
+    def test_clear(self, tmp_path):
+        pool = WorkingDirectoryPool(root=str(tmp_path))
+        a = pool.acquire()
+        with pool.use():
+            pass
+        pool.clear()
+        assert _os_.listdir(tmp_path) == []
+        # NOTE released after clearing
+        pool.release(a)
+        assert not _os_.path.exists(a)